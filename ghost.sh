@@ -10,7 +10,7 @@ if [ ! -d "venv" ]; then
     echo "Setting up virtual environment..."
     python3 -m venv venv
     source venv/bin/activate
-    pip install pygame python-xlib
+    pip install pygame numpy python-xlib
 else
     source venv/bin/activate
 fi
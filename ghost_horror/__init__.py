@@ -1,2 +1,4 @@
 # Ghost Horror Mode
 # A spooky fullscreen X11 experience for launching Ekphos
+
+__version__ = "1.0.0"
@@ -0,0 +1,114 @@
+"""
+Asset Registry for Ghost Horror Mode
+Named, reference-counted surfaces kept in the display's pixel format,
+so effects always blit through SDL's fast same-format path
+"""
+
+import weakref
+from typing import Callable, Dict, Optional
+
+import pygame
+
+
+class Asset:
+    """
+    A named surface built by a callable and converted to the display format
+    Rebuilt on the next access after the display format changes
+    """
+    
+    def __init__(self, registry: 'AssetRegistry', name: str, build: Callable[[], pygame.Surface],
+                 alpha: bool = True):
+        self.registry = registry
+        self.name = name
+        self.build = build
+        self.alpha = alpha  # Keep per-pixel alpha (convert_alpha) or not (convert)
+        self.refs = 0
+        self._surface: Optional[pygame.Surface] = None
+        self._generation = -1
+        self._offscreen = False  # Built while rendering off-screen, so not converted yet
+    
+    @property
+    def surface(self) -> pygame.Surface:
+        """The display-format surface, (re)built if missing or stale"""
+        registry = self.registry
+        if self._generation != registry.generation:
+            self._surface = registry.convert(self.build(), self.alpha)
+            self._generation = registry.generation
+            self._offscreen = registry.offscreen
+        elif self._offscreen and not registry.offscreen:
+            self._surface = registry.convert(self._surface, self.alpha)
+            self._offscreen = False
+        return self._surface
+    
+    def drop(self):
+        """Free the surface; it is rebuilt if accessed again"""
+        self._surface = None
+        self._generation = -1
+
+
+class AssetRegistry:
+    """
+    Shared surfaces by name with reference counts
+    The generation counter changes whenever the display format does;
+    every asset (and anything derived from one) compares against it
+    """
+    
+    def __init__(self):
+        self.assets: Dict[str, Asset] = {}
+        self.generation = 0
+        self.offscreen = False  # Rendering off-screen: leave pygame.display alone
+        self._format = None
+    
+    def convert(self, surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """
+        Convert a surface to the display format if a display is open
+        While rendering off-screen (e.g. the intro cache, with the window
+        hidden) surfaces are left as they are: asking SDL for the window
+        surface then can replace the one the display draws to
+        """
+        if self._format is None or self.offscreen:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+    
+    def acquire(self, name: str, build: Callable[[], pygame.Surface], alpha: bool = True) -> Asset:
+        """Get the named asset, registering it with build on first use, and add a reference"""
+        asset = self.assets.get(name)
+        if asset is None:
+            asset = Asset(self, name, build, alpha)
+            self.assets[name] = asset
+        asset.refs += 1
+        return asset
+    
+    def release(self, asset: Asset):
+        """Drop a reference; the asset is freed when none are left"""
+        asset.refs -= 1
+        if asset.refs <= 0 and self.assets.get(asset.name) is asset:
+            del self.assets[asset.name]
+            asset.drop()
+    
+    def hold(self, owner, name: str, build: Callable[[], pygame.Surface], alpha: bool = True) -> Asset:
+        """acquire() on behalf of owner, released automatically when owner is garbage collected"""
+        asset = self.acquire(name, build, alpha)
+        weakref.finalize(owner, self.release, asset)
+        return asset
+    
+    def display_changed(self):
+        """Call after set_mode(): invalidates every asset if the pixel format changed"""
+        surface = pygame.display.get_surface()
+        pixel_format = None if surface is None else (surface.get_bitsize(), surface.get_masks())
+        if pixel_format != self._format:
+            self._format = pixel_format
+            self.generation += 1
+    
+    def stats(self) -> dict:
+        """Number of registered assets and bytes held by built surfaces"""
+        built = [asset._surface for asset in self.assets.values() if asset._surface is not None]
+        return {
+            'assets': len(self.assets),
+            'built': len(built),
+            'bytes': sum(surface.get_bytesize() * surface.get_width() * surface.get_height() for surface in built),
+        }
+
+
+# Shared registry used by every effect
+assets = AssetRegistry()
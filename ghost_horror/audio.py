@@ -0,0 +1,203 @@
+"""
+Audio Engine for Ghost Horror Mode
+Small low-latency mixer over pygame.mixer, playing procedurally
+synthesized sounds and decode-once sound files
+"""
+
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from . import synth
+from .timeline import Timeline, Track
+
+
+DEFAULT_FREQUENCY = 44100
+DEFAULT_BUFFER = 512  # Samples per SDL callback: ~12 ms at 44.1 kHz
+DEFAULT_VOICES = 16
+
+# Intro sounds: name -> (synth recipe, parameters)
+INTRO_SOUNDS = {
+    'drone': ('drone', {}),
+    'heartbeat': ('heartbeat', {}),
+    'whisper': ('whisper', {}),
+}
+
+# Decoded PCM of sound files, by (path, mtime, mixer format): each file is
+# decoded once per process and survives the mixer being reopened
+_decoded: Dict[tuple, bytes] = {}
+
+
+class SoundManager:
+    """
+    Named sounds on a small mixer
+    The mixer is opened by init() (not on construction), so creating the
+    manager costs nothing at startup. SDL picks the output through
+    SDL_AUDIODRIVER; `dummy` and `disk` work headless. Every call is a
+    no-op while the manager is disabled or the mixer failed to open
+    """
+    
+    def __init__(self, enabled: Optional[bool] = None, frequency: int = DEFAULT_FREQUENCY,
+                 buffer: Optional[int] = None, voices: int = DEFAULT_VOICES):
+        if enabled is None:
+            enabled = os.environ.get('GHOST_HORROR_SOUND', '1') != '0'
+        if buffer is None:
+            buffer = int(os.environ.get('GHOST_HORROR_AUDIO_BUFFER', DEFAULT_BUFFER))
+        self.enabled = enabled
+        self.frequency = frequency
+        self.buffer = buffer
+        self.voices = voices
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.channels: Dict[str, pygame.mixer.Channel] = {}  # Last channel each sound played on
+        self.sources: Dict[str, tuple] = {}  # How each sound was made, to rebuild it on a new mixer
+        self.format: Optional[Tuple[int, int, int]] = None  # (frequency, size, channels) once open
+        self.init_ms: Optional[float] = None
+    
+    def init(self) -> bool:
+        """
+        Open the mixer; returns False (and disables sound) if no audio
+        device can be opened. Sounds made on an earlier mixer are rebuilt
+        from the PCM caches
+        """
+        if not self.enabled or self._ready():
+            return self.enabled
+        start = time.perf_counter()
+        try:
+            # allowedchanges=0: SDL converts to the device, so our PCM format always holds
+            pygame.mixer.init(self.frequency, -16, 2, self.buffer, allowedchanges=0)
+            pygame.mixer.set_num_channels(self.voices)
+            self.format = pygame.mixer.get_init()
+        except (pygame.error, NotImplementedError) as e:
+            print(f"Warning: Sound disabled, cannot open audio device: {e}")
+            self.enabled = False
+            return False
+        self.init_ms = (time.perf_counter() - start) * 1000
+        self.channels.clear()
+        for name, source in self.sources.items():
+            self.sounds[name] = self._build(*source)
+        return True
+    
+    def _ready(self) -> bool:
+        """Whether the mixer is open (pygame.quit() closes it behind our back)"""
+        return self.format is not None and pygame.mixer.get_init() is not None
+    
+    def _build(self, kind: str, *args) -> 'pygame.mixer.Sound':
+        """Make a Sound for the open mixer from a file or a synth recipe"""
+        if kind == 'file':
+            path, mtime = args
+            key = (path, mtime, self.format)
+            pcm = _decoded.get(key)
+            if pcm is None:
+                pcm = pygame.mixer.Sound(path).get_raw()
+                _decoded[key] = pcm
+        else:
+            recipe, volume, params = args
+            frequency, _, channels = self.format
+            pcm = synth.synthesize(recipe, frequency, channels, volume, **dict(params))
+        return pygame.mixer.Sound(buffer=pcm)
+    
+    def load(self, name: str, path: str):
+        """Load a sound file; each file is decoded once per process"""
+        if not self.init():
+            return
+        try:
+            source = ('file', os.path.abspath(path), os.stat(path).st_mtime)
+            self.sounds[name] = self._build(*source)
+            self.sources[name] = source
+        except (OSError, pygame.error) as e:
+            print(f"Warning: Failed to load sound {path}: {e}")
+    
+    def synthesize(self, name: str, recipe: str, volume: float = 0.8, **params):
+        """Build a sound with the NumPy synthesizer (cached per format and parameters)"""
+        if not self.init():
+            return
+        source = ('synth', recipe, volume, tuple(sorted(params.items())))
+        self.sounds[name] = self._build(*source)
+        self.sources[name] = source
+    
+    def prepare_intro(self):
+        """
+        Synthesize the intro sounds (run behind the black screen)
+        Safe on a worker thread once init() has run on the main thread: it
+        never opens the mixer itself, and the Sounds it makes only copy PCM
+        into chunks, without touching the audio device
+        """
+        if not self._ready():
+            return
+        for name, (recipe, params) in INTRO_SOUNDS.items():
+            self.synthesize(name, recipe, **params)
+    
+    def play(self, name: str, loop: bool = False, fade_ms: int = 0, volume: float = 1.0):
+        """Play a loaded sound"""
+        if self._ready() and name in self.sounds:
+            channel = self.sounds[name].play(loops=-1 if loop else 0, fade_ms=fade_ms)
+            if channel is not None:
+                channel.set_volume(volume)
+                self.channels[name] = channel
+    
+    def stop(self, name: str, fade_ms: int = 0):
+        """Stop a playing sound, fading it out over fade_ms"""
+        channel = self.channels.pop(name, None)
+        if self._ready() and channel is not None and channel.get_sound() is self.sounds.get(name):
+            if fade_ms:
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+    
+    def stop_all(self, fade_ms: int = 0):
+        """Stop all sounds, fading them out over fade_ms"""
+        if not self._ready():
+            return
+        if fade_ms:
+            pygame.mixer.fadeout(fade_ms)
+        else:
+            pygame.mixer.stop()
+        self.channels.clear()
+    
+    def close(self):
+        """Close the mixer"""
+        if self._ready():
+            pygame.mixer.quit()
+        self.format = None
+        self.sounds.clear()
+        self.channels.clear()
+    
+    def stats(self) -> dict:
+        """Mixer format, buffer latency and synthesis times for the profiler report"""
+        if self.format is None:
+            return {'enabled': False}
+        frequency, _, channels = self.format
+        return {
+            'enabled': True,
+            'frequency': frequency,
+            'channels': channels,
+            'buffer': self.buffer,
+            'buffer_latency_ms': self.buffer / frequency * 1000,
+            'init_ms': self.init_ms,
+            'synth_ms': dict(synth.timings_ms),
+        }
+
+
+class SoundCueTrack(Track):
+    """Starts (or stops) a sound when the timeline reaches it, then ends"""
+    
+    def __init__(self, sound: SoundManager, name: str, loop: bool = False, fade_ms: int = 0,
+                 volume: float = 1.0, stop: bool = False):
+        super().__init__(0)
+        self.sound = sound
+        self.name = name
+        self.loop = loop
+        self.fade_ms = fade_ms
+        self.volume = volume
+        self.stop = stop
+    
+    def begin(self, timeline: Timeline, now_ms: float):
+        if self.stop:
+            self.sound.stop(self.name, self.fade_ms)
+        else:
+            self.sound.play(self.name, self.loop, self.fade_ms, self.volume)
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        return True
@@ -0,0 +1,559 @@
+"""
+Headless Benchmarks for Ghost Horror Mode
+Runs every effect and scene under SDL's dummy/offscreen video driver
+at several resolutions and reports frame-time statistics
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+from .clock import VirtualClock
+from .display import Display
+from .effects import BloodText, GlowingEyes, EyeSwarm, TextInput, MessageDisplay, BLOOD_RED
+from .quality import LEVEL_NAMES
+
+
+RESOLUTIONS = {
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+    '1440p': (2560, 1440),
+    '4k': (3840, 2160),
+}
+
+RESULTS_VERSION = 1
+
+
+class FrameRecorder:
+    """Records the time between presented frames"""
+    
+    def __init__(self, display: Display):
+        self.display = display
+        self.frame_times: List[float] = []
+        self._present = display.present
+        self._last: Optional[float] = None
+        display.present = self._record
+    
+    def _record(self):
+        self._present()
+        now = time.perf_counter()
+        if self._last is not None:
+            self.frame_times.append((now - self._last) * 1000)
+        self._last = now
+    
+    def detach(self):
+        """Restore the display's own present()"""
+        del self.display.present
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+def summarize(frame_times: List[float]) -> dict:
+    """Frame-time statistics for one benchmark"""
+    ordered = sorted(frame_times)
+    total_ms = sum(ordered)
+    return {
+        'frames': len(ordered),
+        'fps': len(ordered) / (total_ms / 1000) if total_ms else 0.0,
+        'p50_ms': _percentile(ordered, 50),
+        'p95_ms': _percentile(ordered, 95),
+        'p99_ms': _percentile(ordered, 99),
+        'max_ms': ordered[-1] if ordered else 0.0,
+    }
+
+
+def _run_for(display: Display, seconds: float, frame: Callable[[], None]):
+    """Call frame() then display.update() until seconds have passed"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end and display.running:
+        frame()
+        display.update()
+
+
+def bench_blood_text(display: Display, seconds: float):
+    """Blood writing, revealed at the normal pace"""
+    blood_text = BloodText(display, "You Are Alone", font_scale=0.12)
+    center_x, center_y = display.get_center()
+    
+    def frame():
+        display.clear()
+        blood_text.draw(display.screen, center_x, center_y)
+    
+    _run_for(display, seconds, frame)
+
+
+def bench_glowing_eyes(display: Display, seconds: float):
+    """Eyes fading in, breathing and fading out, on repeat"""
+    eyes = GlowingEyes(display, size_scale=0.08)
+    eyes.start()
+    
+    def frame():
+        display.clear()
+        if eyes.update():
+            eyes.start()
+        eyes.draw(display.screen)
+    
+    _run_for(display, seconds, frame)
+
+
+def bench_eye_swarm(display: Display, seconds: float):
+    """Up to three hundred eye pairs at different depths (fewer on large screens)"""
+    swarm = EyeSwarm(display, count=300, seed=0)
+    swarm.start()
+    
+    def frame():
+        display.clear()
+        if swarm.update():
+            swarm.start()
+        swarm.draw(display.screen)
+    
+    _run_for(display, seconds, frame)
+
+
+def bench_text_input(display: Display, seconds: float):
+    """Exit prompt with simulated typing, delivered through the event queue"""
+    text_input = TextInput(display, "You want to see the light?", font_scale=0.06)
+    keys = "no thanks "
+    count = [0]
+    
+    def frame():
+        # Type a key every few frames, clearing the line now and then
+        count[0] += 1
+        if count[0] % 4 == 0:
+            char = keys[(count[0] // 4) % len(keys)]
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char))
+            if len(text_input.input_text) > 30:
+                text_input.input_text = ""
+        display.clear()
+        text_input.draw(display.screen)
+    
+    display.events.subscribe(pygame.KEYDOWN, text_input.handle_event)
+    try:
+        _run_for(display, seconds, frame)
+    finally:
+        display.events.unsubscribe(pygame.KEYDOWN, text_input.handle_event)
+
+
+def bench_message_display(display: Display, seconds: float):
+    """Farewell message fading in and out"""
+    message = MessageDisplay(display, "Then Return!", BLOOD_RED, font_scale=0.10)
+    fade_ms = int(seconds * 1000 / 4)
+    message.show(duration_ms=int(seconds * 1000) - 2 * fade_ms, fade_in_ms=fade_ms, fade_out_ms=fade_ms)
+
+
+def bench_fade_to_black(display: Display, seconds: float):
+    """Finished blood text fading out"""
+    # Give the fade something to fade: the finished blood text
+    blood_text = BloodText(display, "You Are Alone", font_scale=0.12)
+    blood_text.chars_revealed = len(blood_text.text)
+    display.clear()
+    blood_text.draw(display.screen, *display.get_center())
+    display.fade_to_black(int(seconds * 1000))
+
+
+def bench_fade_from_black(display: Display, seconds: float):
+    """Rendered text fading in"""
+    font = pygame.font.Font(None, display.get_font_size(0.1))
+    target = font.render("You Are Alone", True, BLOOD_RED)
+    display.fade_from_black(target, int(seconds * 1000))
+
+
+def bench_intro(display: Display, seconds: float):
+    """The full intro sequence (its own length; fast with --virtual-clock)"""
+    from .main import run_intro_sequence
+    run_intro_sequence(display)
+
+
+BENCHMARKS: Dict[str, Callable[[Display, float], None]] = {
+    'blood_text': bench_blood_text,
+    'glowing_eyes': bench_glowing_eyes,
+    'eye_swarm': bench_eye_swarm,
+    'text_input': bench_text_input,
+    'message_display': bench_message_display,
+    'fade_to_black': bench_fade_to_black,
+    'fade_from_black': bench_fade_from_black,
+    'intro': bench_intro,
+}
+
+
+def run_benchmarks(resolutions: List[str], names: List[str], seconds: float,
+                   driver: str = 'dummy', dirty_rects: bool = False, virtual_clock: bool = False,
+                   quality: str = 'high', render_scale: str = '1') -> dict:
+    """
+    Run the selected benchmarks at each resolution, uncapped
+    With virtual_clock, animations advance one 60 fps frame per update()
+    instead of following wall-clock time
+    quality: fixed effect quality level, or 'auto' to let it adapt
+    render_scale: internal render resolution (factor or height such as 1080p)
+    """
+    results = {}
+    for resolution in resolutions:
+        clock = VirtualClock(60) if virtual_clock else None
+        display = Display(size=RESOLUTIONS[resolution], video_driver=driver, fps=0,
+                          dirty_rects=dirty_rects, clock=clock, quality=quality,
+                          render_scale=render_scale)
+        results[resolution] = {}
+        try:
+            for name in names:
+                display.clear()
+                display.update()
+                recorder = FrameRecorder(display)
+                display.events.reset_latency()
+                BENCHMARKS[name](display, seconds)
+                recorder.detach()
+                stats = summarize(recorder.frame_times)
+                results[resolution][name] = stats
+                print(f"{resolution:>6} {name:<16} {stats['fps']:9.1f} fps  "
+                      f"p50 {stats['p50_ms']:7.2f} ms  p95 {stats['p95_ms']:7.2f} ms  "
+                      f"p99 {stats['p99_ms']:7.2f} ms")
+                if display.events.latency.count:
+                    latency = display.events.stats()
+                    stats['input_p50_ms'] = latency['p50_ms']
+                    stats['input_p95_ms'] = latency['p95_ms']
+                    print(f"{'':>6} {'':<16} keypress to present  "
+                          f"p50 {latency['p50_ms']:7.2f} ms  p95 {latency['p95_ms']:7.2f} ms")
+        finally:
+            display.close()
+    
+    return {
+        'version': RESULTS_VERSION,
+        'driver': driver,
+        'dirty_rects': dirty_rects,
+        'virtual_clock': virtual_clock,
+        'quality': quality,
+        'render_scale': render_scale,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': results,
+    }
+
+
+def run_startup_benchmark(runs: int, driver: str = 'dummy') -> dict:
+    """
+    Launch ghost-horror in a fresh interpreter runs times and time each
+    launch, interpreter start-up included, to its first black frame
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, GHOST_HORROR_STARTUP_PROBE='1', GHOST_HORROR_VIDEO_DRIVER=driver)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+    env.pop('GHOST_HORROR_PROFILE', None)
+    
+    to_black: List[float] = []
+    to_imports: List[float] = []
+    for _ in range(runs):
+        start = time.monotonic()
+        process = subprocess.run([sys.executable, "-m", "ghost_horror.main"], env=env,
+                                 capture_output=True, text=True, timeout=60)
+        probe = next((line for line in process.stdout.splitlines() if line.startswith("startup-probe ")), None)
+        if probe is None:
+            raise RuntimeError(f"startup probe failed: {process.stderr.strip() or process.stdout.strip()}")
+        report = json.loads(probe[len("startup-probe "):])
+        # Monotonic time is system-wide, so the child's clock lines up with ours
+        launched_ms = (report['origin'] - start) * 1000
+        to_black.append(launched_ms + report['marks']['first_black_frame'])
+        to_imports.append(launched_ms + report['marks']['imports'])
+    
+    ordered = sorted(to_black)
+    stats = {
+        'runs': runs,
+        'p50_ms': _percentile(ordered, 50),
+        'p95_ms': _percentile(ordered, 95),
+        'min_ms': ordered[0],
+        'max_ms': ordered[-1],
+        'imports_p50_ms': _percentile(sorted(to_imports), 50),
+    }
+    print(f"startup first black frame  p50 {stats['p50_ms']:7.1f} ms  p95 {stats['p95_ms']:7.1f} ms  "
+          f"min {stats['min_ms']:7.1f} ms  (imports done at p50 {stats['imports_p50_ms']:.1f} ms)")
+    
+    return {
+        'version': RESULTS_VERSION,
+        'driver': driver,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': {'startup': {'first_black_frame': stats}},
+    }
+
+
+def run_handoff_benchmark(runs: int, map_delay_ms: float) -> dict:
+    """
+    Hand the screen over to a fake terminal runs times and time it
+    Needs an X server (Xvfb will do): the overlay opens with the x11
+    driver and ghost_horror.fake_terminal maps its window map_delay_ms
+    after being spawned
+    """
+    from .ekphos_launcher import EkphosLauncher
+    from .handoff import Handoff
+    
+    display = Display(video_driver='x11')
+    launcher = EkphosLauncher()
+    launcher.terminal_cmd = [sys.executable, "-m", "ghost_horror.fake_terminal",
+                             "--map-delay", str(map_delay_ms), "--"]
+    
+    spawn_to_map: List[float] = []
+    map_to_hide: List[float] = []
+    try:
+        for _ in range(runs):
+            display.clear()
+            display.update()
+            handoff = Handoff(launcher, wm_class='fake-terminal')
+            if not handoff.start():
+                raise RuntimeError("could not spawn the fake terminal")
+            if handoff.watcher is None:
+                raise RuntimeError("handoff benchmark needs python-xlib and an X server")
+            handoff.hold(display)
+            display.suspend()
+            handoff.hidden()
+            stats = handoff.stats()
+            launcher.terminate()
+            if 'map_to_hide_ms' not in stats:
+                raise RuntimeError("fake terminal window was not seen")
+            spawn_to_map.append(stats['spawn_to_map_ms'])
+            map_to_hide.append(stats['map_to_hide_ms'])
+            display.resume()
+    finally:
+        launcher.terminate()
+        launcher.close()
+        display.close()
+    
+    ordered = sorted(map_to_hide)
+    stats = {
+        'runs': runs,
+        'p50_ms': _percentile(ordered, 50),
+        'p95_ms': _percentile(ordered, 95),
+        'max_ms': ordered[-1],
+        'spawn_to_map_p50_ms': _percentile(sorted(spawn_to_map), 50),
+    }
+    print(f"handoff map-to-hide  p50 {stats['p50_ms']:7.1f} ms  p95 {stats['p95_ms']:7.1f} ms  "
+          f"max {stats['max_ms']:7.1f} ms  (terminal mapped at p50 {stats['spawn_to_map_p50_ms']:.1f} ms)")
+    
+    return {
+        'version': RESULTS_VERSION,
+        'driver': 'x11',
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': {'handoff': {'map_to_hide': stats}},
+    }
+
+
+def run_grab_benchmark(runs: int, contention_ms: float) -> dict:
+    """
+    Grab and release the keyboard runs times over one X connection
+    Needs an X server (Xvfb will do). With contention_ms, a second client
+    holds the keyboard for that long before each grab, so the retries
+    are exercised
+    """
+    import threading
+    from Xlib import X
+    from Xlib.display import Display as XDisplay
+    from .input_grab import X11KeyboardGrab
+    
+    grabber = X11KeyboardGrab()
+    if not grabber.connect():
+        raise RuntimeError("grab benchmark needs python-xlib and an X server")
+    rival = XDisplay() if contention_ms else None
+    
+    def rival_release():
+        rival.ungrab_keyboard(X.CurrentTime)
+        rival.sync()
+    
+    latencies: List[float] = []
+    try:
+        for _ in range(runs):
+            release = None
+            if rival is not None:
+                rival.screen().root.grab_keyboard(True, X.GrabModeAsync, X.GrabModeAsync, X.CurrentTime)
+                rival.sync()
+                release = threading.Timer(contention_ms / 1000, rival_release)
+                release.start()
+            start = time.perf_counter()
+            if not grabber.grab():
+                raise RuntimeError("keyboard grab failed")
+            latencies.append((time.perf_counter() - start) * 1000)
+            grabber.ungrab()
+            if release is not None:
+                release.join()
+    finally:
+        grabber.close()
+        if rival is not None:
+            rival.close()
+    
+    ordered = sorted(latencies)
+    counts = grabber.stats()
+    stats = {
+        'runs': runs,
+        'p50_ms': _percentile(ordered, 50),
+        'p95_ms': _percentile(ordered, 95),
+        'max_ms': ordered[-1],
+        'retries': counts['retries'],
+        'failures': counts['failures'],
+    }
+    print(f"keyboard grab  p50 {stats['p50_ms']:7.2f} ms  p95 {stats['p95_ms']:7.2f} ms  "
+          f"max {stats['max_ms']:7.2f} ms  ({stats['retries']} retries)")
+    
+    return {
+        'version': RESULTS_VERSION,
+        'driver': 'x11',
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': {'input': {'keyboard_grab': stats}},
+    }
+
+
+def run_audio_benchmark(runs: int) -> dict:
+    """
+    Synthesize every intro sound runs times (uncached) and open the mixer
+    Uses SDL's dummy audio driver unless SDL_AUDIODRIVER is set (disk
+    writes the mix to SDL_DISKAUDIOFILE)
+    """
+    from . import synth
+    from .audio import SoundManager, INTRO_SOUNDS
+    
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    sound = SoundManager(enabled=True)
+    if not sound.init():
+        raise RuntimeError("could not open the mixer")
+    frequency, _, channels = sound.format
+    
+    results = {}
+    try:
+        for name, (recipe, params) in INTRO_SOUNDS.items():
+            times: List[float] = []
+            for _ in range(runs):
+                synth._memory.clear()
+                start = time.perf_counter()
+                sound.synthesize(name, recipe, **params)
+                times.append((time.perf_counter() - start) * 1000)
+            ordered = sorted(times)
+            results[name] = {
+                'runs': runs,
+                'p50_ms': _percentile(ordered, 50),
+                'p95_ms': _percentile(ordered, 95),
+                'seconds': sound.sounds[name].get_length(),
+            }
+            print(f"synth {name:<10} p50 {results[name]['p50_ms']:7.2f} ms  p95 {results[name]['p95_ms']:7.2f} ms  "
+                  f"({results[name]['seconds']:.2f} s of audio)")
+        stats = sound.stats()
+        print(f"mixer {frequency} Hz x{channels}, {sound.buffer}-sample buffer "
+              f"({stats['buffer_latency_ms']:.1f} ms), opened in {stats['init_ms']:.1f} ms")
+    finally:
+        sound.close()
+    
+    return {
+        'version': RESULTS_VERSION,
+        'driver': os.environ['SDL_AUDIODRIVER'],
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': {'audio': results},
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Compare results against a baseline
+    Returns a description of every benchmark whose p95 grew or fps fell
+    by more than threshold (a fraction)
+    """
+    regressions = []
+    for resolution, benches in current['results'].items():
+        for name, stats in benches.items():
+            base = baseline.get('results', {}).get(resolution, {}).get(name)
+            if not base:
+                continue
+            if base['p95_ms'] and stats['p95_ms'] > base['p95_ms'] * (1 + threshold):
+                regressions.append(f"{resolution} {name}: p95 {base['p95_ms']:.2f} -> {stats['p95_ms']:.2f} ms")
+            if base.get('fps') and stats['fps'] < base['fps'] * (1 - threshold):
+                regressions.append(f"{resolution} {name}: fps {base['fps']:.1f} -> {stats['fps']:.1f}")
+    return regressions
+
+
+def main(argv=None):
+    """Entry point for `ghost-horror bench`"""
+    parser = argparse.ArgumentParser(prog="ghost-horror bench", description="Benchmark Ghost Horror effects headlessly")
+    parser.add_argument("--resolutions", default=",".join(RESOLUTIONS),
+                        help="comma-separated list of " + ", ".join(RESOLUTIONS))
+    parser.add_argument("--only", default=",".join(BENCHMARKS),
+                        help="comma-separated list of benchmarks to run")
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of each benchmark")
+    parser.add_argument("--driver", default="dummy", help="SDL video driver (dummy or offscreen)")
+    parser.add_argument("--dirty-rects", action="store_true", help="benchmark the dirty-rect presentation mode")
+    parser.add_argument("--virtual-clock", action="store_true",
+                        help="step animations one frame per update instead of following wall-clock time")
+    parser.add_argument("--quality", choices=["auto"] + LEVEL_NAMES, default="high",
+                        help="effect quality level (default: high)")
+    parser.add_argument("--render-scale", default="1", metavar="SCALE",
+                        help="internal render resolution as a factor or height, e.g. 0.5 or 1080p (default: 1)")
+    parser.add_argument("--startup", action="store_true",
+                        help="time launches to the first black frame instead of benchmarking effects")
+    parser.add_argument("--handoff", action="store_true",
+                        help="time the handoff to a fake terminal window (needs an X server, e.g. Xvfb)")
+    parser.add_argument("--map-delay", type=float, default=200, metavar="MS",
+                        help="start-up time of the fake terminal with --handoff (default 200 ms)")
+    parser.add_argument("--grab", action="store_true",
+                        help="time keyboard grabs over one X connection (needs an X server, e.g. Xvfb)")
+    parser.add_argument("--contention", type=float, default=0, metavar="MS",
+                        help="with --grab, let another client hold the keyboard this long before each grab")
+    parser.add_argument("--audio", action="store_true",
+                        help="time sound synthesis and mixer start-up (SDL dummy audio unless SDL_AUDIODRIVER is set)")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="launches, grabs or syntheses to time with --startup, --handoff, --grab or --audio "
+                             "(default 10)")
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against saved results")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed regression against the baseline (fraction, default 0.10)")
+    args = parser.parse_args(argv)
+    
+    resolutions = [r.strip().lower() for r in args.resolutions.split(",") if r.strip()]
+    names = [n.strip() for n in args.only.split(",") if n.strip()]
+    for value, known in ((resolutions, RESOLUTIONS), (names, BENCHMARKS)):
+        unknown = [v for v in value if v not in known]
+        if unknown:
+            parser.error(f"unknown: {', '.join(unknown)}")
+    
+    if args.startup:
+        results = run_startup_benchmark(args.runs, args.driver)
+    elif args.handoff:
+        results = run_handoff_benchmark(args.runs, args.map_delay)
+    elif args.grab:
+        results = run_grab_benchmark(args.runs, args.contention)
+    elif args.audio:
+        results = run_audio_benchmark(args.runs)
+    else:
+        results = run_benchmarks(resolutions, names, args.seconds, args.driver, args.dirty_rects,
+                                 args.virtual_clock, args.quality, args.render_scale)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Capability Probe for Ghost Horror Mode
+Finds the terminal emulator, the ekphos binary, the session type and
+python-xlib once per process, with binary lookups cached on disk
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+from typing import Dict, List, Optional
+
+from .font_index import get_cache_dir
+
+
+PROBE_VERSION = 1
+
+# Terminals in order of preference with fullscreen flags
+# Format: (binary_name, [fullscreen_flags..., exec_flag])
+TERMINALS = [
+    ("kitty", ["--start-as=fullscreen"]),
+    ("alacritty", ["--option", "window.startup_mode=Fullscreen", "-e"]),
+    ("foot", ["--fullscreen"]),
+    ("wezterm", ["start", "--maximized"]),  # wezterm doesn't have true fullscreen flag
+    ("ghostty", ["--fullscreen"]),
+    ("konsole", ["--fullscreen", "-e"]),
+    ("gnome-terminal", ["--full-screen", "--"]),
+    ("xfce4-terminal", ["--fullscreen", "-x"]),
+    ("xterm", ["-fullscreen", "-e"]),
+    ("urxvt", ["-e"]),  # urxvt doesn't have fullscreen flag
+    ("st", ["-e"]),  # st doesn't have fullscreen flag
+]
+
+
+def _path_dir_mtimes(search_path: str) -> Dict[str, float]:
+    """
+    Get mtimes of the PATH directories
+    Installing or removing a binary touches the directory it lives in
+    """
+    mtimes = {}
+    for directory in search_path.split(os.pathsep):
+        if directory and directory not in mtimes:
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime
+            except OSError:
+                continue
+    return mtimes
+
+
+def detect_x11() -> bool:
+    """Check if running on X11"""
+    session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
+    wayland_display = os.environ.get('WAYLAND_DISPLAY', '')
+    
+    if wayland_display:
+        return False
+    if session_type == 'x11':
+        return True
+    if session_type == 'wayland':
+        return False
+    
+    # Fallback: check for DISPLAY
+    return bool(os.environ.get('DISPLAY'))
+
+
+class BinaryIndex:
+    """
+    On-disk map of binary name -> path on PATH (None if missing)
+    Invalidated whenever PATH or a PATH directory mtime changes; a found
+    binary is looked up again if its own mtime changed
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_cache_dir(), "binaries.json")
+        self.search_path = os.environ.get('PATH', os.defpath)
+        self.binaries: Dict[str, Optional[str]] = {}
+        self.binary_mtimes: Dict[str, float] = {}
+        self.mtimes: Dict[str, float] = {}
+        self.dirty = False
+        self._load()
+    
+    def _load(self):
+        """Load the index from disk, discarding it if stale"""
+        self.mtimes = _path_dir_mtimes(self.search_path)
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if (data.get('version') != PROBE_VERSION or data.get('search_path') != self.search_path
+                or data.get('mtimes') != self.mtimes):
+            return
+        
+        binary_mtimes = data.get('binary_mtimes', {})
+        for name, path in data.get('binaries', {}).items():
+            if path is not None:
+                try:
+                    if os.stat(path).st_mtime != binary_mtimes.get(name):
+                        continue
+                except OSError:
+                    continue
+                self.binary_mtimes[name] = binary_mtimes[name]
+            self.binaries[name] = path
+    
+    def save(self):
+        """Write the index to disk if it changed"""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'version': PROBE_VERSION,
+                    'search_path': self.search_path,
+                    'mtimes': self.mtimes,
+                    'binaries': self.binaries,
+                    'binary_mtimes': self.binary_mtimes,
+                }, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Failed to save capability cache: {e}")
+    
+    def which(self, name: str) -> Optional[str]:
+        """Path of a binary on PATH; only searches PATH on a cache miss"""
+        if name in self.binaries:
+            return self.binaries[name]
+        
+        path = shutil.which(name, path=self.search_path)
+        self.binaries[name] = path
+        if path is not None:
+            try:
+                self.binary_mtimes[name] = os.stat(path).st_mtime
+            except OSError:
+                pass
+        self.dirty = True
+        return path
+
+
+class Capabilities:
+    """What this machine offers Ghost Horror, probed once"""
+    
+    def __init__(self, index: BinaryIndex):
+        self.ekphos = index.which("ekphos")  # Path of the ekphos binary
+        
+        # Terminal command with fullscreen flags, the binary resolved to its path
+        self.terminal_name: Optional[str] = None
+        self.terminal_cmd: Optional[List[str]] = None
+        for name, flags in TERMINALS:
+            path = index.which(name)
+            if path:
+                self.terminal_name = name
+                self.terminal_cmd = [path] + flags
+                break
+        
+        self.x11 = detect_x11()
+        self.xlib = importlib.util.find_spec("Xlib") is not None
+
+
+# Probed once per process
+_capabilities: Optional[Capabilities] = None
+
+
+def get_capabilities(refresh: bool = False) -> Capabilities:
+    """
+    Get the machine's capabilities
+    Memoized in-process (refresh=True probes again); binary lookups are
+    persisted to the on-disk index
+    """
+    global _capabilities
+    if _capabilities is None or refresh:
+        index = BinaryIndex()
+        if refresh:
+            index.binaries.clear()
+        _capabilities = Capabilities(index)
+        index.save()
+    return _capabilities
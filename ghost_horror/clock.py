@@ -0,0 +1,62 @@
+"""
+Clocks for Ghost Horror Mode
+Every animation reads time through one of these, so the whole sequence
+can run on wall-clock time or on a stepped virtual clock
+"""
+
+import time
+from typing import Optional
+
+from .pacing import FramePacer
+
+
+class RealClock:
+    """Wall-clock time, paced by a FramePacer"""
+    
+    def __init__(self, pacer: Optional[FramePacer] = None):
+        self.pacer = pacer or FramePacer()
+        self._start = time.perf_counter()
+    
+    def get_ticks(self) -> int:
+        """Milliseconds since the clock was created (SDL's timer is never started)"""
+        return int((time.perf_counter() - self._start) * 1000)
+    
+    def now_ms(self) -> float:
+        """High-resolution milliseconds for timestep accumulation"""
+        return time.perf_counter() * 1000
+    
+    def tick(self, fps: float = 0) -> int:
+        """Wait to hold fps (0 = uncapped), returns ms since the last tick"""
+        return int(self.pacer.tick(fps))
+    
+    def reset(self):
+        """Restart frame pacing after a pause"""
+        self.pacer.reset()
+
+
+class VirtualClock:
+    """
+    Stepped clock: every tick advances time by exactly one frame and never sleeps
+    Runs animations as fast as the CPU allows, producing identical frames every run
+    """
+    
+    def __init__(self, fps: int = 60, start_ms: int = 0):
+        self.fps = fps
+        self.frame_ms = 1000 / fps
+        self.time_ms = float(start_ms)
+    
+    def get_ticks(self) -> int:
+        """Virtual milliseconds elapsed"""
+        return int(self.time_ms)
+    
+    def now_ms(self) -> float:
+        """Exact virtual milliseconds elapsed"""
+        return self.time_ms
+    
+    def tick(self, fps: float = 0) -> int:
+        """Advance one frame; the requested fps is ignored so runs stay deterministic"""
+        self.time_ms += self.frame_ms
+        return int(self.frame_ms)
+    
+    def reset(self):
+        """Nothing to restart: virtual time does not pass while paused"""
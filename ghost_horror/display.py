@@ -4,31 +4,90 @@ Handles fullscreen overlay and rendering using Pygame/SDL2
 """
 
 import pygame
+import math
 import os
-from typing import Callable, Optional
+import time
+from typing import Callable, List, Optional, Tuple
+from .assets import assets
+from .clock import RealClock, VirtualClock
+from .events import EventDispatcher
+from .pacing import DEFAULT_REFRESH_HZ, align_frame_rate, detect_refresh_rate
+from .profiler import profiler
+from .quality import QualityGovernor, parse_quality
+from .timeline import Timeline, HoldTrack, FadeToBlackTrack, FadeFromBlackTrack
+
+
+def parse_render_scale(value: Optional[str], native_height: int) -> float:
+    """
+    Parse a render scale: a factor such as 0.5 or 0.75, or a backbuffer
+    height such as 1080p. Never scales up
+    """
+    if not value:
+        return 1.0
+    value = value.strip().lower()
+    if value.endswith('p'):
+        scale = int(value[:-1]) / native_height
+    else:
+        scale = float(value)
+    if scale <= 0:
+        raise ValueError(f"render scale must be positive: {value}")
+    return min(1.0, scale)
 
 
 class Display:
     """Fullscreen display manager for X11"""
     
-    def __init__(self, background_color: tuple = (0, 0, 0)):
-        """Initialize the display engine"""
-        # Force SDL to use X11
-        os.environ['SDL_VIDEODRIVER'] = 'x11'
+    def __init__(self, background_color: tuple = (0, 0, 0), dirty_rects: Optional[bool] = None,
+                 size: Optional[Tuple[int, int]] = None, video_driver: str = 'x11', fps: int = 60,
+                 clock=None, quality: Optional[str] = None, render_scale: Optional[str] = None,
+                 vsync: Optional[bool] = None):
+        """
+        Initialize the display engine
+        dirty_rects: present only the regions effects report (defaults to
+        the GHOST_HORROR_DIRTY_RECTS environment variable)
+        size: force a resolution instead of the native one
+        video_driver: SDL video driver ('dummy' or 'offscreen' for headless runs)
+        fps: frame-rate cap for update(), 0 for uncapped; rounded to the
+        nearest whole fraction of the monitor refresh rate
+        clock: time source for the display and effects (RealClock or VirtualClock)
+        quality: 'auto' to adapt effect quality to the frame rate, or a fixed
+        level name (defaults to the GHOST_HORROR_QUALITY environment variable)
+        render_scale: draw into a smaller backbuffer that is upscaled to the
+        window, e.g. '0.5' or '1080p' (defaults to GHOST_HORROR_RENDER_SCALE)
+        vsync: let SDL wait for vertical blank on each flip where it can
+        (defaults to the GHOST_HORROR_VSYNC environment variable)
+        """
+        # Force SDL to use X11 (or the requested driver)
+        os.environ['SDL_VIDEODRIVER'] = video_driver
         
-        pygame.init()
-        pygame.mixer.quit()  # Disable sound for now (can re-enable later)
+        # Only video for now: the first black frame should not wait for
+        # fonts, audio or joysticks (fonts start right after it)
+        pygame.display.init()
         
         # Get display info for scaling
-        display_info = pygame.display.Info()
-        self.screen_width = display_info.current_w
-        self.screen_height = display_info.current_h
+        # (a forced size uses a borderless window; SDL clamps fullscreen modes)
+        self.mode_flags = pygame.NOFRAME
+        if size is None:
+            display_info = pygame.display.Info()
+            size = (display_info.current_w, display_info.current_h)
+            self.mode_flags |= pygame.FULLSCREEN
         
         # Create fullscreen window
-        self.screen = pygame.display.set_mode(
-            (self.screen_width, self.screen_height),
-            pygame.FULLSCREEN | pygame.NOFRAME
-        )
+        # (SDL only vsyncs pygame windows through the SCALED renderer)
+        if vsync is None:
+            vsync = os.environ.get('GHOST_HORROR_VSYNC') == '1'
+        self.vsync = False
+        if vsync:
+            try:
+                self.window_surface = pygame.display.set_mode(size, self.mode_flags | pygame.SCALED, vsync=1)
+                self.mode_flags |= pygame.SCALED
+                self.vsync = True
+            except pygame.error as e:
+                print(f"Warning: vsync unavailable, pacing by timer: {e}")
+        if not self.vsync:
+            self.window_surface = pygame.display.set_mode(size, self.mode_flags)
+        self.window_width, self.window_height = self.window_surface.get_size()
+        assets.display_changed()
         pygame.display.set_caption("Ghost Horror")
         pygame.mouse.set_visible(False)
         
@@ -36,16 +95,116 @@ class Display:
         pygame.event.set_grab(True)
         
         self.background_color = background_color
-        self.clock = pygame.time.Clock()
+        
+        # Frame pacing, aligned with the monitor refresh rate once it is
+        # detected after the first frame (assume the common rate until then)
+        self.requested_fps = fps
+        self.refresh_rate = DEFAULT_REFRESH_HZ
+        self.fps = align_frame_rate(fps, self.refresh_rate)
+        self.clock = clock or RealClock()
+        pacer = getattr(self.clock, 'pacer', None)
+        if pacer is not None:
+            pacer.vsync = self.vsync
         self.running = True
+        self.suspended = False
+        
+        # Single owner of the event queue; only event types in use are queued
+        self.events = EventDispatcher()
+        self.events.apply_filter()
+        self.events.subscribe(pygame.QUIT, self._on_quit)
+        self.events.subscribe(pygame.WINDOWEXPOSED, self._on_exposed)
+        
+        # Effect quality; adapting to frame times only makes sense on the real clock
+        if quality is None:
+            quality = os.environ.get('GHOST_HORROR_QUALITY', 'auto')
+        level = parse_quality(quality)
+        adaptive = level is None and not isinstance(self.clock, VirtualClock)
+        self.quality = QualityGovernor(level or 0, adaptive=adaptive, fps=self.fps)
+        self._frame_start = time.perf_counter()
+        
+        # Internal render resolution: effects draw to self.screen at
+        # screen_width x screen_height, which may be smaller than the window
+        if render_scale is None:
+            render_scale = os.environ.get('GHOST_HORROR_RENDER_SCALE')
+        self.base_render_scale = parse_render_scale(render_scale, self.window_height)
+        self._set_render_scale(self.base_render_scale)
+        
+        # Dirty-rect presentation state
+        if dirty_rects is None:
+            dirty_rects = os.environ.get('GHOST_HORROR_DIRTY_RECTS') == '1'
+        self.dirty_rects = dirty_rects
+        self._drawn: List[pygame.Rect] = []  # Drawn since the last clear (still on screen)
+        self._pending: List[pygame.Rect] = []  # Erased or drawn since the last present
+        self._full_redraw = True
         
         # Clear to black immediately
         self.clear()
         pygame.display.flip()
+        pygame.font.init()
+        
+        # Querying XRandR costs tens of ms (Xlib import and round-trips),
+        # so it waits until the screen is already black
+        self.set_refresh_rate(detect_refresh_rate(video_driver))
+    
+    def set_refresh_rate(self, refresh_hz: float):
+        """Align the frame rate, pacer and quality budget with the monitor refresh rate"""
+        self.refresh_rate = refresh_hz
+        self.fps = align_frame_rate(self.requested_fps, refresh_hz)
+        self.quality.budget_ms = 1000 / (self.fps or 60)
+        pacer = getattr(self.clock, 'pacer', None)
+        if pacer is not None:
+            pacer.refresh_hz = refresh_hz
+    
+    def _set_render_scale(self, scale: float):
+        """Use the window directly at scale 1, else a backbuffer of the scaled size"""
+        self.render_scale = scale
+        if scale >= 1.0:
+            self.screen = self.window_surface
+        else:
+            size = (max(1, round(self.window_width * scale)), max(1, round(self.window_height * scale)))
+            self.screen = pygame.Surface(size).convert()
+        self.screen_width, self.screen_height = self.screen.get_size()
+        self._drawn = []
+        self._pending = []
+        self._full_redraw = True
+    
+    @property
+    def track_regions(self) -> bool:
+        """
+        Whether drawn regions are tracked: in dirty-rect mode, and with a
+        backbuffer so only the regions that changed are upscaled
+        """
+        return self.dirty_rects or self.screen is not self.window_surface
     
     def clear(self, color: Optional[tuple] = None):
-        """Clear the screen with background color"""
+        """
+        Clear the screen with background color
+        When regions are tracked only the regions drawn since the last clear are erased
+        """
+        if self.track_regions and color is None and not self._full_redraw:
+            for rect in self._drawn:
+                self.screen.fill(self.background_color, rect)
+            self._pending.extend(self._drawn)
+            self._drawn = []
+            return
+        
         self.screen.fill(color or self.background_color)
+        self._drawn = []
+        self._full_redraw = True
+    
+    def mark_dirty(self, *rects: Optional[pygame.Rect]):
+        """Report screen regions an effect drew to (used when regions are tracked)"""
+        if not self.track_regions:
+            return
+        for rect in rects:
+            if rect:
+                rect = self.screen.get_rect().clip(rect)
+                self._drawn.append(rect)
+                self._pending.append(rect)
+    
+    def invalidate(self):
+        """Present the whole screen on the next update"""
+        self._full_redraw = True
     
     def get_center(self) -> tuple:
         """Get screen center coordinates"""
@@ -55,99 +214,178 @@ class Display:
         """Get font size scaled to screen height"""
         return int(self.screen_height * scale)
     
+    def _upscale(self, rect: Optional[pygame.Rect] = None) -> pygame.Rect:
+        """Scale a backbuffer region (default: all of it) onto the window, returning the window rect"""
+        if rect is None:
+            rect = self.screen.get_rect()
+        else:
+            # Filtered window pixels blend in their neighbours (and region edges
+            # round to whole window pixels), so refresh a margin around the region
+            rect = rect.inflate(4, 4).clip(self.screen.get_rect())
+        scale_x = self.window_width / self.screen_width
+        scale_y = self.window_height / self.screen_height
+        left, top = int(rect.left * scale_x), int(rect.top * scale_y)
+        right = min(self.window_width, math.ceil(rect.right * scale_x))
+        bottom = min(self.window_height, math.ceil(rect.bottom * scale_y))
+        target = pygame.Rect(left, top, right - left, bottom - top)
+        if rect.width and rect.height and target.width and target.height:
+            # Filtered scaling follows the sprite filtering quality setting
+            scale = pygame.transform.smoothscale if self.quality.settings['smooth_scale'] else pygame.transform.scale
+            scale(self.screen.subsurface(rect), target.size, self.window_surface.subsurface(target))
+        return target
+    
+    def present(self):
+        """Present the frame and hold the frame rate"""
+        profiler.mark('draw')
+        
+        pending = self._pending
+        if self.screen is not self.window_surface:
+            if self._full_redraw:
+                self._upscale()
+            else:
+                pending = [self._upscale(rect) for rect in pending]
+        
+        # With vsync the flip blocks until vertical blank, which is not work
+        work_end = time.perf_counter()
+        if self.dirty_rects and not self._full_redraw:
+            if pending:
+                pygame.display.update(pending)
+        else:
+            pygame.display.flip()
+        self._pending = []
+        self._full_redraw = False
+        profiler.mark('flip')
+        self.events.presented()
+        if not self.vsync:
+            work_end = time.perf_counter()
+        work_ms = (work_end - self._frame_start) * 1000
+        
+        self.clock.tick(self.fps)
+        profiler.mark('sleep')
+        self._frame_start = time.perf_counter()
+        self.quality.record(work_ms)
+    
+    def pacing_stats(self) -> dict:
+        """Frame-interval jitter statistics (empty on a virtual clock)"""
+        pacer = getattr(self.clock, 'pacer', None)
+        return pacer.stats() if pacer is not None else {}
+    
+    def pump_events(self) -> list:
+        """Drain the event queue through the dispatcher and return the events"""
+        return self.events.pump()
+    
+    def _on_quit(self, event):
+        """Stop the running loop when the window is closed"""
+        self.running = False
+    
+    def _on_exposed(self, event):
+        """Repaint everything when the window manager has uncovered the window"""
+        self.invalidate()
+    
     def update(self):
         """Update display and handle events"""
-        pygame.display.flip()
-        self.clock.tick(60)
-        
-        # Handle quit events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        self.present()
+        self.pump_events()
+        profiler.mark('events')
+        profiler.end_frame()
     
     def fade_to_black(self, duration_ms: int = 1000):
         """Fade current screen to black"""
-        # Capture current screen
-        current = self.screen.copy()
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        
-        start_time = pygame.time.get_ticks()
-        while pygame.time.get_ticks() - start_time < duration_ms:
-            progress = (pygame.time.get_ticks() - start_time) / duration_ms
-            alpha = int(255 * progress)
-            
-            self.screen.blit(current, (0, 0))
-            overlay.set_alpha(alpha)
-            self.screen.blit(overlay, (0, 0))
-            
-            self.update()
-            if not self.running:
-                break
+        timeline = Timeline(self)
+        timeline.add(FadeToBlackTrack(duration_ms))
+        timeline.run()
         
         self.clear()
         self.update()
     
     def fade_from_black(self, target_surface: pygame.Surface, duration_ms: int = 1000):
         """Fade from black to a target surface"""
-        start_time = pygame.time.get_ticks()
-        while pygame.time.get_ticks() - start_time < duration_ms:
-            progress = (pygame.time.get_ticks() - start_time) / duration_ms
-            alpha = int(255 * progress)
-            
-            self.clear()
-            target_surface.set_alpha(alpha)
-            
-            # Center the surface
-            x = (self.screen_width - target_surface.get_width()) // 2
-            y = (self.screen_height - target_surface.get_height()) // 2
-            self.screen.blit(target_surface, (x, y))
-            
-            self.update()
-            if not self.running:
-                break
+        timeline = Timeline(self)
+        timeline.add(FadeFromBlackTrack(target_surface, duration_ms))
+        timeline.run()
     
     def wait(self, duration_ms: int):
         """Wait while keeping display responsive"""
-        start_time = pygame.time.get_ticks()
-        while pygame.time.get_ticks() - start_time < duration_ms:
-            self.update()
-            if not self.running:
-                break
+        timeline = Timeline(self, clear=False)
+        timeline.add(HoldTrack(duration_ms))
+        timeline.run()
+    
+    def _get_window(self):
+        """Get the SDL2 window object, or None if pygame doesn't expose it"""
+        try:
+            from pygame._sdl2.video import Window
+            return Window.from_display_module()
+        except Exception:
+            return None
+    
+    def suspend(self):
+        """
+        Hide the window while another program runs
+        pygame stays initialized, so fonts and cached surfaces survive
+        """
+        pygame.event.set_grab(False)  # Release input grab
+        pygame.mouse.set_visible(True)
+        
+        window = self._get_window()
+        if window is not None:
+            window.hide()
+        else:
+            pygame.display.iconify()
+        self.suspended = True
+    
+    def resume(self):
+        """Show the window again after suspend() and repaint it black"""
+        window = self._get_window()
+        if window is not None:
+            window.show()
+            try:
+                window.focus()
+            except Exception:
+                pass
+            # SDL may have recreated the window surface while it was hidden
+            surface = pygame.display.get_surface()
+            if surface is not None and surface is not self.window_surface:
+                self.window_surface = surface
+                assets.display_changed()
+        else:
+            # Restoring an iconified window needs a fresh mode set
+            self.window_surface = pygame.display.set_mode(
+                (self.window_width, self.window_height),
+                self.mode_flags
+            )
+            assets.display_changed()
+            self.events.apply_filter()
+        
+        # Apply the quality level's render scale now that no effect holds on to the old size
+        self._set_render_scale(self.base_render_scale * self.quality.settings['render_scale'])
+        
+        pygame.mouse.set_visible(False)
+        pygame.event.set_grab(True)
+        pygame.event.clear()  # Drop input queued while hidden
+        
+        self.suspended = False
+        self.running = True
+        self.quality.reset()
+        self.clock.reset()
+        self._frame_start = time.perf_counter()
+        self.clear()
+        self.update()
     
     def close(self):
         """Close the display"""
         pygame.event.set_grab(False)  # Release input grab
         pygame.mouse.set_visible(True)
         pygame.quit()
+        assets.display_changed()  # Surfaces converted for this display must be rebuilt for the next
 
 
-class SoundManager:
+def __getattr__(name: str):
     """
-    Sound manager stub for future audio support
-    Structured for easy addition of sound effects later
+    SoundManager now lives in audio.py and is still importable from here
+    It is imported on first use, so the display (loaded before the first
+    black frame) does not pull in the audio engine and synthesizer
     """
-    
-    def __init__(self):
-        self.enabled = False
-        self.sounds = {}
-    
-    def load(self, name: str, path: str):
-        """Load a sound file (stub)"""
-        if self.enabled:
-            # TODO: pygame.mixer.Sound(path)
-            pass
-    
-    def play(self, name: str, loop: bool = False):
-        """Play a loaded sound (stub)"""
-        if self.enabled and name in self.sounds:
-            # TODO: self.sounds[name].play()
-            pass
-    
-    def stop(self, name: str):
-        """Stop a playing sound (stub)"""
-        pass
-    
-    def stop_all(self):
-        """Stop all sounds (stub)"""
-        pass
+    if name == 'SoundManager':
+        from .audio import SoundManager
+        return SoundManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
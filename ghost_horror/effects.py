@@ -4,9 +4,19 @@ Blood writing animation and glowing eyes
 """
 
 import pygame
+import numpy as np
+import itertools
 import math
 import os
-from typing import Optional
+import random
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from .assets import Asset, assets
+from .font_index import find_font_path
+from .glow import eye_sprite, bloom
+from .text_cache import text_cache
+from .timeline import Timeline, Track
 
 
 # Purple glow color palette
@@ -15,36 +25,269 @@ PURPLE_DARK = (75, 0, 130)    # Indigo
 BLOOD_RED = (139, 0, 0)       # Dark red for blood text
 BLOOD_DRIP = (100, 0, 0)      # Darker for drip effect
 
+# Horror fonts in order of preference
+HORROR_FONTS = [
+    "Creepster",
+    "Nosifer",
+    "Butcherman",
+    "Eater",
+    "Metal Mania",
+    "Creepy",
+    "Impact",  # Fallback - bold and readable
+]
+
 
 def get_horror_font(size: int) -> pygame.font.Font:
     """
     Get a horror-style font, falls back to system font if needed
     Uses a bold, creepy-looking font
     """
-    # Try to find a good horror font
-    horror_fonts = [
-        "Creepster",
-        "Nosifer",
-        "Butcherman",
-        "Eater",
-        "Metal Mania",
-        "Creepy",
-        "Impact",  # Fallback - bold and readable
-    ]
-    
-    for font_name in horror_fonts:
+    # Resolve the font file through the persistent index (no fontconfig scan)
+    path = find_font_path(HORROR_FONTS)
+    if path:
         try:
-            font = pygame.font.SysFont(font_name, size)
-            # Test if font actually loaded (not default)
-            if font.get_height() > 0:
-                return font
-        except:
-            continue
+            return pygame.font.Font(path, size)
+        except Exception:
+            pass
     
     # Ultimate fallback
     return pygame.font.Font(None, size)
 
 
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs plus advance/kerning tables for one font and color
+    Built once so text effects never call font.render or font.size per frame
+    """
+    
+    def __init__(self, font: pygame.font.Font, color: tuple):
+        # Held weakly: atlases are keyed by font in a WeakKeyDictionary
+        self._font = weakref.ref(font)
+        self.color = color
+        self.glyphs: Dict[str, Asset] = {}
+        self.advances: Dict[str, int] = {}
+        self.kerning: Dict[Tuple[str, str], int] = {}
+    
+    @property
+    def font(self) -> pygame.font.Font:
+        """The font glyphs are rendered with"""
+        return self._font()
+    
+    def glyph_asset(self, char: str) -> Asset:
+        """Get the registry asset holding a character's rendered surface"""
+        asset = self.glyphs.get(char)
+        if asset is None:
+            # The builder must not keep the font (and so this atlas) alive
+            font_ref = self._font
+            color = self.color
+            asset = assets.hold(
+                self, f"glyph/{id(self.font):x}/{color}/{char}",
+                lambda: font_ref().render(char, True, color),
+            )
+            self.glyphs[char] = asset
+        return asset
+    
+    def glyph(self, char: str) -> pygame.Surface:
+        """Get the rendered surface for a character"""
+        return self.glyph_asset(char).surface
+    
+    def advance(self, char: str) -> int:
+        """Get the horizontal advance of a character"""
+        width = self.advances.get(char)
+        if width is None:
+            width = self.font.size(char)[0]
+            self.advances[char] = width
+        return width
+    
+    def kern(self, left: str, right: str) -> int:
+        """Get the kerning adjustment between two characters"""
+        pair = (left, right)
+        adjust = self.kerning.get(pair)
+        if adjust is None:
+            adjust = self.font.size(left + right)[0] - self.advance(left) - self.advance(right)
+            self.kerning[pair] = adjust
+        return adjust
+    
+    def layout(self, text: str) -> Tuple[List[int], int]:
+        """
+        Lay out a line of text
+        Returns (x offset of each character, total width)
+        """
+        offsets = []
+        x = 0
+        previous = None
+        for char in text:
+            if previous is not None:
+                x += self.kern(previous, char)
+            offsets.append(x)
+            x += self.advance(char)
+            previous = char
+        return offsets, x
+
+
+# font -> {color: GlyphAtlas}, dropped together with the font
+_glyph_atlases = weakref.WeakKeyDictionary()
+
+
+def get_glyph_atlas(font: pygame.font.Font, color: tuple) -> GlyphAtlas:
+    """Get the shared glyph atlas for a font and color, building it once"""
+    by_color = _glyph_atlases.setdefault(font, {})
+    atlas = by_color.get(color)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color)
+        by_color[color] = atlas
+    return atlas
+
+
+class ParticleSystem:
+    """
+    Struct-of-arrays particle pool (position, velocity, size, alpha) backed by NumPy
+    Integration and culling are vectorized; particles are drawn by stamping
+    pre-rendered sprites quantized by radius and alpha in one blits() call
+    """
+    
+    ALPHA_LEVELS = 16
+    
+    def __init__(self, color: tuple, bounds: Tuple[int, int], capacity: int = 1024,
+                 gravity: float = 0.0, shrink: float = 0.0, fade: float = 0.0,
+                 min_size: float = 1.0, max_size: int = 8):
+        self.color = color
+        self.bounds = bounds  # (width, height) - particles outside are culled
+        self.gravity = gravity  # Velocity change per frame
+        self.shrink = shrink  # Size lost per frame
+        self.fade = fade  # Alpha lost per frame
+        self.min_size = min_size
+        self.max_size = max_size
+        
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.alpha = np.zeros(capacity, dtype=np.float32)
+        
+        self._create_sprites()
+    
+    def _create_sprites(self):
+        """Register a sprite sheet with one circle per (radius, alpha level), plus each circle's area"""
+        color, max_size, levels = tuple(self.color[:3]), self.max_size, self.ALPHA_LEVELS
+        cell = max(1, max_size * 2)
+        
+        def build() -> pygame.Surface:
+            sheet = pygame.Surface((cell * levels, cell * (max_size + 1)), pygame.SRCALPHA)
+            for radius in range(max_size + 1):
+                diameter = max(1, radius * 2)
+                for level in range(levels):
+                    alpha = 255 * (level + 1) // levels
+                    sprite = sheet.subsurface((level * cell, radius * cell, diameter, diameter))
+                    pygame.draw.circle(sprite, (*color, alpha), (diameter // 2, diameter // 2), max(1, radius))
+            return sheet
+        
+        self.sheet = assets.hold(self, f"particles/{color}/{max_size}/{levels}", build)
+        self.areas = [
+            pygame.Rect(level * cell, radius * cell, max(1, radius * 2), max(1, radius * 2))
+            for radius in range(max_size + 1)
+            for level in range(levels)
+        ]
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _reserve(self, extra: int):
+        """Grow the arrays so extra particles fit"""
+        needed = self.count + extra
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('x', 'y', 'vx', 'vy', 'size', 'alpha'):
+            grown = np.zeros(capacity, dtype=np.float32)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+    
+    def emit(self, x, y, vx=0.0, vy=0.0, size=4.0, alpha=255.0):
+        """
+        Emit particles; every argument may be a scalar or an array
+        The number emitted is the broadcast length of the arguments
+        """
+        x, y, vx, vy, size, alpha = np.broadcast_arrays(
+            np.atleast_1d(x), y, vx, vy, size, alpha)
+        n = len(x)
+        self._reserve(n)
+        end = self.count + n
+        self.x[self.count:end] = x
+        self.y[self.count:end] = y
+        self.vx[self.count:end] = vx
+        self.vy[self.count:end] = vy
+        self.size[self.count:end] = size
+        self.alpha[self.count:end] = alpha
+        self.count = end
+    
+    def spray(self, x: float, y: float, count: int, speed: float, angle: float = math.pi / 2,
+              spread: float = math.pi / 4, size: float = 4.0, rng: Optional[np.random.Generator] = None):
+        """Emit a burst of particles in a cone around angle (radians, pi/2 = down)"""
+        rng = rng or np.random.default_rng()
+        angles = angle + rng.uniform(-spread, spread, count)
+        speeds = speed * rng.uniform(0.5, 1.0, count)
+        self.emit(x, y, np.cos(angles) * speeds, np.sin(angles) * speeds,
+                  size * rng.uniform(0.5, 1.0, count))
+    
+    def update(self, dt: float = 1.0):
+        """Integrate all particles by dt frames and cull dead ones"""
+        n = self.count
+        if n == 0:
+            return
+        
+        x, y = self.x[:n], self.y[:n]
+        vy, size, alpha = self.vy[:n], self.size[:n], self.alpha[:n]
+        
+        x += self.vx[:n] * dt
+        y += vy * dt
+        vy += self.gravity * dt
+        np.maximum(size - self.shrink * dt, self.min_size, out=size)
+        alpha -= self.fade * dt
+        
+        # Compact survivors to the front of the arrays (O(n), no list.remove)
+        width, height = self.bounds
+        alive = (alpha > 0) & (y <= height) & (x >= 0) & (x <= width)
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for name in ('x', 'y', 'vx', 'vy', 'size', 'alpha'):
+                array = getattr(self, name)
+                array[:survivors] = array[:n][alive]
+            self.count = survivors
+    
+    def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Stamp every live particle onto the surface in one batch
+        Returns the bounding rect of the stamped particles (None if empty)
+        """
+        n = self.count
+        if n == 0:
+            return None
+        
+        radius = np.clip(self.size[:n], 0, self.max_size).astype(np.int32)
+        level = np.clip(self.alpha[:n] * self.ALPHA_LEVELS / 256, 0, self.ALPHA_LEVELS - 1).astype(np.int32)
+        index = radius * self.ALPHA_LEVELS + level
+        left = (self.x[:n] - radius).astype(np.int32)
+        top = (self.y[:n] - radius).astype(np.int32)
+        
+        sheet = self.sheet.surface
+        surface.blits(zip(
+            itertools.repeat(sheet), zip(left.tolist(), top.tolist()), map(self.areas.__getitem__, index.tolist())
+        ), False)
+        
+        extent = max(1, self.max_size * 2)
+        x0, y0 = int(left.min()), int(top.min())
+        return pygame.Rect(x0, y0, int(left.max()) - x0 + extent, int(top.max()) - y0 + extent)
+    
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
+
+
 class BloodText:
     """Animated blood-dripping text effect"""
     
@@ -54,99 +297,173 @@ class BloodText:
         self.font_size = display.get_font_size(font_scale)
         self.font = get_horror_font(self.font_size)
         
+        # Glyphs and layout are computed once, not per frame
+        self.atlas = get_glyph_atlas(self.font, BLOOD_RED)
+        self.glyph_assets = [self.atlas.glyph_asset(char) for char in text]
+        self.glyph_offsets, self.text_width = self.atlas.layout(text)
+        
         # Animation state
         self.chars_revealed = 0
         self.char_progress = 0.0  # 0-1 for current char animation
-        self.drips = []  # List of active drip animations
+        self.drips = ParticleSystem(
+            BLOOD_DRIP,
+            (display.screen_width, display.screen_height),
+            shrink=0.02,
+            fade=2,
+            max_size=4,
+        )  # Active drip animations
         
         # Timing
         self.char_delay_ms = 150  # Time per character
         self.last_char_time = 0
+        self.now_ms = 0
     
     def render_char(self, char: str, alpha: int = 255) -> pygame.Surface:
         """Render a single character with blood color"""
-        # Create text surface
-        text_surface = self.font.render(char, True, BLOOD_RED)
+        text_surface = self.atlas.glyph(char)
         
-        # Apply alpha
+        # Apply alpha on a copy so the shared glyph stays opaque
         if alpha < 255:
+            text_surface = text_surface.copy()
             text_surface.set_alpha(alpha)
         
         return text_surface
     
     def get_text_width(self, text: str) -> int:
         """Get the pixel width of text"""
-        return self.font.size(text)[0]
+        return self.atlas.layout(text)[1]
     
-    def draw(self, surface: pygame.Surface, center_x: int, center_y: int) -> bool:
+    def update(self, now_ms: int, center_x: int, center_y: int, dt: float = 1.0) -> bool:
         """
-        Draw the blood text animation
-        Returns True when animation is complete
+        Advance the animation to now_ms; dt is the step length in 60 fps frames
+        Returns True when all characters are revealed
         """
-        current_time = pygame.time.get_ticks()
-        
         # Progress character reveal
         if self.chars_revealed < len(self.text):
-            if current_time - self.last_char_time >= self.char_delay_ms:
+            if now_ms - self.last_char_time >= self.char_delay_ms:
                 self.chars_revealed += 1
-                self.last_char_time = current_time
+                self.last_char_time = now_ms
                 
-                # Add a drip for some characters
+                # Add a drip for some characters (how many depends on the quality level)
+                drip_every = self.display.quality.settings['drip_every']
                 if self.chars_revealed > 0 and self.text[self.chars_revealed - 1] != ' ':
-                    if self.chars_revealed % 2 == 0:  # Every other char gets a drip
+                    if drip_every and self.chars_revealed % drip_every == 0:
                         self._add_drip(self.chars_revealed - 1, center_x, center_y)
         
-        # Calculate starting position for centered text
-        total_width = self.get_text_width(self.text[:self.chars_revealed])
-        start_x = center_x - self.get_text_width(self.text) // 2
-        current_x = start_x
-        
-        # Draw revealed characters
-        for i in range(self.chars_revealed):
-            char = self.text[i]
-            char_surface = self.render_char(char)
-            
-            # Add slight waviness for creepy effect
-            y_offset = int(math.sin(current_time / 200 + i) * 2)
-            
-            surface.blit(char_surface, (current_x, center_y - self.font_size // 2 + y_offset))
-            current_x += self.font.size(char)[0]
-        
-        # Draw and update drips
-        self._update_drips(surface)
-        
+        self.drips.update(dt)
+        self.now_ms = now_ms
         return self.chars_revealed >= len(self.text)
     
+    def render(self, surface: pygame.Surface, center_x: int, center_y: int):
+        """Draw the revealed characters and drips as of the last update()"""
+        # Calculate starting position for centered text
+        start_x = center_x - self.text_width // 2
+        base_y = center_y - self.font_size // 2
+        
+        # Draw revealed characters in one batch, with slight waviness for creepy effect
+        phase = self.now_ms / 200
+        rects = surface.blits([
+            (self.glyph_assets[i].surface, (start_x + self.glyph_offsets[i], base_y + int(math.sin(phase + i) * 2)))
+            for i in range(self.chars_revealed)
+        ])
+        if rects:
+            self.display.mark_dirty(rects[0].unionall(rects))
+        
+        # Draw drips
+        self.display.mark_dirty(self.drips.draw(surface))
+    
+    def draw(self, surface: pygame.Surface, center_x: int, center_y: int) -> bool:
+        """
+        Draw the blood text animation (one 60 fps frame per call)
+        Returns True when animation is complete
+        """
+        complete = self.update(self.display.clock.get_ticks(), center_x, center_y)
+        self.render(surface, center_x, center_y)
+        return complete
+    
     def _add_drip(self, char_index: int, center_x: int, center_y: int):
         """Add a blood drip animation at character position"""
-        # Calculate x position for this character
-        text_before = self.text[:char_index]
-        start_x = center_x - self.get_text_width(self.text) // 2
-        x = start_x + self.get_text_width(text_before) + self.font.size(self.text[char_index])[0] // 2
-        
-        self.drips.append({
-            'x': x,
-            'y': center_y + self.font_size // 2,
-            'speed': 2,
-            'size': 4,
-            'alpha': 255
-        })
-    
-    def _update_drips(self, surface: pygame.Surface):
-        """Update and draw blood drips"""
-        for drip in self.drips[:]:
-            # Draw drip
-            drip_color = (*BLOOD_DRIP[:3], drip['alpha']) if drip['alpha'] < 255 else BLOOD_DRIP
-            pygame.draw.circle(surface, BLOOD_DRIP, (int(drip['x']), int(drip['y'])), drip['size'])
-            
-            # Update drip
-            drip['y'] += drip['speed']
-            drip['size'] = max(1, drip['size'] - 0.02)
-            drip['alpha'] = max(0, drip['alpha'] - 2)
-            
-            # Remove faded drips
-            if drip['alpha'] <= 0 or drip['y'] > self.display.screen_height:
-                self.drips.remove(drip)
+        # Calculate x position for this character from the layout table
+        start_x = center_x - self.text_width // 2
+        x = start_x + self.glyph_offsets[char_index] + self.atlas.advance(self.text[char_index]) // 2
+        
+        self.drips.emit(x, center_y + self.font_size // 2, vy=2, size=4)
+
+
+class ScaledSpriteCache:
+    """
+    Pre-scaled, display-converted copies of one sprite asset with alpha baked in
+    Keyed by quantized scale and alpha, bounded by memory (least recently used is evicted);
+    emptied when the display format changes
+    """
+    
+    def __init__(self, asset: Asset, scale_step: float = 0.01, alpha_step: int = 8,
+                 max_bytes: int = 96 * 1024 * 1024):
+        self.asset = asset
+        self.scale_step = scale_step
+        self.alpha_step = alpha_step
+        self.max_bytes = max_bytes
+        self.frames: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes_used = 0
+        self._load_sprite()
+    
+    def _load_sprite(self):
+        """Take the (cropped) sprite from the asset, dropping frames scaled from an older one"""
+        self.sprite = self._crop_centered(self.asset.surface)
+        self.generation = assets.generation
+        self.clear()
+    
+    @staticmethod
+    def _crop_centered(sprite: pygame.Surface) -> pygame.Surface:
+        """Trim fully transparent margins evenly on all sides, keeping the sprite centered"""
+        bounds = sprite.get_bounding_rect()
+        width, height = sprite.get_size()
+        margin = min(bounds.left, bounds.top, width - bounds.right, height - bounds.bottom)
+        if margin <= 0:
+            return sprite
+        return sprite.subsurface((margin, margin, width - 2 * margin, height - 2 * margin)).copy()
+    
+    def get(self, scale: float, alpha: int = 255, smooth: bool = True) -> pygame.Surface:
+        """
+        Get the sprite at the nearest quantized scale and alpha
+        Baking alpha avoids the slow surface-alpha + per-pixel-alpha blit path
+        smooth: filter with smoothscale (slower to build) rather than scale
+        """
+        if self.generation != assets.generation:
+            self._load_sprite()
+        
+        scale_key = max(1, int(round(scale / self.scale_step)))
+        alpha_key = min(255, int(round(alpha / self.alpha_step)) * self.alpha_step)
+        key = (scale_key, alpha_key, smooth)
+        
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+            return frame
+        
+        size = max(1, int(self.sprite.get_width() * scale_key * self.scale_step))
+        if smooth:
+            frame = pygame.transform.smoothscale(self.sprite, (size, size))
+        else:
+            frame = pygame.transform.scale(self.sprite, (size, size))
+        if alpha_key < 255:
+            frame.fill((255, 255, 255, alpha_key), special_flags=pygame.BLEND_RGBA_MULT)
+        frame = assets.convert(frame)
+        
+        self.frames[key] = frame
+        self.bytes_used += size * size * 4
+        
+        # Evict least recently used frames, always keeping the newest one
+        while self.bytes_used > self.max_bytes and len(self.frames) > 1:
+            _, old = self.frames.popitem(last=False)
+            self.bytes_used -= old.get_width() * old.get_height() * 4
+        
+        return frame
+    
+    def clear(self):
+        """Drop all cached frames"""
+        self.frames.clear()
+        self.bytes_used = 0
 
 
 class GlowingEyes:
@@ -162,6 +479,7 @@ class GlowingEyes:
         self.alpha = 0
         self.breath_phase = 0
         self.state_start_time = 0
+        self.now_ms = 0
         
         # Timing (ms)
         self.fade_in_duration = 1000
@@ -169,45 +487,51 @@ class GlowingEyes:
         self.fade_out_duration = 500
         
         # Create eye surfaces
+        self.glow_layers = display.quality.settings['glow_layers']
+        self._release_eye: Optional[weakref.finalize] = None
         self._create_eye_surfaces()
     
     def _create_eye_surfaces(self):
-        """Create the glowing eye sprites"""
-        # Main eye surface with glow
-        size = self.eye_size * 3  # Extra space for glow
-        self.eye_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        center = size // 2
-        
-        # Outer glow layers
-        for i in range(5, 0, -1):
-            glow_size = self.eye_size // 2 + i * 8
-            glow_alpha = 50 - i * 8
-            glow_color = (*PURPLE_GLOW, max(0, glow_alpha))
-            pygame.draw.circle(self.eye_surface, glow_color, (center, center), glow_size)
-        
-        # Main eye (bright center)
-        pygame.draw.circle(self.eye_surface, PURPLE_GLOW, (center, center), self.eye_size // 2)
-        
-        # Inner bright core
-        core_color = (200, 150, 255)  # Lighter purple
-        pygame.draw.circle(self.eye_surface, core_color, (center, center), self.eye_size // 4)
-        
-        # Pupil (dark center)
-        pygame.draw.circle(self.eye_surface, (20, 0, 30), (center, center), self.eye_size // 8)
+        """Create the glowing eye sprites, releasing the ones for the previous glow level"""
+        # Gaussian glow as wide as the old glow rings (8px each), bright core
+        # in a lighter purple, dark pupil; generated once and cached on disk
+        eye_size, glow_px = self.eye_size, self.glow_layers * 8
+        asset = assets.acquire(f"eye/{eye_size}/{glow_px}", lambda: eye_sprite(
+            eye_size,
+            glow_px=glow_px,
+            glow_color=PURPLE_GLOW,
+            core_color=(200, 150, 255),
+            pupil_color=(20, 0, 30),
+        ))
+        # Like assets.hold(), but the old sprite is let go as soon as it is replaced
+        if self._release_eye is not None:
+            self._release_eye()
+        self._release_eye = weakref.finalize(self, assets.release, asset)
+        self.eye_asset = asset
+        self.sprite_cache = ScaledSpriteCache(asset)
     
-    def start(self):
-        """Start the animation sequence"""
+    def start(self, now_ms: Optional[int] = None):
+        """
+        Start the animation sequence (at now_ms, default: the display clock)
+        A glow level change since the last start is applied here, before
+        the eyes are visible, instead of stalling a frame mid-animation
+        """
+        glow_layers = self.display.quality.settings['glow_layers']
+        if glow_layers != self.glow_layers:
+            self.glow_layers = glow_layers
+            self._create_eye_surfaces()
         self.state = 'fade_in'
-        self.state_start_time = pygame.time.get_ticks()
+        self.state_start_time = self.display.clock.get_ticks() if now_ms is None else now_ms
+        self.now_ms = self.state_start_time
         self.alpha = 0
     
-    def update(self) -> bool:
+    def update(self, now_ms: Optional[int] = None) -> bool:
         """
-        Update animation state
+        Update animation state (at now_ms, default: the display clock)
         Returns True when animation is complete (after fade out)
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.display.clock.get_ticks() if now_ms is None else now_ms
+        self.now_ms = current_time
         elapsed = current_time - self.state_start_time
         
         if self.state == 'fade_in':
@@ -237,6 +561,16 @@ class GlowingEyes:
         
         return False
     
+    def _sprite(self, scale: float, alpha: int) -> pygame.Surface:
+        """Cached eye sprite (glow level as of start(), filtering as of now)"""
+        return self.sprite_cache.get(scale, alpha, self.display.quality.settings['smooth_scale'])
+    
+    def get_breath_scale(self) -> float:
+        """Get the current breathing scale factor"""
+        if self.state == 'breathing':
+            return 1.0 + 0.05 * math.sin(self.breath_phase)
+        return 1.0
+    
     def draw(self, surface: pygame.Surface):
         """Draw the eyes on the surface"""
         if self.alpha <= 0:
@@ -244,25 +578,98 @@ class GlowingEyes:
         
         center_x, center_y = self.display.get_center()
         
-        # Apply breathing scale effect
-        scale = 1.0
-        if self.state == 'breathing':
-            scale = 1.0 + 0.05 * math.sin(self.breath_phase)
-        
-        # Scale eye surface
-        scaled_size = int(self.eye_surface.get_width() * scale)
-        scaled_eye = pygame.transform.scale(self.eye_surface, (scaled_size, scaled_size))
-        scaled_eye.set_alpha(self.alpha)
+        # Apply breathing scale effect (pre-scaled frames come from the cache)
+        scaled_eye = self._sprite(self.get_breath_scale(), self.alpha)
+        scaled_size = scaled_eye.get_width()
         
         # Draw left eye
         left_x = center_x - self.spacing // 2 - scaled_size // 2
         left_y = center_y - scaled_size // 2
-        surface.blit(scaled_eye, (left_x, left_y))
+        left_rect = surface.blit(scaled_eye, (left_x, left_y))
         
         # Draw right eye
         right_x = center_x + self.spacing // 2 - scaled_size // 2
         right_y = center_y - scaled_size // 2
-        surface.blit(scaled_eye, (right_x, right_y))
+        right_rect = surface.blit(scaled_eye, (right_x, right_y))
+        self.display.mark_dirty(left_rect, right_rect)
+
+
+# Pixels the eye swarm may blend per frame; the frame time is dominated by
+# this fill, and the sprites grow with the screen height
+SWARM_FILL_BUDGET_PX = 3_500_000
+
+
+class EyeSwarm(GlowingEyes):
+    """
+    Hundreds of eye pairs at different depths
+    Shares the GlowingEyes fade/breathe timing; eyes are grouped into depth
+    layers so each layer is one batched blits() call of a cached sprite
+    count is an upper bound: on large screens fewer pairs are placed, so
+    the sprites blended per frame stay within SWARM_FILL_BUDGET_PX
+    """
+    
+    def __init__(self, display, count: int = 200, size_scale: float = 0.05,
+                 depth_layers: int = 6, seed: Optional[int] = None):
+        super().__init__(display, size_scale=size_scale)
+        self.depth_layers = max(1, depth_layers)
+        
+        # Each layer: (depth scale, brightness, list of pair centers)
+        rng = random.Random(seed)
+        margin_x = self.display.screen_width // 10
+        margin_y = self.display.screen_height // 10
+        self.layers = []
+        for layer in range(self.depth_layers):
+            depth = (layer + 1) / self.depth_layers  # 0 = far, 1 = near
+            self.layers.append((0.3 + 0.7 * depth, 0.3 + 0.7 * depth, []))
+        
+        # Average pixels one pair fills (two sprites at a random depth's scale)
+        sprite_area = self.sprite_cache.sprite.get_width() * self.sprite_cache.sprite.get_height()
+        pair_px = 2 * sprite_area * sum(scale * scale for scale, _, _ in self.layers) / self.depth_layers
+        self.count = max(1, min(count, int(SWARM_FILL_BUDGET_PX / pair_px)))
+        for _ in range(self.count):
+            layer = rng.randrange(self.depth_layers)
+            x = rng.randint(-margin_x, self.display.screen_width + margin_x)
+            y = rng.randint(-margin_y, self.display.screen_height + margin_y)
+            self.layers[layer][2].append((x, y))
+        
+        # Parallax sway in pixels for the nearest layer
+        self.sway = self.eye_size // 2
+    
+    def draw(self, surface: pygame.Surface):
+        """Draw every visible eye pair, one batched blit per depth layer"""
+        if self.alpha <= 0:
+            return
+        
+        breath = self.get_breath_scale()
+        phase = self.now_ms / 1000
+        clip = surface.get_clip()
+        
+        for depth_scale, brightness, centers in self.layers:
+            sprite = self._sprite(depth_scale * breath, int(self.alpha * brightness))
+            size = sprite.get_width()
+            half = size // 2
+            spacing = int(self.spacing * depth_scale) // 2
+            
+            # Nearer layers sway further (parallax)
+            dx = int(math.sin(phase * 0.5) * self.sway * depth_scale)
+            dy = int(math.cos(phase * 0.3) * self.sway * depth_scale * 0.5)
+            
+            # Cull pairs whose sprites fall entirely off-screen
+            min_x = clip.left - half - spacing - dx
+            max_x = clip.right + half + spacing - dx
+            min_y = clip.top - half - dy
+            max_y = clip.bottom + half - dy
+            
+            blits = []
+            for x, y in centers:
+                if min_x < x < max_x and min_y < y < max_y:
+                    top = y + dy - half
+                    blits.append((sprite, (x + dx - spacing - half, top)))
+                    blits.append((sprite, (x + dx + spacing - half, top)))
+            
+            if blits:
+                rects = surface.blits(blits)
+                self.display.mark_dirty(rects[0].unionall(rects))
 
 
 class TextInput:
@@ -291,75 +698,193 @@ class TextInput:
                 self.input_text += event.unicode
         return None
     
-    def draw(self, surface: pygame.Surface):
-        """Draw the prompt and input field"""
+    def draw(self, surface: pygame.Surface, now_ms: Optional[int] = None):
+        """Draw the prompt and input field (cursor blinks by now_ms, default: the display clock)"""
         center_x, center_y = self.display.get_center()
         
         # Update cursor blink
-        current_time = pygame.time.get_ticks()
+        current_time = self.display.clock.get_ticks() if now_ms is None else now_ms
         if current_time - self.cursor_timer > 500:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = current_time
         
-        # Draw prompt (purple glow color)
-        prompt_surface = self.font.render(self.prompt, True, PURPLE_GLOW)
+        # Draw prompt (purple glow color); text comes from the shared cache,
+        # so neither the prompt nor a cursor blink re-renders anything
+        prompt_surface = text_cache.render(self.font, self.prompt, PURPLE_GLOW)
         prompt_x = center_x - prompt_surface.get_width() // 2
         prompt_y = center_y - self.font_size
-        surface.blit(prompt_surface, (prompt_x, prompt_y))
+        prompt_rect = surface.blit(prompt_surface, (prompt_x, prompt_y))
         
         # Draw input text with cursor
         display_text = self.input_text
         if self.cursor_visible:
             display_text += "_"
         
-        input_surface = self.font.render(display_text, True, (255, 255, 255))
+        input_surface = text_cache.render(self.font, display_text, (255, 255, 255))
         input_x = center_x - input_surface.get_width() // 2
         input_y = center_y + 10
-        surface.blit(input_surface, (input_x, input_y))
+        input_rect = surface.blit(input_surface, (input_x, input_y))
+        self.display.mark_dirty(prompt_rect, input_rect)
 
 
 class MessageDisplay:
     """Display a message with fade in/out"""
     
-    def __init__(self, display, message: str, color: tuple = PURPLE_GLOW, font_scale: float = 0.08):
+    def __init__(self, display, message: str, color: tuple = PURPLE_GLOW, font_scale: float = 0.08,
+                 glow: Optional[tuple] = None):
+        """glow: halo color for a glowing message (the bloomed text is cached on disk)"""
         self.display = display
         self.message = message
         self.color = color
         self.font_size = display.get_font_size(font_scale)
         self.font = get_horror_font(self.font_size)
         self.alpha = 0
+        
+        # Plain text comes from the shared text cache; bloomed text is an asset
+        self.glow_asset = None
+        self._glow_source: Optional[pygame.Surface] = None  # Asset surface the copy was made from
+        self._glow_surface: Optional[pygame.Surface] = None  # Private copy that takes the alpha
+        if glow is not None:
+            # The builder holds the font, not this object
+            font, font_size = self.font, self.font_size
+            self.glow_asset = assets.hold(
+                self, f"message/{font_size}/{color}/{glow}/{message}",
+                lambda: bloom(font.render(message, True, color), glow, sigma=font_size * 0.12),
+            )
     
     def show(self, duration_ms: int = 2000, fade_in_ms: int = 500, fade_out_ms: int = 500):
         """Show the message with fade in and out"""
-        start_time = pygame.time.get_ticks()
-        total_duration = fade_in_ms + duration_ms + fade_out_ms
-        
-        while pygame.time.get_ticks() - start_time < total_duration:
-            elapsed = pygame.time.get_ticks() - start_time
-            
-            # Calculate alpha based on phase
-            if elapsed < fade_in_ms:
-                self.alpha = int(255 * (elapsed / fade_in_ms))
-            elif elapsed < fade_in_ms + duration_ms:
-                self.alpha = 255
-            else:
-                fade_elapsed = elapsed - fade_in_ms - duration_ms
-                self.alpha = int(255 * (1 - fade_elapsed / fade_out_ms))
-            
-            self.display.clear()
-            self.draw(self.display.screen)
-            self.display.update()
-            
-            if not self.display.running:
-                break
+        timeline = Timeline(self.display)
+        timeline.add(MessageTrack(self, duration_ms, fade_in_ms, fade_out_ms))
+        timeline.run()
+    
+    def update(self, elapsed: float, duration_ms: int, fade_in_ms: int, fade_out_ms: int):
+        """Set alpha for a point elapsed ms into a show() with the given timings"""
+        if elapsed < fade_in_ms:
+            self.alpha = int(255 * (elapsed / fade_in_ms))
+        elif elapsed < fade_in_ms + duration_ms:
+            self.alpha = 255
+        elif fade_out_ms <= 0:
+            self.alpha = 0
+        else:
+            fade_elapsed = elapsed - fade_in_ms - duration_ms
+            self.alpha = max(0, int(255 * (1 - fade_elapsed / fade_out_ms)))
     
     def draw(self, surface: pygame.Surface):
         """Draw the message"""
         center_x, center_y = self.display.get_center()
         
-        text_surface = self.font.render(self.message, True, self.color)
-        text_surface.set_alpha(self.alpha)
+        if self.glow_asset is not None:
+            # Alpha goes on a private copy so the shared asset stays untouched
+            source = self.glow_asset.surface
+            if source is not self._glow_source:
+                self._glow_source = source
+                self._glow_surface = source.copy()
+            text_surface = self._glow_surface
+            text_surface.set_alpha(self.alpha if self.alpha < 255 else None)
+        else:
+            text_surface = text_cache.render(self.font, self.message, self.color, alpha=self.alpha)
         
         x = center_x - text_surface.get_width() // 2
         y = center_y - text_surface.get_height() // 2
-        surface.blit(text_surface, (x, y))
+        self.display.mark_dirty(surface.blit(text_surface, (x, y)))
+
+
+class BloodTextTrack(Track):
+    """
+    Timeline track for BloodText; keeps the finished text up for hold_ms
+    blood_text may be None until just before the track begins (see prewarm)
+    """
+    
+    def __init__(self, blood_text: Optional[BloodText], center: tuple, hold_ms: float = 0):
+        super().__init__()
+        self.blood_text = blood_text
+        self.center = center
+        self.hold_ms = hold_ms
+        self.complete_ms: Optional[float] = None
+    
+    def begin(self, timeline: Timeline, now_ms: float):
+        self.frame_ms = timeline.step_ms
+        self.blood_text.last_char_time = now_ms
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        complete = self.blood_text.update(int(now_ms), *self.center, dt=dt_ms / (1000 / 60))
+        if complete and self.complete_ms is None:
+            self.complete_ms = now_ms
+        return self.complete_ms is not None and now_ms - self.complete_ms >= self.hold_ms
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        self.blood_text.render(surface, *self.center)
+
+
+class EyesTrack(Track):
+    """
+    Timeline track for GlowingEyes (or EyeSwarm); ends after the fade out
+    eyes may be None until just before the track begins (see prewarm);
+    on_fade_out is called once when the eyes start fading out
+    """
+    
+    def __init__(self, eyes: Optional[GlowingEyes],
+                 on_fade_out: Optional[Callable[[], None]] = None):
+        super().__init__()
+        self.eyes = eyes
+        self.on_fade_out = on_fade_out
+    
+    def begin(self, timeline: Timeline, now_ms: float):
+        self.eyes.start(int(now_ms))
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        finished = self.eyes.update(int(now_ms))
+        if self.on_fade_out is not None and (finished or getattr(self.eyes, 'state', None) == 'fade_out'):
+            callback, self.on_fade_out = self.on_fade_out, None
+            callback()
+        return finished
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        self.eyes.draw(surface)
+
+
+class MessageTrack(Track):
+    """Timeline track for MessageDisplay with fade in/out"""
+    
+    def __init__(self, message: MessageDisplay, duration_ms: int = 2000,
+                 fade_in_ms: int = 500, fade_out_ms: int = 500):
+        super().__init__(fade_in_ms + duration_ms + fade_out_ms)
+        self.message = message
+        self.timings = (duration_ms, fade_in_ms, fade_out_ms)
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        self.message.update(now_ms - self.start_ms, *self.timings)
+        return False
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        self.message.draw(surface)
+
+
+class PromptTrack(Track):
+    """
+    Timeline track for TextInput; ends when Enter or Escape is pressed
+    result holds the typed text, escaped is True if Escape ended it
+    """
+    
+    events = (pygame.KEYDOWN,)
+    
+    def __init__(self, text_input: TextInput):
+        super().__init__()
+        self.text_input = text_input
+        self.result: Optional[str] = None
+        self.escaped = False
+    
+    def handle_event(self, event):
+        if self.result is not None or self.escaped:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.escaped = True
+        else:
+            self.result = self.text_input.handle_event(event)
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        return self.escaped or self.result is not None
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        self.text_input.draw(surface, int(now_ms))
@@ -5,49 +5,36 @@ Detects terminal and launches Ekphos, monitors for exit
 
 import os
 import subprocess
-import shutil
 from typing import Optional, List
 
+from .capabilities import get_capabilities
+from .supervisor import ProcessSupervisor
+
 
 def find_terminal() -> Optional[List[str]]:
     """
     Find an available terminal emulator
     Returns the terminal command with fullscreen flags, or None if not found
     """
-    # Terminals in order of preference with fullscreen flags
-    # Format: (binary_name, [command, fullscreen_flags..., exec_flag])
-    terminals = [
-        ("kitty", ["kitty", "--start-as=fullscreen"]),
-        ("alacritty", ["alacritty", "--option", "window.startup_mode=Fullscreen", "-e"]),
-        ("foot", ["foot", "--fullscreen"]),
-        ("wezterm", ["wezterm", "start", "--maximized"]),  # wezterm doesn't have true fullscreen flag
-        ("ghostty", ["ghostty", "--fullscreen"]),
-        ("konsole", ["konsole", "--fullscreen", "-e"]),
-        ("gnome-terminal", ["gnome-terminal", "--full-screen", "--"]),
-        ("xfce4-terminal", ["xfce4-terminal", "--fullscreen", "-x"]),
-        ("xterm", ["xterm", "-fullscreen", "-e"]),
-        ("urxvt", ["urxvt", "-e"]),  # urxvt doesn't have fullscreen flag
-        ("st", ["st", "-e"]),  # st doesn't have fullscreen flag
-    ]
-    
-    for name, cmd in terminals:
-        if shutil.which(name):
-            return cmd
-    
-    return None
+    return get_capabilities().terminal_cmd
 
 
 def check_ekphos_installed() -> bool:
     """Check if ekphos is installed"""
-    return shutil.which("ekphos") is not None
+    return get_capabilities().ekphos is not None
 
 
 class EkphosLauncher:
-    """Launch and monitor Ekphos"""
+    """
+    Launch and monitor Ekphos
+    The process is tracked by a ProcessSupervisor; work scheduled on it
+    (supervisor.call_soon/call_later) runs while wait_for_exit() waits
+    """
     
     def __init__(self):
         self.process: Optional[subprocess.Popen] = None
         self.terminal_cmd: Optional[List[str]] = None
+        self.supervisor = ProcessSupervisor()
     
     def check_requirements(self) -> tuple[bool, str]:
         """
@@ -61,7 +48,7 @@ class EkphosLauncher:
         if not self.terminal_cmd:
             return False, "No terminal emulator found!"
         
-        return True, f"Ready to launch with {self.terminal_cmd[0]}"
+        return True, f"Ready to launch with {get_capabilities().terminal_name}"
     
     def launch(self, working_dir: Optional[str] = None) -> bool:
         """
@@ -74,8 +61,8 @@ class EkphosLauncher:
                 print("Error: No terminal found")
                 return False
         
-        # Build command: terminal + ekphos
-        cmd = self.terminal_cmd + ["ekphos"]
+        # Build command: terminal + ekphos (resolved paths, so nothing searches PATH)
+        cmd = self.terminal_cmd + [get_capabilities().ekphos or "ekphos"]
         
         # Set working directory (use home if not specified)
         cwd = working_dir or os.path.expanduser("~")
@@ -90,6 +77,7 @@ class EkphosLauncher:
                 start_new_session=True
             )
             print(f"Launched Ekphos with PID {self.process.pid}")
+            self.supervisor.watch(self.process)
             return True
             
         except Exception as e:
@@ -104,21 +92,21 @@ class EkphosLauncher:
         # poll() returns None if process is still running
         return self.process.poll() is None
     
-    def wait_for_exit(self) -> int:
+    def wait_for_exit(self, timeout_s: Optional[float] = None) -> Optional[int]:
         """
-        Wait for Ekphos to exit
-        Returns the exit code
+        Wait for Ekphos to exit, running the supervisor's scheduled work meanwhile
+        Returns the exit code, or None if timeout_s passed first
         """
         if self.process is None:
             return -1
         
-        return self.process.wait()
+        return self.supervisor.wait(timeout_s)
     
-    def terminate(self):
-        """Force terminate Ekphos if running"""
+    def terminate(self, grace_s: float = 5.0):
+        """Terminate Ekphos if running (killed if it outlives grace_s)"""
         if self.process and self.is_running():
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
+            self.supervisor.terminate(grace_s)
+    
+    def close(self):
+        """Stop supervising (Ekphos itself is left alone)"""
+        self.supervisor.close()
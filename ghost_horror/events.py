@@ -0,0 +1,97 @@
+"""
+Event Dispatcher for Ghost Horror Mode
+Pumps the SDL queue once per frame, keeps it limited to the event types
+in use, routes events to subscribers and measures input latency
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pygame
+
+from .profiler import Histogram
+
+
+# Event types the queue accepts besides those with subscribers
+# (TEXTINPUT stays allowed: pygame fills KEYDOWN.unicode from it)
+BASE_ALLOWED = [pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT, pygame.WINDOWEXPOSED]
+
+
+class EventDispatcher:
+    """
+    Single owner of the event queue
+    Handlers subscribe per event type (None for every event). Keypresses
+    are timed from the pump that delivered them to the end of the next
+    present, which is when the response is on screen
+    """
+    
+    def __init__(self, allowed: Iterable[int] = BASE_ALLOWED):
+        self.base_allowed = set(allowed)
+        self.handlers: Dict[Optional[int], List[Callable]] = {}
+        self.latency = Histogram()  # Keypress-to-present, ms
+        self.latency_samples: deque = deque(maxlen=4096)
+        self._key_times: List[float] = []
+    
+    def apply_filter(self):
+        """Block every event type except the allowed and subscribed ones"""
+        allowed = self.base_allowed | {event_type for event_type in self.handlers if event_type is not None}
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(sorted(allowed))
+    
+    def subscribe(self, event_type: Optional[int], handler: Callable):
+        """Call handler(event) for every event of event_type (None: all events)"""
+        handlers = self.handlers.setdefault(event_type, [])
+        handlers.append(handler)
+        if event_type is not None and event_type not in self.base_allowed and len(handlers) == 1:
+            self.apply_filter()
+    
+    def unsubscribe(self, event_type: Optional[int], handler: Callable):
+        """Stop calling handler for event_type"""
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self.handlers[event_type]
+    
+    def pump(self) -> list:
+        """Drain the queue once, dispatching every event; returns the events"""
+        events = pygame.event.get()
+        if not events:
+            return events
+        
+        now = time.perf_counter()
+        catch_all = self.handlers.get(None, ())
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self._key_times.append(now)
+            # Copies, so handlers may unsubscribe while being called
+            for handler in tuple(self.handlers.get(event.type, ())) + tuple(catch_all):
+                handler(event)
+        return events
+    
+    def presented(self):
+        """Call once a frame is on screen: records latency for keys pumped since the last one"""
+        if not self._key_times:
+            return
+        now = time.perf_counter()
+        for pumped in self._key_times:
+            ms = (now - pumped) * 1000
+            self.latency.add(ms)
+            self.latency_samples.append(ms)
+        self._key_times = []
+    
+    def reset_latency(self):
+        """Forget recorded latencies"""
+        self.latency = Histogram()
+        self.latency_samples.clear()
+        self._key_times = []
+    
+    def stats(self) -> dict:
+        """Keypress-to-present latency for the report"""
+        ordered = sorted(self.latency_samples)
+        return {
+            'keypress_to_present': self.latency.to_dict(),
+            'p50_ms': ordered[len(ordered) // 2] if ordered else 0.0,
+            'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0,
+        }
@@ -0,0 +1,59 @@
+"""
+Fake Terminal for Ghost Horror Mode
+Stand-in for a terminal emulator when timing the handoff: maps a plain
+X11 window after a delay and stays open until it is terminated
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+
+from Xlib import X
+from Xlib.display import Display as XDisplay
+
+
+def main(argv=None) -> int:
+    """Entry point; anything after the options (the Ekphos command) is ignored"""
+    parser = argparse.ArgumentParser(prog="fake-terminal", description="Map a window like a slow terminal would")
+    parser.add_argument("--map-delay", type=float, default=200, metavar="MS",
+                        help="start-up time to simulate before the window maps (default 200 ms)")
+    parser.add_argument("--no-pid", action="store_true",
+                        help="don't set _NET_WM_PID, like some terminals")
+    parser.add_argument("--server", action="store_true",
+                        help="exit at once and map the window from a detached process, like gnome-terminal")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="ignored")
+    args = parser.parse_args(argv)
+    
+    if args.server:
+        if os.fork():
+            return 0
+        os.setsid()
+    
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    x_display = XDisplay()
+    screen = x_display.screen()
+    window = screen.root.create_window(
+        0, 0, screen.width_in_pixels, screen.height_in_pixels, 0, screen.root_depth,
+        X.InputOutput, X.CopyFromParent, background_pixel=screen.black_pixel,
+    )
+    window.set_wm_name("fake-terminal")
+    window.set_wm_class("fake-terminal", "Fake-terminal")
+    window.set_wm_client_machine(socket.gethostname())
+    if not args.no_pid:
+        window.change_property(x_display.intern_atom('_NET_WM_PID'), x_display.intern_atom('CARDINAL'),
+                               32, [os.getpid()])
+    
+    time.sleep(args.map_delay / 1000)
+    window.map()
+    x_display.flush()
+    
+    while True:
+        x_display.next_event()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
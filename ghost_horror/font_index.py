@@ -0,0 +1,130 @@
+"""
+Persistent Font Index for Ghost Horror Mode
+Resolves font names to file paths once and caches them on disk,
+so pygame never has to shell out to fontconfig on startup
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+
+INDEX_VERSION = 1
+
+# Where fontconfig normally looks for fonts on Linux
+FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/.fonts"),
+]
+
+
+def get_cache_dir() -> str:
+    """Get the Ghost Horror cache directory (XDG_CACHE_HOME aware)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser("~/.cache")
+    return os.path.join(base, "ghost-horror")
+
+
+def _font_dir_mtimes() -> Dict[str, float]:
+    """
+    Get mtimes of the font directories and their immediate subdirectories
+    Installing or removing a font family touches at least one of these
+    """
+    mtimes = {}
+    for font_dir in FONT_DIRS:
+        try:
+            mtimes[font_dir] = os.stat(font_dir).st_mtime
+            with os.scandir(font_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        mtimes[entry.path] = entry.stat().st_mtime
+        except OSError:
+            continue
+    return mtimes
+
+
+class FontIndex:
+    """
+    On-disk map of font name -> font file path
+    Invalidated whenever the font directory mtimes change
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_cache_dir(), "fonts.json")
+        self.fonts: Dict[str, Optional[str]] = {}
+        self.mtimes: Dict[str, float] = {}
+        self.dirty = False
+        self._load()
+    
+    def _load(self):
+        """Load the index from disk, discarding it if stale"""
+        self.mtimes = _font_dir_mtimes()
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if data.get('version') != INDEX_VERSION or data.get('mtimes') != self.mtimes:
+            return
+        self.fonts = data.get('fonts', {})
+    
+    def save(self):
+        """Write the index to disk if it changed"""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': INDEX_VERSION, 'mtimes': self.mtimes, 'fonts': self.fonts}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Failed to save font index: {e}")
+    
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Resolve a font name to a file path
+        Only falls back to pygame's fontconfig scan on a cache miss
+        """
+        if name in self.fonts:
+            path = self.fonts[name]
+            if path is None or os.path.exists(path):
+                return path
+        
+        import pygame
+        try:
+            path = pygame.font.match_font(name)
+        except Exception:
+            path = None
+        
+        self.fonts[name] = path
+        self.dirty = True
+        return path
+    
+    def resolve_first(self, names: List[str]) -> Optional[str]:
+        """Resolve the first available font from a list of names"""
+        for name in names:
+            path = self.resolve(name)
+            if path:
+                return path
+        return None
+
+
+# Resolved once per process, survives pygame.quit()
+_resolved_paths: Dict[tuple, Optional[str]] = {}
+
+
+def find_font_path(names: List[str]) -> Optional[str]:
+    """
+    Find the file path of the first available font in names
+    Memoized in-process and persisted to the on-disk index
+    """
+    key = tuple(names)
+    if key not in _resolved_paths:
+        index = FontIndex()
+        _resolved_paths[key] = index.resolve_first(names)
+        index.save()
+    return _resolved_paths[key]
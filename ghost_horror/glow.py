@@ -0,0 +1,179 @@
+"""
+Glow Sprites for Ghost Horror Mode
+Vectorized radial glow and bloom built with NumPy, cached on disk by
+size and palette so later launches load them instead of rebuilding
+"""
+
+import hashlib
+import json
+import math
+import os
+from typing import Callable, Dict
+
+import numpy as np
+import pygame
+
+from .font_index import get_cache_dir
+
+
+CACHE_VERSION = 1
+
+# Sprites already built or loaded by this process, by cache key
+_memory: Dict[str, np.ndarray] = {}
+
+
+def _box_blur(values: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """Running-sum box blur of width 2 * radius + 1 along one axis (zero outside)"""
+    if radius < 1:
+        return values
+    n = values.shape[axis]
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (radius + 1, radius)
+    sums = np.cumsum(np.pad(values, pad), axis=axis, dtype=np.float32)
+    upper = [slice(None)] * values.ndim
+    lower = [slice(None)] * values.ndim
+    upper[axis] = slice(2 * radius + 1, 2 * radius + 1 + n)
+    lower[axis] = slice(0, n)
+    return (sums[tuple(upper)] - sums[tuple(lower)]) / (2 * radius + 1)
+
+
+def gaussian_blur(values: np.ndarray, sigma: float) -> np.ndarray:
+    """
+    Separable Gaussian blur of a 2-D array
+    Three box passes per axis approximate the Gaussian in O(pixels) for any sigma
+    """
+    # Three boxes of width w have variance 3 * (w^2 - 1) / 12 = sigma^2
+    radius = int(round((math.sqrt(4 * sigma * sigma + 1) - 1) / 2))
+    result = values.astype(np.float32)
+    for axis in (0, 1):
+        for _ in range(3):
+            result = _box_blur(result, radius, axis)
+    return result
+
+
+def _coverage(distance: np.ndarray, radius: float) -> np.ndarray:
+    """Anti-aliased coverage of a disk from a distance field"""
+    return np.clip(radius - distance + 0.5, 0.0, 1.0)
+
+
+def _composite(layers) -> np.ndarray:
+    """
+    Stack (color, alpha array) layers bottom to top with "over"
+    A color is an RGB tuple or a (height, width, 3) array of per-pixel colors
+    Returns an (height, width, 4) uint8 RGBA array
+    """
+    rgb = None
+    alpha = None
+    for color, layer_alpha in layers:
+        premultiplied = layer_alpha[..., None] * (np.asarray(color, dtype=np.float32)[..., :3] / 255)
+        if rgb is None:
+            rgb, alpha = premultiplied, layer_alpha
+        else:
+            rgb = premultiplied + rgb * (1 - layer_alpha[..., None])
+            alpha = layer_alpha + alpha * (1 - layer_alpha)
+    
+    # Back to straight alpha for pygame
+    safe = np.where(alpha > 0, alpha, 1.0)[..., None]
+    rgba = np.empty(alpha.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = np.clip(rgb / safe * 255 + 0.5, 0, 255)
+    rgba[..., 3] = np.clip(alpha * 255 + 0.5, 0, 255)
+    return rgba
+
+
+def _to_surface(rgba: np.ndarray) -> pygame.Surface:
+    """Copy an (height, width, 4) RGBA array into a new per-pixel alpha surface"""
+    height, width = rgba.shape[:2]
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[...] = rgba[..., :3].transpose(1, 0, 2)
+    del pixels
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    alpha[...] = rgba[..., 3].T
+    del alpha
+    return surface
+
+
+def _cached(kind: str, params: dict, build: Callable[[], np.ndarray]) -> pygame.Surface:
+    """
+    Load a sprite from the disk cache, or build and store it
+    Cache files are keyed by a hash of the kind and every parameter
+    """
+    key = hashlib.sha1(json.dumps([CACHE_VERSION, kind, params], sort_keys=True).encode()).hexdigest()
+    rgba = _memory.get(key)
+    if rgba is None:
+        path = os.path.join(get_cache_dir(), "glow", f"{kind}-{key[:16]}.npy")
+        try:
+            rgba = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            rgba = build()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = path + ".tmp.npy"
+                np.save(tmp_path, rgba, allow_pickle=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Warning: Failed to cache glow sprite: {e}")
+        _memory[key] = rgba
+    return _to_surface(rgba)
+
+
+def eye_sprite(eye_size: int, glow_px: int, glow_color: tuple, core_color: tuple,
+               pupil_color: tuple) -> pygame.Surface:
+    """
+    A glowing eye: Gaussian halo glow_px wide (0 for none) around an
+    anti-aliased iris, bright core and pupil
+    """
+    params = {
+        'eye_size': eye_size, 'glow_px': glow_px,
+        'glow_color': list(glow_color), 'core_color': list(core_color), 'pupil_color': list(pupil_color),
+    }
+    
+    def build() -> np.ndarray:
+        radius = eye_size / 2
+        sigma = max(1.0, glow_px / 2.5)
+        extent = int(math.ceil(radius + (3 * sigma if glow_px else 0))) + 1
+        size = 2 * extent + 1
+        ys, xs = np.mgrid[0:size, 0:size].astype(np.float32) - extent
+        distance = np.sqrt(xs * xs + ys * ys)
+        
+        layers = []
+        if glow_px:
+            # Smooth falloff outside the iris instead of stacked rings
+            halo = 0.45 * np.exp(-np.square(np.maximum(distance - radius, 0)) / (2 * sigma * sigma))
+            layers.append((glow_color, halo))
+        layers.append((glow_color, _coverage(distance, radius)))
+        layers.append((core_color, _coverage(distance, eye_size / 4)))
+        layers.append((pupil_color, _coverage(distance, eye_size / 8)))
+        return _composite(layers)
+    
+    return _cached("eye", params, build)
+
+
+def bloom(surface: pygame.Surface, glow_color: tuple, sigma: float,
+          strength: float = 1.0) -> pygame.Surface:
+    """
+    Surround a per-pixel alpha surface (e.g. rendered text) with a blurred,
+    tinted halo of its own shape; the result is padded by 3 * sigma on every side
+    Cached on disk by the surface's pixels and the glow parameters
+    """
+    rgb_view = pygame.surfarray.pixels3d(surface)
+    alpha_view = pygame.surfarray.pixels_alpha(surface)
+    source = np.empty(alpha_view.shape[::-1] + (4,), dtype=np.uint8)
+    source[..., :3] = rgb_view.transpose(1, 0, 2)
+    source[..., 3] = alpha_view.T
+    del rgb_view, alpha_view
+    
+    params = {
+        'pixels': hashlib.sha1(source.tobytes()).hexdigest(), 'shape': list(source.shape),
+        'glow_color': list(glow_color), 'sigma': sigma, 'strength': strength,
+    }
+    
+    def build() -> np.ndarray:
+        pad = int(math.ceil(3 * sigma))
+        padded = np.pad(source, ((pad, pad), (pad, pad), (0, 0)))
+        alpha = padded[..., 3].astype(np.float32) / 255
+        halo = np.minimum(gaussian_blur(alpha, sigma) * strength, 1.0)
+        return _composite([(glow_color, halo), (padded[..., :3], alpha)])
+    
+    return _cached("bloom", params, build)
+
@@ -0,0 +1,232 @@
+"""
+Terminal Handoff for Ghost Horror Mode
+Spawns the Ekphos terminal while the overlay is still up and hides the
+overlay only once X11 reports the terminal's window mapped
+"""
+
+import os
+import socket
+import time
+from typing import Optional
+
+from .capabilities import get_capabilities
+from .timeline import Track
+
+
+def _parent_pid(pid: int) -> Optional[int]:
+    """Parent of a process, from /proc (None if it is gone)"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            # The command name may contain spaces; fields resume after its ')'
+            return int(f.read().rsplit(')', 1)[1].split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _is_descendant(pid: int, ancestor: int) -> bool:
+    """True if pid is ancestor or one of its children, grandchildren, ..."""
+    while pid and pid > 1:
+        if pid == ancestor:
+            return True
+        pid = _parent_pid(pid)
+    return False
+
+
+class WindowMapWatcher:
+    """
+    Watches the X11 root window for the watched process's top-level window
+    being mapped
+    With a reparenting window manager the mapped window is the frame, so
+    its children are searched too. A window is ours when its _NET_WM_PID
+    is in the watched process tree, or when its WM_CLASS names the
+    terminal and WM_CLIENT_MACHINE is this host: some terminals never set
+    the PID, and single-instance ones (gnome-terminal) map their windows
+    from a server process that is not our child. Any other window is
+    ignored
+    """
+    
+    def __init__(self):
+        from Xlib import X
+        from Xlib.display import Display as XDisplay
+        
+        self._X = X
+        self.x_display = XDisplay()
+        self.root = self.x_display.screen().root
+        self.pid_atom = self.x_display.intern_atom('_NET_WM_PID')
+        self.hostname = socket.gethostname()
+        self.pid: Optional[int] = None  # Set once the process is spawned
+        self.wm_class: Optional[str] = None  # Terminal name WM_CLASS should start with
+        # Select before spawning, so the map can't be missed
+        self.root.change_attributes(event_mask=X.SubstructureNotifyMask)
+        self.x_display.flush()
+    
+    @classmethod
+    def create(cls) -> Optional['WindowMapWatcher']:
+        """A watcher, or None without python-xlib or an X server"""
+        capabilities = get_capabilities()
+        if not (capabilities.x11 and capabilities.xlib):
+            return None
+        try:
+            return cls()
+        except Exception as e:
+            print(f"Warning: Cannot watch for the terminal window: {e}")
+            return None
+    
+    def _client(self, window, depth: int = 2):
+        """The window itself or (for frames) the child carrying WM_CLASS or _NET_WM_PID, or None"""
+        if window.get_wm_class() is not None or window.get_full_property(self.pid_atom, self._X.AnyPropertyType):
+            return window
+        if depth > 0:
+            for child in window.query_tree().children:
+                client = self._client(child, depth - 1)
+                if client is not None:
+                    return client
+        return None
+    
+    def _is_ours(self, window) -> bool:
+        """Whether a newly mapped window belongs to the watched terminal"""
+        try:
+            client = self._client(window)
+            if client is None:
+                return False
+            prop = client.get_full_property(self.pid_atom, self._X.AnyPropertyType)
+            if prop is not None and len(prop.value) and self.pid is not None \
+                    and _is_descendant(int(prop.value[0]), self.pid):
+                return True
+            wm_class = client.get_wm_class()
+            machine = client.get_wm_client_machine()
+        except Exception:
+            return False  # Destroyed again before we could look at it
+        if not (self.wm_class and wm_class) or machine not in (None, self.hostname):
+            return False
+        name = self.wm_class.lower()
+        return any(part.lower().startswith(name) for part in wm_class)
+    
+    def poll(self) -> Optional[float]:
+        """
+        Handle queued X events; once the process's window has mapped,
+        returns the time (perf_counter) the map was received
+        """
+        now = time.perf_counter()
+        mapped = None
+        while self.x_display.pending_events():
+            event = self.x_display.next_event()
+            if event.type == self._X.MapNotify and not event.override and mapped is None \
+                    and self._is_ours(event.window):
+                mapped = now
+        return mapped
+    
+    def close(self):
+        """Close the X connection"""
+        try:
+            self.x_display.close()
+        except Exception:
+            pass
+
+
+class Handoff:
+    """
+    Gapless switch from the overlay to the Ekphos terminal
+    start() spawns the terminal (the overlay stays up) and poll() is then
+    called every frame (HandoffTrack does this during the intro); hold()
+    keeps presenting frames until the terminal's window maps, and hidden()
+    is called right after the overlay is hidden. Without X11 window
+    watching, hold() returns at once and the handoff works as before
+    """
+    
+    def __init__(self, launcher, timeout_ms: float = 5000, wm_class: Optional[str] = None):
+        """wm_class: what the terminal's WM_CLASS starts with (default: the name of its binary)"""
+        self.launcher = launcher
+        self.timeout_ms = timeout_ms
+        self.wm_class = wm_class
+        self.watcher: Optional[WindowMapWatcher] = None
+        self.launched = False
+        self.spawned_at: Optional[float] = None
+        self.mapped_at: Optional[float] = None  # When the map event was received
+        self.hidden_at: Optional[float] = None
+    
+    def start(self) -> bool:
+        """Spawn the terminal with Ekphos; returns False if it could not be launched"""
+        if os.environ.get('GHOST_HORROR_HANDOFF', '1') != '0':
+            self.watcher = WindowMapWatcher.create()
+        self.launched = self.launcher.launch()
+        self.spawned_at = time.perf_counter()
+        if self.watcher is not None:
+            if self.launched:
+                self.watcher.pid = self.launcher.process.pid
+                self.watcher.wm_class = self.wm_class or os.path.basename(self.launcher.terminal_cmd[0])
+            else:
+                self.watcher.close()
+                self.watcher = None
+        return self.launched
+    
+    def poll(self) -> bool:
+        """
+        Check for the terminal window; True once it has mapped or is no
+        longer worth waiting for (the terminal failed or time ran out)
+        """
+        if self.watcher is None or self.mapped_at is not None:
+            return True
+        received = self.watcher.poll()
+        if received is not None:
+            self.mapped_at = received
+            return True
+        if time.perf_counter() >= self.spawned_at + self.timeout_ms / 1000:
+            return True
+        # A terminal that failed to start won't map a window; one that exited
+        # cleanly may have handed it to a server process (gnome-terminal)
+        returncode = self.launcher.process.poll()
+        return returncode is not None and returncode != 0
+    
+    def hold(self, display):
+        """Keep the overlay up until the terminal window maps, the terminal exits or time runs out"""
+        if self.watcher is None:
+            return
+        while display.running and not self.poll():
+            display.update()
+        if self.mapped_at is None:
+            print("Warning: Terminal window not seen, hiding the overlay anyway")
+    
+    def hidden(self):
+        """Record that the overlay is hidden and report the handoff"""
+        self.hidden_at = time.perf_counter()
+        if self.watcher is not None:
+            # A map after hold() gave up still tells how long the desktop showed
+            if self.mapped_at is None and self.watcher.poll() is not None:
+                self.mapped_at = self.hidden_at
+            self.watcher.close()
+            self.watcher = None
+        
+        stats = self.stats()
+        if 'map_to_hide_ms' in stats:
+            print(f"Handoff: terminal mapped {stats['spawn_to_map_ms']:.0f} ms after spawn, "
+                  f"overlay hidden {stats['map_to_hide_ms']:.1f} ms later")
+    
+    def stats(self) -> dict:
+        """
+        Handoff timings: spawn_to_map_ms (terminal start-up hidden behind
+        the overlay) and map_to_hide_ms (time both were up); without a
+        window watcher only spawn_to_hide_ms is known
+        """
+        result = {}
+        if self.spawned_at is not None and self.hidden_at is not None:
+            result['spawn_to_hide_ms'] = (self.hidden_at - self.spawned_at) * 1000
+        if self.mapped_at is not None and self.hidden_at is not None:
+            result['spawn_to_map_ms'] = (self.mapped_at - self.spawned_at) * 1000
+            result['map_to_hide_ms'] = (self.hidden_at - self.mapped_at) * 1000
+        return result
+
+
+class HandoffTrack(Track):
+    """
+    Polls a started handoff every frame for the rest of a timeline, so the
+    terminal's window is seen (and its map timed) while effects still
+    play; keeps the timeline going until the window maps, like hold()
+    """
+    
+    def __init__(self, handoff: Handoff):
+        super().__init__()
+        self.handoff = handoff
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        return self.handoff.poll()
@@ -3,92 +3,154 @@ Keyboard Input Grab for Ghost Horror Mode
 X11-only implementation for keyboard suppression
 """
 
-import os
-import subprocess
+import time
 from typing import Optional
 
+from .capabilities import get_capabilities
+from .profiler import Histogram
+
 
 def is_x11() -> bool:
-    """Check if running on X11"""
-    session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
-    wayland_display = os.environ.get('WAYLAND_DISPLAY', '')
-    
-    if wayland_display:
-        return False
-    if session_type == 'x11':
-        return True
-    if session_type == 'wayland':
-        return False
-    
-    # Fallback: check for DISPLAY
-    return bool(os.environ.get('DISPLAY'))
+    """Check if running on X11 (probed once per process)"""
+    return get_capabilities().x11
+
+
+# Refused grabs are retried: another client may hold the keyboard for a
+# moment (an open menu, a screen locker fading in)
+RETRY_BACKOFF_MS = (1, 2, 5, 10, 20)  # Then 20 ms until the budget is spent
+RETRY_BUDGET_MS = 1000
 
 
 class X11KeyboardGrab:
     """
     X11 keyboard grab using python-xlib
     Prevents window manager shortcuts during the horror sequence
+    One X connection is kept for the whole session (reopened if it drops);
+    a grab refused because another client holds the keyboard is retried
+    with bounded backoff
     """
     
-    def __init__(self):
+    def __init__(self, budget_ms: float = RETRY_BUDGET_MS):
         self.display = None
         self.root = None
         self.grabbed = False
+        self.budget_ms = budget_ms
+        self.latency = Histogram()  # Successful grabs, first attempt to success
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+    
+    def connect(self) -> bool:
+        """Open the X connection if it is not open yet"""
+        if self.display is not None:
+            return True
+        if not get_capabilities().xlib:
+            print("Warning: python-xlib not installed, keyboard grab disabled")
+            return False
+        try:
+            from Xlib.display import Display
+            self.display = Display()
+            self.root = self.display.screen().root
+            return True
+        except Exception as e:
+            print(f"Warning: Cannot connect to the X server: {e}")
+            return False
+    
+    def _try_grab(self) -> int:
+        """One grab request; returns the X grab status"""
+        from Xlib import X
+        
+        self.attempts += 1
+        status = self.root.grab_keyboard(
+            True,  # owner_events
+            X.GrabModeAsync,  # pointer_mode
+            X.GrabModeAsync,  # keyboard_mode
+            X.CurrentTime
+        )
+        self.display.sync()
+        return status
     
     def grab(self) -> bool:
         """
         Grab the keyboard to prevent WM shortcuts
         Returns True if successful
         """
-        try:
-            from Xlib import X, XK
-            from Xlib.display import Display
-            
-            self.display = Display()
-            self.root = self.display.screen().root
-            
-            # Grab the keyboard
-            status = self.root.grab_keyboard(
-                True,  # owner_events
-                X.GrabModeAsync,  # pointer_mode
-                X.GrabModeAsync,  # keyboard_mode
-                X.CurrentTime
-            )
+        if self.grabbed:
+            return True
+        if not self.connect():
+            self.failures += 1
+            return False
+        
+        from Xlib import X
+        
+        start = time.perf_counter()
+        retry = 0
+        reconnected = False
+        while True:
+            try:
+                status = self._try_grab()
+            except Exception as e:
+                # The connection dropped (X server restart, ...): reopen it once
+                self.close()
+                if reconnected or not self.connect():
+                    print(f"Warning: Failed to grab keyboard: {e}")
+                    self.failures += 1
+                    return False
+                reconnected = True
+                continue
             
-            self.display.sync()
-            self.grabbed = (status == X.GrabSuccess)
-            return self.grabbed
+            if status == X.GrabSuccess:
+                self.grabbed = True
+                self.latency.add((time.perf_counter() - start) * 1000)
+                return True
             
-        except ImportError:
-            print("Warning: python-xlib not installed, keyboard grab disabled")
-            return False
-        except Exception as e:
-            print(f"Warning: Failed to grab keyboard: {e}")
-            return False
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            delay_ms = RETRY_BACKOFF_MS[min(retry, len(RETRY_BACKOFF_MS) - 1)]
+            if elapsed_ms + delay_ms > self.budget_ms:
+                print(f"Warning: Keyboard grab refused (status {status}) after {retry + 1} attempts")
+                self.failures += 1
+                return False
+            retry += 1
+            self.retries += 1
+            time.sleep(delay_ms / 1000)
     
     def ungrab(self):
-        """Release the keyboard grab"""
+        """Release the keyboard grab (the X connection stays open)"""
         if self.grabbed and self.display:
             try:
                 from Xlib import X
                 self.display.ungrab_keyboard(X.CurrentTime)
                 self.display.sync()
-                self.grabbed = False
             except Exception as e:
                 print(f"Warning: Failed to ungrab keyboard: {e}")
-        
+                self.close()
+        self.grabbed = False
+    
+    def close(self):
+        """Close the X connection"""
         if self.display:
             try:
                 self.display.close()
-            except:
+            except Exception:
                 pass
             self.display = None
+            self.root = None
+    
+    def stats(self) -> dict:
+        """Grab latency and attempt/retry/failure counts for the profiler report"""
+        return {
+            'latency': self.latency.to_dict(),
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'failures': self.failures,
+        }
 
 
 class InputManager:
     """
     Unified input manager
     Currently X11-only, structured for future Wayland support
+    The X11 grabber (and its X connection) lives for the whole session
     """
     
     def __init__(self):
@@ -105,7 +167,8 @@ class InputManager:
             print("         (Wayland support coming in a future update)")
             return False
         
-        self.x11_grab = X11KeyboardGrab()
+        if self.x11_grab is None:
+            self.x11_grab = X11KeyboardGrab()
         self.grabbed = self.x11_grab.grab()
         
         if self.grabbed:
@@ -119,10 +182,19 @@ class InputManager:
         """Release the keyboard grab"""
         if self.x11_grab:
             self.x11_grab.ungrab()
-            self.x11_grab = None
         self.grabbed = False
         print("Keyboard released")
     
+    def close(self):
+        """Release the keyboard and close the X connection"""
+        self.release_keyboard()
+        if self.x11_grab:
+            self.x11_grab.close()
+    
     def is_grabbed(self) -> bool:
         """Check if keyboard is currently grabbed"""
         return self.grabbed
+    
+    def stats(self) -> dict:
+        """Keyboard grab statistics (empty if no grab was attempted)"""
+        return self.x11_grab.stats() if self.x11_grab else {}
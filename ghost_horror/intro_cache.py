@@ -0,0 +1,326 @@
+"""
+Pre-rendered Intro Cache for Ghost Horror Mode
+Renders the deterministic intro once per resolution into a compact
+tile-delta frame file and plays it back from a memory-mapped file
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import signal
+import struct
+import subprocess
+import sys
+import zlib
+from typing import List, Optional
+
+import numpy as np
+import pygame
+
+from . import __version__
+from .assets import assets
+from .clock import VirtualClock
+from .effects import HORROR_FONTS
+from .font_index import find_font_path, get_cache_dir
+from .profiler import profiler
+from .quality import QualityGovernor
+
+
+MAGIC = b'GHIC'
+FORMAT_VERSION = 1
+TILE = 32  # Tile edge in pixels; only changed tiles are stored per frame
+FPS = 60
+
+# Sources whose code defines what the intro looks like
+_SOURCE_FILES = ['effects.py', 'display.py', 'clock.py', 'main.py', 'timeline.py', 'quality.py', 'glow.py', 'assets.py', 'text_cache.py']
+
+# Trailer: index offset (u64) + magic
+_TRAILER = struct.Struct('<Q4s')
+
+
+def intro_fingerprint(width: int, height: int) -> str:
+    """Hash of everything that changes the rendered intro"""
+    digest = hashlib.sha1()
+    digest.update(f"{__version__}|{FORMAT_VERSION}|{width}x{height}|{FPS}|{TILE}".encode())
+    digest.update(str(find_font_path(HORROR_FONTS)).encode())
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in _SOURCE_FILES:
+        with open(os.path.join(package_dir, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_cache_path(width: int, height: int) -> str:
+    """Path of the intro cache file for a resolution"""
+    return os.path.join(get_cache_dir(), f"intro-{width}x{height}.ghic")
+
+
+class _FrameWriter:
+    """Encodes captured frames as zlib-compressed changed-tile deltas"""
+    
+    def __init__(self, f, width: int, height: int):
+        self.f = f
+        self.width = width
+        self.height = height
+        self.rows = -(-height // TILE)
+        self.cols = -(-width // TILE)
+        self.previous = np.zeros((self.rows * TILE, self.cols * TILE), dtype=np.uint32)
+        self.current = np.zeros_like(self.previous)
+        self.frames: List[List[int]] = []  # [offset, length] per frame
+    
+    def _tiles(self, frame: np.ndarray) -> np.ndarray:
+        """View a padded frame as (rows, TILE, cols, TILE)"""
+        return frame.reshape(self.rows, TILE, self.cols, TILE)
+    
+    def capture(self, surface: pygame.Surface):
+        """Encode the difference between a 32-bit surface and the previous frame"""
+        # Surface pixels are (width, height) in memory order rows-of-pixels, so .T is (height, width)
+        view = surface.get_view('2')
+        self.current[:self.height, :self.width] = np.asarray(view).T
+        del view
+        
+        changed = (self._tiles(self.current) != self._tiles(self.previous)).any(axis=(1, 3))
+        rows, cols = np.nonzero(changed)
+        payload = self._tiles(self.current)[rows, :, cols]
+        
+        blob = zlib.compress(
+            struct.pack('<I', len(rows)) + rows.astype('<u2').tobytes()
+            + cols.astype('<u2').tobytes() + payload.astype('<u4').tobytes(),
+            1
+        )
+        self.frames.append([self.f.tell(), len(blob)])
+        self.f.write(blob)
+        self.previous, self.current = self.current, self.previous
+        self.current[...] = self.previous
+
+
+def record_intro(display, run_intro, path: Optional[str] = None) -> bool:
+    """
+    Render the intro off-screen on a virtual clock and write the cache file
+    The window is left untouched (assets are not converted through
+    pygame.display), so this can run while the display is hidden; the
+    profiler is paused, so the off-screen frames stay out of the intro's
+    scene timings
+    """
+    width, height = display.screen_width, display.screen_height
+    path = path or get_cache_path(width, height)
+    tmp_path = path + ".tmp"
+    
+    saved = (display.screen, display.clock, display.dirty_rects, display.running, display.quality)
+    display.screen = pygame.Surface((width, height), 0, 32)
+    display.clock = VirtualClock(FPS)
+    display.dirty_rects = False
+    display.running = True
+    display.quality = QualityGovernor(0, adaptive=False)  # Always cache the best quality
+    assets.offscreen = True
+    
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            writer = _FrameWriter(f, width, height)
+            
+            def capture_frame():
+                writer.capture(display.screen)
+                display.clock.tick()
+            
+            display.present = capture_frame
+            profiler.pause()
+            try:
+                run_intro(display)
+            finally:
+                profiler.resume()
+                del display.present
+            
+            header = json.dumps({
+                'version': FORMAT_VERSION,
+                'fingerprint': intro_fingerprint(width, height),
+                'width': width,
+                'height': height,
+                'tile': TILE,
+                'fps': FPS,
+                'masks': list(display.screen.get_masks()),
+                'frames': writer.frames,
+            }).encode()
+            index_offset = f.tell()
+            f.write(header)
+            f.write(_TRAILER.pack(index_offset, MAGIC))
+        os.replace(tmp_path, path)
+        return True
+    
+    except (OSError, ValueError) as e:
+        print(f"Warning: Failed to record intro cache: {e}")
+        return False
+    
+    finally:
+        assets.offscreen = False
+        display.screen, display.clock, display.dirty_rects, display.running, display.quality = saved
+        _remove(tmp_path)  # Left behind only if recording failed or was stopped
+
+
+def _remove(path: str):
+    """Delete a file if it exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class IntroRecorder:
+    """
+    Records the intro cache in a child process
+    Rendering the intro takes seconds (over 20 s at 4K), which must not
+    stall the supervisor's loop while Ekphos runs. The child draws on
+    SDL's dummy driver, so the hidden window is not touched either;
+    cancel() stops it and drops the partial file
+    """
+    
+    def __init__(self, width: int, height: int, path: Optional[str] = None):
+        self.width = width
+        self.height = height
+        self.path = path or get_cache_path(width, height)
+        self.process: Optional[subprocess.Popen] = None
+    
+    def start(self) -> bool:
+        """Spawn the recording process; returns False if it could not be started"""
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, "-m", "ghost_horror.intro_cache", f"{self.width}x{self.height}",
+                 "--path", self.path],
+                stdin=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            print(f"Warning: Cannot start recording the intro cache: {e}")
+            return False
+        return True
+    
+    def is_running(self) -> bool:
+        """Check if the recording is still in progress"""
+        return self.process is not None and self.process.poll() is None
+    
+    def cancel(self):
+        """Stop the recording if it has not finished; the cache is recorded again next time"""
+        if self.is_running():
+            print("Intro cache not finished, abandoning it")
+            self.process.terminate()
+            try:
+                self.process.wait(1)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            _remove(self.path + ".tmp")
+        self.process = None
+
+
+class IntroPlayer:
+    """Plays a cached intro from a memory-mapped file"""
+    
+    def __init__(self, path: str):
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        index_offset, magic = _TRAILER.unpack_from(self.data, len(self.data) - _TRAILER.size)
+        if magic != MAGIC:
+            raise ValueError("not an intro cache file")
+        self.header = json.loads(bytes(self.data[index_offset:len(self.data) - _TRAILER.size]))
+        self.width = self.header['width']
+        self.height = self.header['height']
+        self.frames = self.header['frames']
+    
+    def close(self):
+        """Release the mapping"""
+        self.data.close()
+        self.file.close()
+    
+    def play(self, display) -> bool:
+        """
+        Play every frame, paced by the display clock (late frames are caught up)
+        Returns False if the display was closed during playback
+        """
+        tile = self.header['tile']
+        rows = -(-self.height // tile)
+        cols = -(-self.width // tile)
+        # Decoded tiles are written straight into this surface's pixels
+        # (its width is a multiple of the tile size, so rows are packed and .T reshapes in place)
+        source = pygame.Surface((cols * tile, rows * tile), 0, 32, self.header['masks'])
+        frame_ms = 1000 / self.header['fps']
+        start = display.clock.get_ticks()
+        shown = -1
+        
+        while shown < len(self.frames) - 1 and display.running:
+            # At least one new frame per update; more if playback fell behind the clock
+            elapsed_frames = int((display.clock.get_ticks() - start) / frame_ms)
+            due = min(len(self.frames) - 1, max(shown + 1, elapsed_frames))
+            dirty = []
+            view = source.get_view('2')
+            tiles = np.asarray(view).T.reshape(rows, tile, cols, tile)
+            while shown < due:
+                shown += 1
+                offset, length = self.frames[shown]
+                blob = zlib.decompress(self.data[offset:offset + length])
+                count = struct.unpack_from('<I', blob)[0]
+                tile_rows = np.frombuffer(blob, '<u2', count, 4)
+                tile_cols = np.frombuffer(blob, '<u2', count, 4 + 2 * count)
+                payload = np.frombuffer(blob, '<u4', offset=4 + 4 * count).reshape(count, tile, tile)
+                tiles[tile_rows, :, tile_cols] = payload
+                dirty.extend(zip(tile_rows.tolist(), tile_cols.tolist()))
+            del tiles, view  # Unlock the surface before blitting from it
+            
+            for row, col in set(dirty):
+                rect = pygame.Rect(col * tile, row * tile, tile, tile)
+                display.mark_dirty(display.screen.blit(source, rect, rect))
+            if dirty and not display.track_regions:
+                display.invalidate()
+            display.update()
+        
+        return display.running
+
+
+def play_cached_intro(display) -> Optional[bool]:
+    """
+    Play the cached intro for the display resolution if a valid cache exists
+    Returns None when there is no usable cache, else whether the display is still running
+    """
+    path = get_cache_path(display.screen_width, display.screen_height)
+    if not os.path.exists(path):
+        return None
+    try:
+        player = IntroPlayer(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable intro cache: {e}")
+        return None
+    
+    try:
+        expected = intro_fingerprint(display.screen_width, display.screen_height)
+        if player.header.get('version') != FORMAT_VERSION or player.header.get('fingerprint') != expected:
+            return None
+        display.clear()
+        return player.play(display)
+    finally:
+        player.close()
+
+
+def main(argv=None) -> int:
+    """Recording process entry point (see IntroRecorder)"""
+    parser = argparse.ArgumentParser(prog="ghost-horror-intro-cache", description="Record the intro cache")
+    parser.add_argument("size", help="backbuffer size, e.g. 1920x1080")
+    parser.add_argument("--path", help="cache file (default: the cache directory)")
+    args = parser.parse_args(argv)
+    width, height = (int(value) for value in args.size.lower().split('x'))
+    
+    # Background work: stay out of the way of the terminal, and clean up when stopped
+    os.nice(10)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    
+    from .display import Display
+    from .main import run_intro_sequence
+    
+    display = Display(size=(width, height), video_driver='dummy', fps=0, render_scale='1', vsync=False)
+    try:
+        return 0 if record_intro(display, run_intro_sequence, args.path) else 1
+    finally:
+        display.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,87 +4,130 @@ Ghost Horror Mode - Main Entry Point
 A spooky fullscreen experience before launching Ekphos
 """
 
-import pygame
-import time
+import argparse
+import json
 import sys
-from .display import Display, SoundManager
-from .effects import BloodText, GlowingEyes, TextInput, MessageDisplay, PURPLE_GLOW, BLOOD_RED
-from .input_grab import InputManager, is_x11
-from .ekphos_launcher import EkphosLauncher
+import os
+from typing import Optional
+from .startup import startup, import_pygame  # First, so startup is timed from here
 
+# Only what the first black frame needs is imported up front; effects,
+# input grabbing and the Ekphos launcher load once the screen is black
+pygame = import_pygame()
+from .display import Display
+from .profiler import profiler, configure_from_env
+from .assets import assets
+from .text_cache import text_cache
+from .timeline import Timeline, HoldTrack, FadeToBlackTrack
+from .quality import LEVEL_NAMES
 
-def run_intro_sequence(display: Display):
-    """Run the intro horror sequence"""
-    # Phase 1: Black screen pause
+startup.mark('imports')
+
+
+def run_intro_sequence(display: Display, prewarm=None, on_fade_out=None, sound=None):
+    """
+    Run the intro horror sequence
+    With a Prewarm, the blood text and eyes are built on its threads during
+    the opening black pause instead of before it; on_fade_out is called as
+    the eyes begin to fade out and may return a track to run for the rest
+    of the intro (the handoff's window polling). With a SoundManager, the
+    drone, whispers and heartbeat are cued along with the effects
+    """
+    from .effects import BloodText, GlowingEyes, BloodTextTrack, EyesTrack
+    
     display.clear()
     display.update()
-    display.wait(1000)
     
-    # Phase 2: Blood writing "You Are Alone"
-    blood_text = BloodText(display, "You Are Alone", font_scale=0.12)
-    center_x, center_y = display.get_center()
+    def make_blood_text() -> BloodText:
+        blood_text = BloodText(display, "You Are Alone", font_scale=0.12)
+        for asset in blood_text.glyph_assets:
+            asset.surface  # Rasterize the glyphs now, not at their first draw
+        return blood_text
+    
+    def make_eyes() -> GlowingEyes:
+        eyes = GlowingEyes(display, size_scale=0.08)
+        eyes.eye_asset.surface  # Build (or load) the glow sprite now
+        return eyes
     
-    animation_complete = False
-    while not animation_complete and display.running:
-        display.clear()
-        animation_complete = blood_text.draw(display.screen, center_x, center_y)
-        display.update()
+    timeline = Timeline(display)
+    writing = BloodTextTrack(None, display.get_center(), hold_ms=1500)
+    
+    def fade_out():
+        track = on_fade_out()
+        if track is not None:
+            timeline.add(track)
+    
+    eyes_track = EyesTrack(None, fade_out if on_fade_out is not None else None)
+    
+    # Phase 1: Black screen pause
+    if prewarm is None:
+        writing.blood_text = make_blood_text()
+        eyes_track.eyes = make_eyes()
+        pause = timeline.add(HoldTrack(1000), scene='intro_black')
+    else:
+        from .prewarm import PrewarmTrack
+        prewarm.submit('blood_text', make_blood_text)
+        prewarm.submit('eyes', make_eyes)
+        
+        def ready(late):
+            # A job that missed the deadline is built here instead of waited for
+            writing.blood_text = make_blood_text() if 'blood_text' in late else prewarm.result('blood_text')
+            eyes_track.eyes = make_eyes() if 'eyes' in late else prewarm.result('eyes')
+        
+        pause = timeline.add(PrewarmTrack(prewarm, 1000, ('blood_text', 'eyes'), ready), scene='intro_black')
     
-    # Hold the text for a moment
-    display.wait(1500)
+    # Phase 2: Blood writing "You Are Alone", then hold the text for a moment
+    timeline.add(writing, after=pause, scene='intro_blood_text')
     
     # Phase 3: Fade to black
-    display.fade_to_black(800)
-    display.wait(500)
+    fade = timeline.add(FadeToBlackTrack(800), after=writing, scene='intro_fade')
     
     # Phase 4: Glowing eyes
-    eyes = GlowingEyes(display, size_scale=0.08)
-    eyes.start()
+    timeline.add(eyes_track, after=fade, delay_ms=500, scene='intro_eyes')
+    
+    if sound is not None:
+        from .audio import SoundCueTrack
+        timeline.add(SoundCueTrack(sound, 'drone', loop=True, fade_ms=3000, volume=0.5), after=pause)
+        timeline.add(SoundCueTrack(sound, 'whisper', volume=0.7), after=pause, delay_ms=600)
+        timeline.add(SoundCueTrack(sound, 'heartbeat', loop=True, fade_ms=800), after=fade, delay_ms=500)
     
-    eyes_complete = False
-    while not eyes_complete and display.running:
-        display.clear()
-        eyes_complete = eyes.update()
-        eyes.draw(display.screen)
-        display.update()
+    timeline.run()
     
     # Final black before Ekphos
     display.clear()
     display.update()
 
 
-def run_exit_sequence(display: Display) -> bool:
+def run_exit_sequence(display: Display, sound=None) -> bool:
     """
     Run the exit sequence with prompt
     Returns True if user wants to exit, False to relaunch Ekphos
     """
-    # Show prompt
-    text_input = TextInput(display, "You want to see the light?", font_scale=0.06)
+    from .effects import TextInput, MessageDisplay, PromptTrack, PURPLE_GLOW, BLOOD_RED
     
-    result = None
-    while result is None and display.running:
-        display.clear()
-        text_input.draw(display.screen)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                display.running = False
-            elif event.type == pygame.KEYDOWN:
-                # ESC key = emergency exit
-                if event.key == pygame.K_ESCAPE:
-                    return True
-                else:
-                    result = text_input.handle_event(event)
-        
-        display.update()
+    # Show prompt (over the heartbeat)
+    profiler.scene('exit_prompt')
+    prompt = PromptTrack(TextInput(display, "You want to see the light?", font_scale=0.06))
+    timeline = Timeline(display)
+    timeline.add(prompt)
+    if sound is not None:
+        from .audio import SoundCueTrack
+        timeline.add(SoundCueTrack(sound, 'heartbeat', loop=True, fade_ms=1500, volume=0.6))
+    timeline.run()
+    if sound is not None:
+        sound.stop('heartbeat', fade_ms=800)
     
-    if not display.running:
-        return True  # Exit on quit
+    # ESC key = emergency exit, and exit on quit
+    if prompt.escaped or not display.running:
+        return True
+    result = prompt.result
     
     # Check response
+    profiler.scene('exit_message')
     if result and result.lower() in ['yes', 'y', 'yeah', 'yea', 'yep']:
         # User said yes - show farewell and exit
-        message = MessageDisplay(display, "You live to see another day...", PURPLE_GLOW, font_scale=0.08)
+        message = MessageDisplay(display, "You live to see another day...", PURPLE_GLOW, font_scale=0.08,
+                                 glow=PURPLE_GLOW)
         message.show(duration_ms=2500, fade_in_ms=800, fade_out_ms=800)
         return True
     else:
@@ -94,8 +137,81 @@ def run_exit_sequence(display: Display) -> bool:
         return False
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(prog="ghost-horror", description="Ghost Horror Mode")
+    parser.add_argument(
+        "--profile", nargs="?", const="ghost_horror_profile.json", metavar="PATH",
+        help="record per-frame timings by scene and write them to PATH as JSON at exit",
+    )
+    parser.add_argument(
+        "--cprofile", action="store_true",
+        help="with --profile, also capture a cProfile per scene",
+    )
+    parser.add_argument(
+        "--intro-cache", action="store_true",
+        default=os.environ.get('GHOST_HORROR_INTRO_CACHE') == '1',
+        help="play the intro from a pre-rendered cache (built while Ekphos runs on first use)",
+    )
+    parser.add_argument(
+        "--quality", choices=["auto"] + LEVEL_NAMES,
+        default=os.environ.get('GHOST_HORROR_QUALITY', 'auto'),
+        help="effect quality; auto steps it down when frames miss the 60 fps budget (default: auto)",
+    )
+    parser.add_argument(
+        "--render-scale", metavar="SCALE",
+        default=os.environ.get('GHOST_HORROR_RENDER_SCALE'),
+        help="internal render resolution as a factor (0.5, 0.75) or height (1080p), upscaled to the screen",
+    )
+    parser.add_argument(
+        "--vsync", action="store_true",
+        default=os.environ.get('GHOST_HORROR_VSYNC') == '1',
+        help="wait for vertical blank on each frame where SDL supports it (default: sleep/spin timer)",
+    )
+    return parser.parse_args(argv)
+
+
+def open_display(args: argparse.Namespace) -> Display:
+    """Create the display from the command line options"""
+    return Display(quality=args.quality, render_scale=args.render_scale, vsync=args.vsync,
+                   video_driver=os.environ.get('GHOST_HORROR_VIDEO_DRIVER', 'x11'))
+
+
 def main():
     """Main entry point for Ghost Horror Mode"""
+    # `ghost-horror bench` runs the headless benchmark suite instead
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        from .bench import main as bench_main
+        sys.exit(bench_main(sys.argv[2:]))
+    
+    args = parse_args()
+    configure_from_env()
+    if args.profile:
+        profiler.enable(args.profile, use_cprofile=args.cprofile)
+    profiler.add_stats('assets', assets.stats)
+    profiler.add_stats('text_cache', text_cache.stats)
+    
+    # Black screen first; everything else happens behind it
+    display = open_display(args)
+    startup.mark('first_black_frame')
+    if os.environ.get('GHOST_HORROR_STARTUP_PROBE') == '1':
+        # `ghost-horror bench --startup` only times the way to the first black frame
+        print(f"startup-probe {json.dumps({'origin': startup.origin, 'marks': startup.stats()})}", flush=True)
+        display.close()
+        return
+    
+    # Lambdas follow display if it is recreated
+    profiler.add_stats('startup', startup.stats)
+    profiler.add_stats('input_latency', lambda: display.events.stats())
+    profiler.add_stats('frame_pacing', lambda: display.pacing_stats())
+    
+    from .input_grab import InputManager, is_x11
+    from .ekphos_launcher import EkphosLauncher
+    from .prewarm import Prewarm
+    from .handoff import Handoff, HandoffTrack
+    from .audio import SoundManager
+    from . import intro_cache
+    
     print("=" * 50)
     print("  👻 GHOST HORROR MODE 👻")
     print("=" * 50)
@@ -106,57 +222,131 @@ def main():
         print("    Keyboard suppression will be disabled.")
         print("    Full Wayland support coming soon.\n")
     
-    # Check Ekphos
-    launcher = EkphosLauncher()
-    ready, message = launcher.check_requirements()
-    
-    if not ready:
-        print(f"\n❌ Error: {message}")
-        sys.exit(1)
-    
-    print(f"✓ {message}")
     print("\nInitializing horror sequence...")
     print("(Press Ctrl+C in terminal to emergency exit)\n")
     
-    # Initialize display
-    display = Display()
-    
-    # Initialize input manager
+    launcher = EkphosLauncher()
     input_manager = InputManager()
+    profiler.add_stats('keyboard_grab', input_manager.stats)
     
-    # Setup sound manager (for future use)
+    # Requirement checks and the keyboard grab run behind the black screen,
+    # together with the intro's own pre-warm jobs
+    prewarm = Prewarm()
+    profiler.add_stats('prewarm', prewarm.stats)
+    
+    def check_requirements() -> tuple:
+        ready, message = launcher.check_requirements()
+        startup.mark('requirements_checked')
+        if not ready:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))  # Cut the intro short
+        return ready, message
+    
+    # Sounds are synthesized behind the black screen too; the mixer is
+    # opened here, since SDL's audio subsystem belongs on the main thread
     sound = SoundManager()
+    sound.init()
+    profiler.add_stats('sound', sound.stats)
+    
+    prewarm.submit('requirements', check_requirements)
+    prewarm.submit('keyboard', input_manager.grab_keyboard)
+    prewarm.submit('sound', sound.prepare_intro)
+    
+    # Keep pygame and the window alive while Ekphos runs (hide instead of teardown)
+    persistent_display = os.environ.get('GHOST_HORROR_PERSISTENT_DISPLAY', '1') != '0'
+    
+    # The terminal is spawned while the overlay is still up and the overlay
+    # is hidden once the terminal's window maps
+    handoff: Optional[Handoff] = None
+    handoff_stats: dict = {}
+    profiler.add_stats('handoff', lambda: handoff_stats)
+    
+    def start_handoff():
+        nonlocal handoff
+        # Only once Ekphos is known to be there (the checks are normally done
+        # by the eyes; if not, the terminal is spawned after the intro)
+        if not prewarm.pending(['requirements']) and prewarm.result('requirements')[0]:
+            print("Launching Ekphos...")
+            handoff = Handoff(launcher)
+            handoff.start()
+            return HandoffTrack(handoff)
+        return None
+    
+    recorder: Optional[intro_cache.IntroRecorder] = None
     
     try:
-        # Grab keyboard for intro
-        input_manager.grab_keyboard()
+        # Run intro sequence once at start (from the pre-rendered cache if enabled)
+        build_intro_cache = False
+        if args.intro_cache:
+            if intro_cache.play_cached_intro(display) is None:
+                run_intro_sequence(display, prewarm, start_handoff, sound)
+                build_intro_cache = persistent_display
+        else:
+            run_intro_sequence(display, prewarm, start_handoff, sound)
         
-        # Run intro sequence once at start
-        run_intro_sequence(display)
+        # Check Ekphos (long done by now)
+        ready, message = prewarm.result('requirements')
+        if not ready:
+            print(f"\n❌ Error: {message}")
+            sys.exit(1)
+        print(f"✓ {message}")
+        prewarm.result('keyboard')
+        prewarm.result('sound')
+        prewarm.shutdown()
         
         while display.running:
-            # Release keyboard for Ekphos
-            input_manager.release_keyboard()
+            # Launch Ekphos (already spawned during the eyes fade-out on the first pass)
+            if handoff is None:
+                print("Launching Ekphos...")
+                handoff = Handoff(launcher)
+                handoff.start()
+            if not handoff.launched:
+                print("Failed to launch Ekphos!")
+                break
             
-            # Close display temporarily for Ekphos
-            display.close()
+            # Keep the overlay up until the terminal window is on screen
+            handoff.hold(display)
             
-            # Launch Ekphos
-            print("Launching Ekphos...")
-            if launcher.launch():
-                print("Waiting for Ekphos to exit...")
-                launcher.wait_for_exit()
-                print("Ekphos closed")
+            # Release keyboard for Ekphos, and let the sounds die away with the overlay
+            input_manager.release_keyboard()
+            sound.stop_all(fade_ms=400)
+            
+            # Hide (or close) display temporarily for Ekphos
+            if persistent_display:
+                display.suspend()
             else:
-                print("Failed to launch Ekphos!")
+                display.close()
+            handoff.hidden()
+            handoff_stats = handoff.stats()
+            handoff = None
+            
+            # Ekphos is in front and the display is hidden: record the intro cache
+            # in a child process while we wait
+            if build_intro_cache:
+                print("Building intro cache...")
+                recorder = intro_cache.IntroRecorder(display.screen_width, display.screen_height)
+                recorder.start()
+                build_intro_cache = False
+            
+            print("Waiting for Ekphos to exit...")
+            launcher.wait_for_exit()
+            print("Ekphos closed")
+            if recorder is not None:
+                recorder.cancel()  # Only if still running: the prompt comes first
+                recorder = None
+            if launcher.supervisor.signalled is not None:
+                # SIGTERM/SIGHUP: Ekphos was closed for us, leave without the prompt
                 break
             
-            # Re-initialize display for exit sequence
-            display = Display()
+            # Bring the display back for exit sequence
+            if persistent_display:
+                display.resume()
+            else:
+                display = open_display(args)
+                sound.init()  # pygame.quit() closed the mixer too
             # NOTE: Don't grab keyboard here - we need typing for the prompt!
             
             # Run exit sequence (keyboard NOT grabbed so user can type)
-            should_exit = run_exit_sequence(display)
+            should_exit = run_exit_sequence(display, sound)
             
             if should_exit:
                 # User wants to leave
@@ -164,16 +354,21 @@ def main():
             else:
                 # User said no - "Then Return!" was shown, loop back to Ekphos
                 print("Returning to Ekphos...")
-                # Reset launcher for next iteration
-                launcher = EkphosLauncher()
-                launcher.check_requirements()
+                # The launcher is reused: terminal and ekphos were found once at startup
     
     except KeyboardInterrupt:
         print("\n\n🏃 Emergency exit!")
     
     finally:
         # Cleanup
-        input_manager.release_keyboard()
+        if handoff is not None:
+            launcher.terminate()  # Spawned during the intro, but the intro was quit
+        if recorder is not None:
+            recorder.cancel()
+        profiler.dump()  # Before closing: the stats sources read the live mixer, grabber and display
+        launcher.close()
+        input_manager.close()
+        sound.close()
         display.close()
         print("\n👋 Exiting Ghost Horror Mode")
         print("Welcome back to the light.\n")
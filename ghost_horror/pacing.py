@@ -0,0 +1,187 @@
+"""
+Frame Pacing for Ghost Horror Mode
+Detects the monitor refresh rate and holds the frame rate with a hybrid
+sleep-then-spin wait, keeping frame-interval jitter statistics
+"""
+
+import math
+import os
+import time
+from collections import deque
+from typing import Optional
+
+
+DEFAULT_REFRESH_HZ = 60.0
+
+# XRandR mode flags (randr.h)
+_RR_INTERLACE = 0x10
+_RR_DOUBLE_SCAN = 0x20
+
+
+def _xrandr_refresh_rate() -> Optional[float]:
+    """Refresh rate of the primary (or first active) CRTC, or None if unavailable"""
+    try:
+        from Xlib.display import Display as XDisplay
+        from Xlib.ext import randr  # noqa: F401 (registers the xrandr_* methods)
+    except ImportError:
+        return None
+    
+    try:
+        x_display = XDisplay()
+    except Exception:
+        return None
+    
+    try:
+        if not x_display.has_extension('RANDR'):
+            return None
+        root = x_display.screen().root
+        resources = root.xrandr_get_screen_resources_current()
+        modes = {mode.id: mode for mode in resources.modes}
+        
+        crtcs = list(resources.crtcs)
+        primary = root.xrandr_get_output_primary().output
+        if primary:
+            crtc = x_display.xrandr_get_output_info(primary, resources.config_timestamp).crtc
+            if crtc:
+                crtcs.insert(0, crtc)
+        
+        for crtc in crtcs:
+            info = x_display.xrandr_get_crtc_info(crtc, resources.config_timestamp)
+            mode = modes.get(info.mode)
+            if mode is None or not mode.h_total or not mode.v_total:
+                continue
+            rate = mode.dot_clock / (mode.h_total * mode.v_total)
+            if mode.flags & _RR_DOUBLE_SCAN:
+                rate /= 2
+            if mode.flags & _RR_INTERLACE:
+                rate *= 2
+            return rate
+    except Exception as e:
+        print(f"Warning: Failed to read the refresh rate: {e}")
+    finally:
+        x_display.close()
+    return None
+
+
+def detect_refresh_rate(video_driver: str = 'x11') -> float:
+    """
+    Monitor refresh rate in Hz: GHOST_HORROR_REFRESH_RATE if set, else
+    XRandR on X11, else 60
+    """
+    override = os.environ.get('GHOST_HORROR_REFRESH_RATE')
+    if override:
+        try:
+            return float(override)
+        except ValueError:
+            print(f"Warning: Ignoring invalid GHOST_HORROR_REFRESH_RATE: {override}")
+    
+    if video_driver == 'x11':
+        rate = _xrandr_refresh_rate()
+        if rate:
+            return rate
+    return DEFAULT_REFRESH_HZ
+
+
+def align_frame_rate(fps: float, refresh_hz: float) -> float:
+    """
+    The refresh rate divided by the whole number that comes closest to fps
+    (60 on a 144 Hz monitor gives 72), so every frame lasts the same number
+    of refreshes. 0 (uncapped) stays 0
+    """
+    if fps <= 0:
+        return 0
+    return refresh_hz / max(1, round(refresh_hz / fps))
+
+
+class FramePacer:
+    """
+    Holds a frame rate against absolute deadlines
+    Sleeps until shortly before each deadline and spins for the rest; the
+    spin margin follows the worst recent oversleep. With vsync the flip
+    already paces frames, so only intervals are recorded, and vsync is
+    given up if frames turn out faster than the refresh rate
+    """
+    
+    MIN_SPIN_S = 0.00025
+    MAX_SPIN_S = 0.004
+    
+    def __init__(self, refresh_hz: float = DEFAULT_REFRESH_HZ, vsync: bool = False, history: int = 600):
+        self.refresh_hz = refresh_hz
+        self.vsync = vsync
+        self.intervals: deque = deque(maxlen=history)  # ms between ticks
+        self.target_ms = 0.0
+        self.spin_margin = 0.001  # Seconds before a deadline to stop sleeping
+        self._last: Optional[float] = None
+        self._deadline: Optional[float] = None
+    
+    def reset(self):
+        """Start a new schedule (after a pause), keeping statistics"""
+        self._last = None
+        self._deadline = None
+    
+    def _wait_until(self, deadline: float):
+        """Sleep until close to deadline, then spin"""
+        sleep_s = deadline - time.perf_counter() - self.spin_margin
+        if sleep_s > 0:
+            wake = time.perf_counter() + sleep_s
+            time.sleep(sleep_s)
+            oversleep = time.perf_counter() - wake
+            self.spin_margin = min(self.MAX_SPIN_S, max(self.MIN_SPIN_S, oversleep * 1.25, self.spin_margin * 0.99))
+        while time.perf_counter() < deadline:
+            pass
+    
+    def _check_vsync(self):
+        """Fall back to timed pacing if flips are not actually waiting for vblank"""
+        if len(self.intervals) < 30:
+            return
+        ordered = sorted(self.intervals)
+        if ordered[len(ordered) // 2] < 0.75 * 1000 / self.refresh_hz:
+            print("Warning: vsync is not limiting frames, pacing by timer instead")
+            self.vsync = False
+    
+    def tick(self, fps: float = 0) -> float:
+        """Wait for the next frame slot at fps (0 = uncapped), returns ms since the last tick"""
+        if fps > 0 and not self.vsync:
+            period = 1 / fps
+            start = self._deadline if self._deadline is not None else self._last
+            deadline = (start if start is not None else time.perf_counter()) + period
+            # After a missed deadline restart the schedule instead of rushing to catch up
+            deadline = max(deadline, time.perf_counter())
+            self._wait_until(deadline)
+            self._deadline = deadline
+        else:
+            self._deadline = None
+        self.target_ms = 1000 / fps if fps > 0 else 0.0
+        
+        now = time.perf_counter()
+        elapsed_ms = 0.0 if self._last is None else (now - self._last) * 1000
+        if self._last is not None:
+            self.intervals.append(elapsed_ms)
+            if self.vsync and fps > 0:
+                self._check_vsync()
+        self._last = now
+        return elapsed_ms
+    
+    def stats(self) -> dict:
+        """Frame-interval statistics over the recent history"""
+        intervals = list(self.intervals)
+        result = {
+            'refresh_hz': self.refresh_hz,
+            'vsync': self.vsync,
+            'target_ms': self.target_ms,
+            'spin_margin_ms': self.spin_margin * 1000,
+            'frames': len(intervals),
+        }
+        if not intervals:
+            return result
+        
+        mean = sum(intervals) / len(intervals)
+        target = self.target_ms or mean
+        deviations = sorted(abs(interval - target) for interval in intervals)
+        result.update({
+            'mean_ms': mean,
+            'jitter_ms': math.sqrt(sum((interval - mean) ** 2 for interval in intervals) / len(intervals)),
+            'p99_deviation_ms': deviations[min(len(deviations) - 1, int(len(deviations) * 0.99))],
+            'late_frames': sum(1 for interval in intervals if interval > target * 1.5),
+        })
+        return result
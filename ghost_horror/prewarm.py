@@ -0,0 +1,86 @@
+"""
+Pre-warm Stage for Ghost Horror Mode
+Runs startup work (fonts, glow sprites, keyboard grab, requirement
+checks) on a thread pool while the opening black screen holds
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .timeline import Track
+
+
+class Prewarm:
+    """
+    Named jobs on a small thread pool
+    Font rasterizing, NumPy and X11/filesystem calls spend most of their
+    time outside the GIL, so the jobs overlap with the frame loop. There
+    are enough workers for every startup job to run at once, so a keyboard
+    grab sleeping between retries never queues the intro's own jobs
+    """
+    
+    def __init__(self, max_workers: int = 8):
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="prewarm")
+        self.jobs: Dict[str, Future] = {}
+        self.durations_ms: Dict[str, float] = {}
+    
+    def submit(self, name: str, job: Callable, *args) -> Future:
+        """Start a job; its result is collected with result(name)"""
+        def timed():
+            start = time.perf_counter()
+            try:
+                return job(*args)
+            finally:
+                self.durations_ms[name] = (time.perf_counter() - start) * 1000
+        
+        future = self.executor.submit(timed)
+        self.jobs[name] = future
+        return future
+    
+    def pending(self, names: Iterable[str]) -> List[str]:
+        """The named jobs that are still running"""
+        return [name for name in names if not self.jobs[name].done()]
+    
+    def result(self, name: str, timeout_s: Optional[float] = None):
+        """Result of a job, waiting up to timeout_s for it (re-raises its exception)"""
+        return self.jobs[name].result(timeout_s)
+    
+    def shutdown(self):
+        """Stop accepting jobs; running ones finish in the background"""
+        self.executor.shutdown(wait=False)
+    
+    def stats(self) -> dict:
+        """Job durations for the profiler report"""
+        return dict(self.durations_ms)
+
+
+class PrewarmTrack(Track):
+    """
+    Holds the screen for duration_ms while the named prewarm jobs run
+    Frames keep coming for up to grace_ms more while any is still
+    running; then on_ready(late) is called with the names of the jobs
+    that missed the deadline, to be built on the main thread or skipped.
+    Other jobs in the pool never hold up the track
+    """
+    
+    def __init__(self, prewarm: Prewarm, duration_ms: float, names: Iterable[str],
+                 on_ready: Callable[[List[str]], None], grace_ms: float = 50):
+        super().__init__()
+        self.prewarm = prewarm
+        self.hold_ms = duration_ms
+        self.names = list(names)
+        self.on_ready = on_ready
+        self.grace_ms = grace_ms
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        elapsed = now_ms - self.start_ms
+        if elapsed < self.hold_ms:
+            return False
+        late = self.prewarm.pending(self.names)
+        if late and elapsed < self.hold_ms + self.grace_ms:
+            return False
+        if late:
+            print(f"Warning: Still pre-warming after the deadline: {', '.join(late)}")
+        self.on_ready(late)
+        return True
@@ -0,0 +1,238 @@
+"""
+Frame Profiler for Ghost Horror Mode
+Opt-in per-frame timing of the render loop, grouped by scene
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+from typing import Callable, Dict, List, Optional
+
+
+# Frame phases, in the order they happen inside a frame
+PHASES = ['events', 'simulate', 'draw', 'flip', 'sleep']
+
+# Histogram bucket upper edges in milliseconds (last bucket is open-ended)
+BUCKET_EDGES_MS = [1, 2, 4, 8, 12, 16.7, 20, 25, 33.3, 50, 100]
+
+
+class Histogram:
+    """Fixed-bucket millisecond histogram with count/total/max"""
+    
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_EDGES_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def add(self, ms: float):
+        """Record one sample"""
+        index = 0
+        for edge in BUCKET_EDGES_MS:
+            if ms <= edge:
+                break
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+    
+    def to_dict(self) -> dict:
+        """Serialize for the JSON report"""
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms,
+            'bucket_edges_ms': BUCKET_EDGES_MS,
+            'buckets': self.buckets,
+        }
+
+
+class SceneStats:
+    """Timing statistics for one scene"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.phases: Dict[str, Histogram] = {phase: Histogram() for phase in PHASES}
+        self.frame = Histogram()  # Full frame period, sleep included
+        self.work = Histogram()  # Frame period minus sleep
+        self.missed_deadlines = 0
+        self.profile: Optional[cProfile.Profile] = None
+    
+    def to_dict(self) -> dict:
+        """Serialize for the JSON report"""
+        data = {
+            'frames': self.frame.count,
+            'missed_deadlines': self.missed_deadlines,
+            'frame': self.frame.to_dict(),
+            'work': self.work.to_dict(),
+            'phases': {phase: hist.to_dict() for phase, hist in self.phases.items()},
+        }
+        if self.profile is not None:
+            data['top_functions'] = _top_functions(self.profile)
+        return data
+
+
+def _top_functions(profile: cProfile.Profile, limit: int = 25) -> List[str]:
+    """Format the most expensive functions of a cProfile run"""
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats('cumulative').print_stats(limit)
+    return [line for line in stream.getvalue().splitlines() if line.strip()]
+
+
+class FrameProfiler:
+    """
+    Per-frame timing instrumentation
+    Time between two mark() calls is charged to the phase named by the
+    second call; end_frame() closes the frame. All methods are no-ops
+    until enable() is called.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.output_path: Optional[str] = None
+        self.use_cprofile = False
+        self.budget_ms = 1000 / 60
+        self.scenes: Dict[str, SceneStats] = {}
+        self.current: Optional[SceneStats] = None
+        self.stats_sources: Dict[str, Callable[[], dict]] = {}
+        self._frame: Dict[str, float] = {}
+        self._last_mark = 0.0
+        self._frame_start = 0.0
+        self._paused = False
+    
+    def enable(self, output_path: str, use_cprofile: bool = False, fps: int = 60):
+        """Turn on instrumentation, dumping to output_path at exit"""
+        self.enabled = True
+        self.output_path = output_path
+        self.use_cprofile = use_cprofile
+        self.budget_ms = 1000 / fps
+        self._frame = dict.fromkeys(PHASES, 0.0)
+        self._last_mark = self._frame_start = time.perf_counter()
+        self.scene('startup')
+    
+    def scene(self, name: str):
+        """
+        Start charging frames to the named scene
+        Restarts the frame clock so time spent outside the render loop
+        (e.g. while Ekphos runs) is not charged to the next frame
+        """
+        if not self.enabled:
+            return
+        if self.current is not None and self.current.profile is not None:
+            self.current.profile.disable()
+        
+        stats = self.scenes.get(name)
+        if stats is None:
+            stats = SceneStats(name)
+            if self.use_cprofile:
+                stats.profile = cProfile.Profile()
+            self.scenes[name] = stats
+        self.current = stats
+        
+        if stats.profile is not None:
+            stats.profile.enable()
+        
+        for phase in self._frame:
+            self._frame[phase] = 0.0
+        self._last_mark = self._frame_start = time.perf_counter()
+    
+    def pause(self):
+        """
+        Stop recording until resume(), e.g. while frames are rendered
+        off-screen on a virtual clock; does nothing if not enabled
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._paused = True
+        if self.current is not None and self.current.profile is not None:
+            self.current.profile.disable()
+    
+    def resume(self):
+        """Record again after pause(), in the scene that was current"""
+        if not self._paused:
+            return
+        self._paused = False
+        self.enabled = True
+        if self.current is not None and self.current.profile is not None:
+            self.current.profile.enable()
+        for phase in self._frame:
+            self._frame[phase] = 0.0
+        self._last_mark = self._frame_start = time.perf_counter()
+    
+    def mark(self, phase: str):
+        """Charge the time since the previous mark to phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame[phase] += (now - self._last_mark) * 1000
+        self._last_mark = now
+    
+    def end_frame(self):
+        """Close the current frame and record it"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        frame_ms = (now - self._frame_start) * 1000
+        work_ms = frame_ms - self._frame['sleep']
+        
+        stats = self.current
+        for phase, ms in self._frame.items():
+            stats.phases[phase].add(ms)
+            self._frame[phase] = 0.0
+        stats.frame.add(frame_ms)
+        stats.work.add(work_ms)
+        if work_ms > self.budget_ms:
+            stats.missed_deadlines += 1
+        
+        self._last_mark = self._frame_start = now
+    
+    def add_stats(self, name: str, source: Callable[[], dict]):
+        """Include source() (e.g. cache counters) in the report under name"""
+        self.stats_sources[name] = source
+    
+    def report(self) -> dict:
+        """Build the report dictionary"""
+        return {
+            'budget_ms': self.budget_ms,
+            'scenes': {name: stats.to_dict() for name, stats in self.scenes.items()},
+            'stats': {name: source() for name, source in self.stats_sources.items()},
+        }
+    
+    def dump(self):
+        """Write the JSON report (and .pstats files when cProfile is on)"""
+        if not self.enabled:
+            return
+        if self.current is not None and self.current.profile is not None:
+            self.current.profile.disable()
+        
+        try:
+            with open(self.output_path, 'w') as f:
+                json.dump(self.report(), f, indent=2)
+            for name, stats in self.scenes.items():
+                if stats.profile is not None:
+                    stats.profile.dump_stats(f"{self.output_path}.{name}.pstats")
+            print(f"Profile written to {self.output_path}")
+        except OSError as e:
+            print(f"Warning: Failed to write profile: {e}")
+
+
+# Shared instance used by the display and main loop
+profiler = FrameProfiler()
+
+
+def configure_from_env():
+    """
+    Enable the profiler from GHOST_HORROR_PROFILE (output path, or 1 for
+    the default path) and GHOST_HORROR_CPROFILE=1
+    """
+    value = os.environ.get('GHOST_HORROR_PROFILE')
+    if value and value != '0':
+        path = "ghost_horror_profile.json" if value == '1' else value
+        profiler.enable(path, use_cprofile=os.environ.get('GHOST_HORROR_CPROFILE') == '1')
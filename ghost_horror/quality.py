@@ -0,0 +1,103 @@
+"""
+Adaptive Quality for Ghost Horror Mode
+Watches rolling frame work times and steps effect quality down when the
+frame budget is missed, and back up when there is headroom
+"""
+
+from collections import deque
+from typing import Optional
+
+
+# Quality presets, best first
+# glow_layers: outer glow rings around each eye
+# drip_every: every Nth revealed character drips blood (0 = no drips)
+# smooth_scale: smoothscale (filtered) instead of fast nearest-neighbour scaling
+# render_scale: factor on the internal render resolution (applied when the display resumes)
+QUALITY_LEVELS = [
+    {'name': 'high', 'glow_layers': 5, 'drip_every': 2, 'smooth_scale': True, 'render_scale': 1.0},
+    {'name': 'medium', 'glow_layers': 3, 'drip_every': 2, 'smooth_scale': True, 'render_scale': 1.0},
+    {'name': 'low', 'glow_layers': 2, 'drip_every': 4, 'smooth_scale': False, 'render_scale': 0.75},
+    {'name': 'minimal', 'glow_layers': 0, 'drip_every': 0, 'smooth_scale': False, 'render_scale': 0.5},
+]
+
+LEVEL_NAMES = [level['name'] for level in QUALITY_LEVELS]
+
+
+def parse_quality(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a quality setting: 'auto' (or empty) gives None, otherwise a
+    level name or index. Raises ValueError for anything else
+    """
+    if not value or value == 'auto':
+        return None
+    if value in LEVEL_NAMES:
+        return LEVEL_NAMES.index(value)
+    if value.isdigit() and int(value) < len(QUALITY_LEVELS):
+        return int(value)
+    raise ValueError(f"unknown quality '{value}' (expected auto, {', '.join(LEVEL_NAMES)})")
+
+
+class QualityGovernor:
+    """
+    Chooses the quality level from per-frame work time (frame time minus sleep)
+    Steps down as soon as the rolling 90th percentile eats most of the budget;
+    steps up only after a long stretch of headroom, waiting twice as long each
+    time a level proves too slow so it does not oscillate
+    """
+    
+    def __init__(self, level: int = 0, adaptive: bool = True, fps: int = 60,
+                 window: int = 30, upgrade_after: int = 180):
+        self.level = level
+        self.adaptive = adaptive
+        self.budget_ms = 1000 / (fps or 60)
+        self.window = window  # Frames per decision
+        self.upgrade_after = upgrade_after  # Frames of headroom before stepping up
+        self.samples: deque = deque(maxlen=window)
+        self._headroom_frames = 0
+        self._upgrade_wait = [upgrade_after] * len(QUALITY_LEVELS)  # Per level, grows on failure
+    
+    @property
+    def settings(self) -> dict:
+        """Settings of the current level"""
+        return QUALITY_LEVELS[self.level]
+    
+    def set_level(self, level: int, reason: str = ""):
+        """Switch level and log the change"""
+        level = max(0, min(len(QUALITY_LEVELS) - 1, level))
+        if level == self.level:
+            return
+        old = self.settings['name']
+        self.level = level
+        self.reset()
+        suffix = f" ({reason})" if reason else ""
+        print(f"Quality: {old} -> {self.settings['name']}{suffix}")
+    
+    def reset(self):
+        """Forget recent frame times (after a pause or level change)"""
+        self.samples.clear()
+        self._headroom_frames = 0
+    
+    def record(self, work_ms: float):
+        """Feed one frame's work time and adjust the level if needed"""
+        if not self.adaptive:
+            return
+        self.samples.append(work_ms)
+        if len(self.samples) < self.window:
+            return
+        
+        ordered = sorted(self.samples)
+        p90 = ordered[int(len(ordered) * 0.9)]
+        
+        if p90 > self.budget_ms * 0.9:
+            if self.level < len(QUALITY_LEVELS) - 1:
+                # Make the way back up to this level slower
+                self._upgrade_wait[self.level] *= 2
+                self.set_level(self.level + 1, f"p90 work {p90:.1f} ms > {self.budget_ms * 0.9:.1f} ms")
+            return
+        
+        if p90 < self.budget_ms * 0.5 and self.level > 0:
+            self._headroom_frames += 1
+            if self._headroom_frames >= self._upgrade_wait[self.level - 1]:
+                self.set_level(self.level - 1, f"p90 work {p90:.1f} ms, headroom")
+        else:
+            self._headroom_frames = 0
@@ -0,0 +1,146 @@
+"""
+Process Supervisor for Ghost Horror Mode
+Tracks the Ekphos terminal on an asyncio loop, so its exit is an event
+and other work can be scheduled while it runs
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+from typing import Callable, List, Optional
+
+
+# Signals that end Ghost Horror gracefully (Ekphos is terminated first)
+EXIT_SIGNALS = (signal.SIGTERM, signal.SIGHUP)
+
+
+class ProcessSupervisor:
+    """
+    Watches one child process at a time
+    On Linux 5.3+ the process is watched through a pidfd registered with
+    the loop's selector, so nothing wakes up until it exits; elsewhere a
+    thread blocks in wait(). The loop only runs inside wait() and
+    terminate(); timers and jobs added with call_later()/call_soon() run
+    there, alongside the exit event
+    """
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.process: Optional[subprocess.Popen] = None
+        self.exited: Optional[asyncio.Future] = None  # Resolves to the exit code
+        self.exit_handlers: List[Callable[[int], None]] = []
+        self.signalled: Optional[int] = None  # Exit signal received while waiting
+        self._pidfd: Optional[int] = None
+    
+    def watch(self, process: subprocess.Popen) -> asyncio.Future:
+        """Start tracking a process; the returned future resolves when it exits"""
+        self._unwatch()
+        self.process = process
+        self.exited = self.loop.create_future()
+        try:
+            self._pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            # No pidfd (old kernel or not Linux): a thread blocks in wait()
+            threading.Thread(target=self._wait_thread, args=(process, self.exited),
+                             name="ekphos-wait", daemon=True).start()
+        else:
+            self.loop.add_reader(self._pidfd, self._on_pidfd)
+        return self.exited
+    
+    def _on_pidfd(self):
+        """The pidfd became readable: the process has exited, reap it"""
+        self.process.wait()
+        self._unwatch()
+        self._resolve(self.exited, self.process.returncode)
+    
+    def _wait_thread(self, process: subprocess.Popen, exited: asyncio.Future):
+        """Fallback watcher: block until the process exits"""
+        returncode = process.wait()
+        try:
+            self.loop.call_soon_threadsafe(self._resolve, exited, returncode)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    def _resolve(self, exited: asyncio.Future, returncode: int):
+        """Deliver the exit event once"""
+        if exited.done():
+            return
+        exited.set_result(returncode)
+        for handler in list(self.exit_handlers):
+            handler(returncode)
+    
+    def _unwatch(self):
+        """Drop the pidfd of the current process"""
+        if self._pidfd is not None:
+            self.loop.remove_reader(self._pidfd)
+            os.close(self._pidfd)
+            self._pidfd = None
+    
+    def on_exit(self, handler: Callable[[int], None]):
+        """Call handler(returncode) whenever a watched process exits"""
+        self.exit_handlers.append(handler)
+    
+    def call_later(self, delay_s: float, callback: Callable, *args) -> asyncio.TimerHandle:
+        """Run callback after delay_s, once the supervisor is waiting"""
+        return self.loop.call_later(delay_s, callback, *args)
+    
+    def call_soon(self, callback: Callable, *args) -> asyncio.Handle:
+        """Run callback as soon as the supervisor is waiting"""
+        return self.loop.call_soon(callback, *args)
+    
+    def _on_signal(self, signum: int):
+        """Exit signal while waiting: terminate the process, then stop waiting"""
+        self.signalled = signum
+        self.loop.create_task(self._terminate())
+    
+    async def _terminate(self, grace_s: float = 5.0):
+        """SIGTERM, then SIGKILL if the process outlives grace_s"""
+        if self.exited.done():
+            return
+        self.process.terminate()
+        try:
+            await asyncio.wait_for(asyncio.shield(self.exited), grace_s)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.exited
+    
+    def _run(self, awaitable, timeout_s: Optional[float]):
+        """Run the loop until awaitable completes, with exit signals handled"""
+        installed = []
+        if threading.current_thread() is threading.main_thread():
+            for signum in EXIT_SIGNALS:
+                self.loop.add_signal_handler(signum, self._on_signal, signum)
+                installed.append(signum)
+        try:
+            return self.loop.run_until_complete(asyncio.wait_for(awaitable, timeout_s))
+        finally:
+            for signum in installed:
+                self.loop.remove_signal_handler(signum)
+    
+    def wait(self, timeout_s: Optional[float] = None) -> Optional[int]:
+        """
+        Run scheduled work until the process exits
+        Returns the exit code, or None if timeout_s passed first
+        """
+        if self.exited is None:
+            return None
+        try:
+            return self._run(asyncio.shield(self.exited), timeout_s)
+        except asyncio.TimeoutError:
+            return None
+    
+    def terminate(self, grace_s: float = 5.0) -> Optional[int]:
+        """Gracefully stop the process (SIGTERM, SIGKILL after grace_s); returns its exit code"""
+        if self.exited is None:
+            return None
+        if self.process.poll() is not None:
+            self._resolve(self.exited, self.process.returncode)
+        self._run(self._terminate(grace_s), None)
+        return self.exited.result()
+    
+    def close(self):
+        """Stop watching and close the loop"""
+        self._unwatch()
+        self.loop.close()
@@ -0,0 +1,184 @@
+"""
+Procedural Audio for Ghost Horror Mode
+Vectorized NumPy synthesis of the ambient drone, heartbeat and whispers,
+so no audio files ship with the package; results are cached per process
+"""
+
+import time
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+
+# PCM already synthesized by this process, by (recipe, rate, channels, params)
+_memory: Dict[tuple, np.ndarray] = {}
+
+# Synthesis time of each cached sound in ms, for the profiler report
+timings_ms: Dict[str, float] = {}
+
+
+def _times(seconds: float, rate: int) -> np.ndarray:
+    """Sample times of a buffer seconds long (float32: SIMD sin/exp are several times faster)"""
+    return np.arange(int(seconds * rate), dtype=np.float32) / np.float32(rate)
+
+
+def noise(samples: int, rng: np.random.Generator) -> np.ndarray:
+    """White noise in [-1, 1]"""
+    return rng.uniform(-1.0, 1.0, samples)
+
+
+def _band_gain(freqs: np.ndarray, low_hz: float, high_hz: float) -> np.ndarray:
+    """
+    Band-pass gain per frequency
+    The pass band has raised-cosine edges a quarter octave wide, so the
+    result does not ring like a brick-wall cut would
+    """
+    octaves = np.log2(np.maximum(freqs, 1e-3))
+    low, high = np.log2(max(low_hz, 1e-3)), np.log2(high_hz)
+    edge = 0.25
+    gain = np.clip((octaves - (low - edge)) / edge, 0, 1) * np.clip(((high + edge) - octaves) / edge, 0, 1)
+    return 0.5 - 0.5 * np.cos(np.pi * gain)
+
+
+def band(signal: np.ndarray, rate: int, low_hz: float, high_hz: float) -> np.ndarray:
+    """Band-pass filter in the frequency domain"""
+    spectrum = np.fft.rfft(signal)
+    return np.fft.irfft(spectrum * _band_gain(np.fft.rfftfreq(len(signal), 1 / rate), low_hz, high_hz),
+                        len(signal))
+
+
+def band_noise_spectrum(samples: int, rate: int, low_hz: float, high_hz: float,
+                        rng: np.random.Generator) -> np.ndarray:
+    """
+    rfft of band-passed white noise, drawn directly in the frequency domain
+    Only the bins the band reaches are filled, and no forward FFT is needed
+    """
+    spectrum = np.zeros(samples // 2 + 1, dtype=np.complex128)
+    # Bins covered by the band and its quarter-octave edges
+    first = max(1, int(low_hz * 2 ** -0.25 * samples / rate))
+    last = min(len(spectrum), int(high_hz * 2 ** 0.25 * samples / rate) + 2)
+    freqs = np.arange(first, last) * (rate / samples)
+    count = last - first
+    spectrum[first:last] = (rng.standard_normal(count) + 1j * rng.standard_normal(count)) \
+        * _band_gain(freqs, low_hz, high_hz)
+    return spectrum
+
+
+def _rms(spectrum: np.ndarray, samples: int) -> float:
+    """RMS of the signal an rfft spectrum describes (Parseval)"""
+    return float(np.sqrt(2 * np.sum(np.abs(spectrum) ** 2)) / samples)
+
+
+def envelope(samples: int, rate: int, attack_ms: float, release_ms: float,
+             sustain: float = 1.0, decay_ms: float = 0) -> np.ndarray:
+    """Piecewise-linear ADSR envelope filling the whole buffer"""
+    ms = np.arange(samples) * (1000 / rate)
+    total_ms = samples * 1000 / rate
+    points = [0, attack_ms, attack_ms + decay_ms, max(attack_ms + decay_ms, total_ms - release_ms), total_ms]
+    return np.interp(ms, points, [0, 1, sustain, sustain, 0])
+
+
+def smooth_random(samples: int, rate: int, hz: float, rng: np.random.Generator) -> np.ndarray:
+    """Random curve in [0, 1] changing about hz times a second (cosine-interpolated)"""
+    points = max(2, int(samples / rate * hz) + 2)
+    values = rng.uniform(0, 1, points)
+    position = np.arange(samples) * ((points - 1) / samples)
+    index = position.astype(np.int64)
+    frac = 0.5 - 0.5 * np.cos(np.pi * (position - index))
+    return values[index] * (1 - frac) + values[index + 1] * frac
+
+
+def to_pcm(left: np.ndarray, right: np.ndarray, channels: int, volume: float) -> np.ndarray:
+    """Normalize to volume and convert to interleaved signed 16-bit PCM (samples, channels)"""
+    peak = max(np.abs(left).max(), np.abs(right).max(), 1e-9)
+    scale = 32767 * volume / peak
+    pcm = np.zeros((len(left), channels), dtype=np.int16)
+    if channels == 1:
+        pcm[:, 0] = (left + right) * (scale / 2)
+    else:
+        pcm[:, 0] = left * scale
+        pcm[:, 1] = right * scale
+    return pcm
+
+
+def drone(rate: int, seconds: float = 8.0, base_hz: float = 55.0, seed: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Low ambient drone: detuned partials beating against each other over
+    rumbling band-limited noise, swelling slowly
+    Everything is built as one spectrum per channel with the partials on
+    exact FFT bins, so a single inverse FFT renders it and the buffer
+    loops seamlessly
+    """
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * rate)
+    t = _times(seconds, rate)
+    swell = 0.75 + 0.25 * np.sin(np.float32(2 * np.pi / seconds) * t + np.float32(rng.uniform(0, 2 * np.pi)))
+    channels = []
+    for detune in (-0.35, 0.35):
+        tone = np.zeros(samples // 2 + 1, dtype=np.complex128)
+        for ratio, level in ((1, 1.0), (1.5, 0.5), (2, 0.35), (3.01, 0.15)):
+            bin_index = int(round((base_hz + detune) * ratio * seconds))
+            tone[bin_index] += level * samples / 2 * np.exp(1j * rng.uniform(0, 2 * np.pi))
+        rumble = band_noise_spectrum(samples, rate, 40, 320, rng)
+        rumble *= 0.5 * _rms(tone, samples) / max(_rms(rumble, samples), 1e-9)
+        channels.append(np.fft.irfft(tone + rumble, samples) * swell)
+    return channels[0], channels[1]
+
+
+def _thump(t: np.ndarray, rate: int, start_hz: float, end_hz: float, decay_s: float) -> np.ndarray:
+    """Sine whose pitch falls exponentially, with an exponential decay"""
+    hz = end_hz + (start_hz - end_hz) * np.exp(-t / (decay_s / 2))
+    phase = 2 * np.pi * np.cumsum(hz) / rate
+    return np.sin(phase) * np.exp(-t / decay_s)
+
+
+def heartbeat(rate: int, bpm: float = 62.0, seed: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """One "lub-dub" beat, padded to the beat period so it loops at bpm"""
+    rng = np.random.default_rng(seed)
+    beat = np.zeros(int(rate * 60 / bpm))
+    for offset_s, level, start_hz in ((0.0, 1.0, 70.0), (0.28, 0.7, 60.0)):
+        t = _times(0.25, rate)
+        sound = _thump(t, rate, start_hz, 38.0, 0.07)
+        sound += 0.15 * band(noise(len(t), rng), rate, 30, 150) * np.exp(-t / 0.03)
+        start = int(offset_s * rate)
+        end = min(len(beat), start + len(t))
+        beat[start:end] += level * sound[:end - start]
+    return beat, beat.copy()
+
+
+def whisper(rate: int, seconds: float = 2.5, seed: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Breathy whisper: band-passed noise with a formant band, chopped into
+    syllables by a random envelope and drifting across the stereo field
+    """
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * rate)
+    breath = np.fft.irfft(band_noise_spectrum(samples, rate, 1800, 6500, rng)
+                          + 0.6 * band_noise_spectrum(samples, rate, 600, 1200, rng), samples)
+    syllables = smooth_random(samples, rate, 7.0, rng) ** 2
+    voice = breath * syllables * envelope(samples, rate, 300, 600)
+    pan = smooth_random(samples, rate, 0.8, rng)
+    return voice * np.sqrt(1 - pan), voice * np.sqrt(pan)
+
+
+RECIPES: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray]]] = {
+    'drone': drone,
+    'heartbeat': heartbeat,
+    'whisper': whisper,
+}
+
+
+def synthesize(recipe: str, rate: int, channels: int = 2, volume: float = 0.8, **params) -> np.ndarray:
+    """
+    Render a recipe to int16 PCM shaped (samples, channels)
+    Cached by recipe, format and parameters, so each sound is built once
+    """
+    key = (recipe, rate, channels, volume, tuple(sorted(params.items())))
+    pcm = _memory.get(key)
+    if pcm is None:
+        start = time.perf_counter()
+        left, right = RECIPES[recipe](rate, **params)
+        pcm = to_pcm(left, right, channels, volume)
+        _memory[key] = pcm
+        timings_ms[recipe] = (time.perf_counter() - start) * 1000
+    return pcm
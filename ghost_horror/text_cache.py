@@ -0,0 +1,105 @@
+"""
+Text Surface Cache for Ghost Horror Mode
+Shared, memory-bounded LRU cache of rendered text, so text effects
+never rasterize the same string with FreeType twice
+"""
+
+import weakref
+from collections import OrderedDict
+from typing import Dict
+
+import pygame
+
+from .assets import assets
+
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (font, text, color, antialias)
+    Least recently used surfaces are evicted past max_bytes; entries for a
+    font are dropped when the font is garbage collected, and everything is
+    dropped when the display format changes
+    """
+    
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generation = assets.generation
+        self._fonts: Dict[int, weakref.finalize] = {}  # Font id -> finalizer purging its entries
+    
+    def render(self, font: pygame.font.Font, text: str, color: tuple, antialias: bool = True,
+               alpha: int = 255) -> pygame.Surface:
+        """
+        Get text rendered in the display format
+        At full alpha the cached surface itself is returned, shared with every
+        other caller: blit it, don't draw on it. Below that the result is a
+        copy with the alpha applied, so the cached surface is never changed
+        """
+        if self.generation != assets.generation:
+            self.clear()
+            self.generation = assets.generation
+        
+        key = (id(font), text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        else:
+            self.misses += 1
+            surface = assets.convert(font.render(text, antialias, color))
+            self._add(font, key, surface)
+        
+        if alpha < 255:
+            surface = surface.copy()
+            surface.set_alpha(alpha)
+        return surface
+    
+    def _add(self, font: pygame.font.Font, key: tuple, surface: pygame.Surface):
+        """Store a surface and evict least recently used ones over the limit"""
+        if key[0] not in self._fonts:
+            self._fonts[key[0]] = weakref.finalize(font, self._forget_font, key[0])
+        
+        self.surfaces[key] = surface
+        self.bytes_used += self._size(surface)
+        
+        # Always keep the newest surface
+        while self.bytes_used > self.max_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes_used -= self._size(old)
+            self.evictions += 1
+    
+    @staticmethod
+    def _size(surface: pygame.Surface) -> int:
+        """Bytes of pixel data in a surface"""
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+    
+    def _forget_font(self, font_id: int):
+        """Drop every entry of a garbage-collected font (its id may be reused)"""
+        self._fonts.pop(font_id, None)
+        for key in [key for key in self.surfaces if key[0] == font_id]:
+            self.bytes_used -= self._size(self.surfaces.pop(key))
+    
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+        self.bytes_used = 0
+    
+    def stats(self) -> dict:
+        """Hit/miss counters and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.surfaces),
+            'bytes': self.bytes_used,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared cache used by every text effect
+text_cache = TextCache()
@@ -0,0 +1,209 @@
+"""
+Timeline Scheduler for Ghost Horror Mode
+Owns the frame loop: effects are composed as timed tracks, simulated
+at a fixed timestep and drawn together with a single present per frame
+"""
+
+from typing import List, Optional, Tuple
+
+import pygame
+
+from .profiler import profiler
+
+
+class Track:
+    """
+    One timed element of a timeline
+    Subclasses override begin/step/draw/handle_event as needed; a track
+    ends when step() returns True or its duration_ms has elapsed
+    """
+    
+    events: Tuple[int, ...] = ()  # Event types routed to handle_event while active
+    
+    def __init__(self, duration_ms: Optional[float] = None):
+        self.duration_ms = duration_ms
+        self.start_ms: Optional[float] = None
+        self.end_ms: Optional[float] = None
+        self.finished = False
+    
+    def begin(self, timeline: 'Timeline', now_ms: float):
+        """Called once when the track becomes active (before that frame is cleared)"""
+    
+    def step(self, now_ms: float, dt_ms: float) -> bool:
+        """Advance one fixed timestep; return True when finished"""
+        return False
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        """Draw the track's current state"""
+    
+    def handle_event(self, event):
+        """Receive an input event of one of the types in events while active"""
+    
+    def progress(self, now_ms: float) -> float:
+        """Fraction of duration_ms elapsed, up to 1.0 (1.0 at once for a zero-length track)"""
+        if not self.duration_ms or self.duration_ms <= 0:
+            return 1.0
+        return min(1.0, (now_ms - self.start_ms) / self.duration_ms)
+
+
+class HoldTrack(Track):
+    """Keeps the timeline busy for a fixed time without drawing anything"""
+
+
+class FadeToBlackTrack(Track):
+    """Fades whatever was on screen when the track began to black"""
+    
+    def begin(self, timeline: 'Timeline', now_ms: float):
+        display = timeline.display
+        self.display = display
+        self.snapshot = display.screen.copy()
+        self.overlay = pygame.Surface(display.screen.get_size())
+        self.overlay.fill((0, 0, 0))
+        
+        # When regions are tracked only the ones still on screen need fading
+        self.regions = None
+        if display.track_regions and not display._full_redraw:
+            self.regions = list(display._drawn)
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        progress = self.progress(now_ms)
+        self.overlay.set_alpha(int(255 * progress))
+        if self.regions is None:
+            surface.blit(self.snapshot, (0, 0))
+            surface.blit(self.overlay, (0, 0))
+            self.display.invalidate()
+        else:
+            for rect in self.regions:
+                surface.blit(self.snapshot, rect, rect)
+                surface.blit(self.overlay, rect, rect)
+            self.display.mark_dirty(*self.regions)
+
+
+class FadeFromBlackTrack(Track):
+    """Fades a surface in from black, centered on screen"""
+    
+    def __init__(self, target_surface: pygame.Surface, duration_ms: float):
+        super().__init__(duration_ms)
+        self.target_surface = target_surface
+    
+    def begin(self, timeline: 'Timeline', now_ms: float):
+        self.display = timeline.display
+    
+    def draw(self, surface: pygame.Surface, now_ms: float):
+        progress = self.progress(now_ms)
+        self.target_surface.set_alpha(int(255 * progress))
+        
+        # Center the surface
+        x = (surface.get_width() - self.target_surface.get_width()) // 2
+        y = (surface.get_height() - self.target_surface.get_height()) // 2
+        self.display.mark_dirty(surface.blit(self.target_surface, (x, y)))
+
+
+class Timeline:
+    """
+    Fixed-timestep scheduler that owns the frame loop
+    Each frame pumps events once, runs as many simulation steps as the
+    elapsed time calls for (skipping rendering when behind), draws every
+    active track and presents once
+    """
+    
+    def __init__(self, display, step_ms: float = 1000 / 60, max_steps_per_frame: int = 8,
+                 clear: bool = True):
+        self.display = display
+        self.step_ms = step_ms
+        self.max_steps_per_frame = max_steps_per_frame
+        self.clear = clear  # Clear the screen before drawing each frame
+        self.time_ms = 0.0  # Simulated time
+        self.tracks: List[Track] = []
+        self._pending: List[tuple] = []  # (track, at_ms, after, delay_ms, scene)
+    
+    def add(self, track: Track, at_ms: float = 0, after: Optional[Track] = None,
+            delay_ms: float = 0, scene: Optional[str] = None) -> Track:
+        """
+        Schedule a track at an absolute time, or delay_ms after another track ends
+        scene: profiler scene to switch to when the track starts
+        Returns the track so it can be chained with after=
+        """
+        self._pending.append((track, at_ms, after, delay_ms, scene))
+        return track
+    
+    def _activate(self):
+        """Start pending tracks whose start time has come"""
+        for entry in list(self._pending):
+            track, at_ms, after, delay_ms, scene = entry
+            if after is not None:
+                if not after.finished or self.time_ms < after.end_ms + delay_ms:
+                    continue
+            elif self.time_ms < at_ms:
+                continue
+            self._pending.remove(entry)
+            if scene:
+                profiler.scene(scene)
+            track.start_ms = self.time_ms
+            track.begin(self, self.time_ms)
+            for event_type in track.events:
+                self.display.events.subscribe(event_type, track.handle_event)
+            self.tracks.append(track)
+    
+    def _retire(self, track: Track):
+        """Stop routing events to a track that is no longer active"""
+        for event_type in track.events:
+            self.display.events.unsubscribe(event_type, track.handle_event)
+    
+    def _step(self):
+        """Advance simulated time by one fixed step"""
+        self.time_ms += self.step_ms
+        for track in self.tracks:
+            if track.finished:
+                continue
+            done = track.step(self.time_ms, self.step_ms)
+            if track.duration_ms is not None and self.time_ms - track.start_ms >= track.duration_ms:
+                done = True
+            if done:
+                track.finished = True
+                track.end_ms = self.time_ms
+                self._retire(track)
+        self.tracks = [track for track in self.tracks if not track.finished]
+        self._activate()
+    
+    def is_done(self) -> bool:
+        """True when no track is active or waiting"""
+        return not self.tracks and not self._pending
+    
+    def run(self):
+        """Run until every track has finished or the display stops running"""
+        display = self.display
+        clock = display.clock
+        self._activate()
+        accumulator = 0.0
+        last = clock.now_ms()
+        
+        while not self.is_done() and display.running:
+            # Input, once per frame; the dispatcher routes it to subscribed tracks
+            display.pump_events()
+            profiler.mark('events')
+            
+            # Fixed-timestep simulation; a slow frame runs several steps instead of stretching time
+            now = clock.now_ms()
+            accumulator += now - last
+            last = now
+            steps = 0
+            while accumulator >= self.step_ms - 1e-6 and steps < self.max_steps_per_frame:
+                self._step()
+                accumulator -= self.step_ms
+                steps += 1
+            if steps == self.max_steps_per_frame:
+                accumulator = min(accumulator, self.step_ms)  # Give up on a stall instead of spiraling
+            profiler.mark('simulate')
+            
+            # Draw every active track, then present once
+            if self.clear:
+                display.clear()
+            for track in self.tracks:
+                track.draw(display.screen, self.time_ms)
+            display.present()
+            profiler.end_frame()
+        
+        # Stopped early: tracks still active no longer receive input
+        for track in self.tracks:
+            self._retire(track)
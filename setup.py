@@ -8,6 +8,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "pygame>=2.5.0",
+        "numpy>=1.21",
         "python-xlib>=0.33",
     ],
     entry_points={
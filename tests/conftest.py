@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the Ghost Horror tests
+Everything runs headless: SDL's dummy video and audio drivers, and a
+private cache directory so no user cache is read or written
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ['GHOST_HORROR_SOUND'] = '0'
+
+import pygame  # noqa: E402
+
+from ghost_horror.display import Display  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """A fresh XDG cache directory per test"""
+    path = tmp_path / "cache"
+    monkeypatch.setenv('XDG_CACHE_HOME', str(path))
+    return path
+
+
+@pytest.fixture
+def display():
+    """A small headless display, closed after the test"""
+    display = Display(size=(160, 120), video_driver='dummy', fps=0, quality='high')
+    yield display
+    if pygame.display.get_init():
+        display.close()
@@ -0,0 +1,34 @@
+"""
+Sound Manager Tests
+The mixer is only ever opened by init(), never by the prewarm job
+"""
+
+import threading
+
+import pygame
+
+from ghost_horror.audio import INTRO_SOUNDS, SoundManager
+
+
+def test_sound_manager_still_importable_from_display():
+    from ghost_horror.display import SoundManager as moved
+    assert moved is SoundManager
+
+
+def test_prepare_intro_does_not_open_the_mixer():
+    sound = SoundManager(enabled=True)
+    sound.prepare_intro()
+    assert pygame.mixer.get_init() is None
+    assert sound.sounds == {}
+
+
+def test_prepare_intro_on_a_thread_after_init():
+    sound = SoundManager(enabled=True)
+    try:
+        assert sound.init()
+        worker = threading.Thread(target=sound.prepare_intro)
+        worker.start()
+        worker.join()
+        assert sorted(sound.sounds) == sorted(INTRO_SOUNDS)
+    finally:
+        sound.close()
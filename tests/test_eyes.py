@@ -0,0 +1,39 @@
+"""
+Glowing Eyes Quality Tests
+Glow level changes wait for the next start() and do not leak sprites
+"""
+
+from ghost_horror.assets import assets
+from ghost_horror.effects import GlowingEyes
+
+
+def eye_assets():
+    """Names of the registered eye sprites"""
+    return sorted(name for name in assets.assets if name.startswith('eye/'))
+
+
+def test_glow_level_change_waits_for_the_next_start(display):
+    eyes = GlowingEyes(display)
+    eyes.start(0)
+    eyes.update(500)
+    first = eyes.eye_asset
+    
+    display.quality.set_level(2)
+    eyes.draw(display.screen)
+    assert eyes.eye_asset is first
+    
+    eyes.start(3000)
+    assert eyes.eye_asset is not first
+    assert eyes.glow_layers == display.quality.settings['glow_layers']
+
+
+def test_rebuilding_releases_the_previous_sprite(display):
+    eyes = GlowingEyes(display)
+    for level in (1, 2, 3, 0):
+        display.quality.set_level(level)
+        eyes.start(0)
+    assert eye_assets() == [eyes.eye_asset.name]
+    assert eyes.eye_asset.refs == 1
+    
+    del eyes
+    assert eye_assets() == []
@@ -0,0 +1,26 @@
+"""Tests for zero-length fades"""
+
+import pygame
+
+from ghost_horror.effects import MessageDisplay
+
+
+def test_fade_to_black_zero(display):
+    display.screen.fill((255, 255, 255))
+    display.fade_to_black(0)
+    assert display.screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+
+def test_fade_from_black_zero(display):
+    target = pygame.Surface((20, 20))
+    target.fill((255, 0, 0))
+    display.fade_from_black(target, 0)
+
+
+def test_message_zero_fades(display):
+    message = MessageDisplay(display, "x")
+    message.update(0, 100, 0, 0)
+    assert message.alpha == 255
+    message.update(100, 100, 0, 0)
+    assert message.alpha == 0
+    message.show(duration_ms=50, fade_in_ms=0, fade_out_ms=0)
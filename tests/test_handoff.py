@@ -0,0 +1,213 @@
+"""Tests for the terminal handoff's window matching"""
+
+import os
+import signal
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('Xlib')
+from Xlib import X  # noqa: E402
+
+from ghost_horror.handoff import Handoff, HandoffTrack, WindowMapWatcher  # noqa: E402
+
+
+class FakeWindow:
+    """Just enough of an Xlib window for the watcher"""
+    
+    def __init__(self, pid=None, wm_class=None, machine='host', children=()):
+        self.pid = pid
+        self.wm_class = wm_class
+        self.machine = machine
+        self.children = list(children)
+    
+    def get_wm_class(self):
+        return self.wm_class
+    
+    def get_wm_client_machine(self):
+        return self.machine
+    
+    def get_full_property(self, atom, property_type):
+        return SimpleNamespace(value=[self.pid]) if self.pid else None
+    
+    def query_tree(self):
+        return SimpleNamespace(children=self.children)
+
+
+class FakeXDisplay:
+    """An X connection with a queue of events"""
+    
+    def __init__(self, events=()):
+        self.events = list(events)
+    
+    def pending_events(self):
+        return len(self.events)
+    
+    def next_event(self):
+        return self.events.pop(0)
+
+
+def mapped(window, override=False):
+    return SimpleNamespace(type=X.MapNotify, window=window, override=override)
+
+
+def make_watcher(*events) -> WindowMapWatcher:
+    watcher = WindowMapWatcher.__new__(WindowMapWatcher)
+    watcher._X = X
+    watcher.x_display = FakeXDisplay(events)
+    watcher.pid_atom = 1
+    watcher.hostname = 'host'
+    watcher.pid = os.getpid()
+    watcher.wm_class = 'xterm'
+    return watcher
+
+
+def test_matches_pid_in_process_tree():
+    assert make_watcher(mapped(FakeWindow(pid=os.getpid()))).poll() is not None
+
+
+def test_matches_pid_on_frame_child():
+    frame = FakeWindow(children=[FakeWindow(pid=os.getpid())])
+    assert make_watcher(mapped(frame)).poll() is not None
+
+
+def test_ignores_foreign_pid():
+    assert make_watcher(mapped(FakeWindow(pid=1))).poll() is None
+
+
+def test_ignores_override_redirect():
+    assert make_watcher(mapped(FakeWindow(pid=os.getpid()), override=True)).poll() is None
+
+
+def test_matches_terminal_class_without_pid():
+    assert make_watcher(mapped(FakeWindow(wm_class=('xterm', 'XTerm')))).poll() is not None
+
+
+def test_matches_terminal_class_from_server_process():
+    assert make_watcher(mapped(FakeWindow(pid=1, wm_class=('xterm', 'XTerm')))).poll() is not None
+
+
+def test_ignores_terminal_class_from_other_host():
+    assert make_watcher(mapped(FakeWindow(wm_class=('xterm', 'XTerm'), machine='other'))).poll() is None
+
+
+def test_never_accepts_unknown_window():
+    watcher = make_watcher(mapped(FakeWindow(wm_class=('firefox', 'Firefox'))), mapped(FakeWindow()))
+    assert watcher.poll() is None
+    time.sleep(0.4)
+    assert watcher.poll() is None
+
+
+def make_handoff(returncode):
+    process = SimpleNamespace(poll=lambda: returncode)
+    handoff = Handoff(SimpleNamespace(process=process))
+    handoff.watcher = make_watcher()
+    handoff.spawned_at = time.perf_counter()
+    return handoff
+
+
+def test_clean_client_exit_keeps_waiting():
+    handoff = make_handoff(0)
+    assert not handoff.poll()
+    assert handoff.mapped_at is None
+
+
+def test_failed_terminal_stops_waiting():
+    assert make_handoff(1).poll()
+
+
+def test_track_records_map_time():
+    handoff = make_handoff(None)
+    track = HandoffTrack(handoff)
+    assert not track.step(0, 16)
+    before = time.perf_counter()
+    handoff.watcher.x_display.events.append(mapped(FakeWindow(pid=os.getpid())))
+    assert track.step(16, 16)
+    assert handoff.mapped_at >= before
+
+
+# Against a real X server (Xvfb will do) with ghost_horror.fake_terminal
+
+@pytest.fixture
+def x_display():
+    from Xlib.display import Display as XDisplay
+    try:
+        x_display = XDisplay()
+    except Exception:
+        pytest.skip("no X server")
+    yield x_display
+    x_display.close()
+
+
+def run_handoff(*options):
+    from ghost_horror.ekphos_launcher import EkphosLauncher
+    
+    launcher = EkphosLauncher()
+    launcher.terminal_cmd = [sys.executable, "-m", "ghost_horror.fake_terminal", "--map-delay", "100",
+                             *options, "--"]
+    handoff = Handoff(launcher, timeout_ms=3000, wm_class='fake-terminal')
+    try:
+        assert handoff.start()
+        assert handoff.watcher is not None
+        while not handoff.poll():
+            time.sleep(0.005)
+        return handoff
+    finally:
+        launcher.terminate()
+        launcher.close()
+        if handoff.watcher is not None:
+            handoff.watcher.close()
+
+
+def kill_window_owner(x_display, name='fake-terminal'):
+    """Stop a detached fake terminal through the PID on its window"""
+    atom = x_display.intern_atom('_NET_WM_PID')
+    for window in x_display.screen().root.query_tree().children:
+        wm_class = window.get_wm_class()
+        prop = window.get_full_property(atom, X.AnyPropertyType)
+        if wm_class and wm_class[0] == name and prop is not None:
+            try:
+                os.kill(int(prop.value[0]), signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+@pytest.mark.parametrize('options', [(), ('--no-pid',)])
+def test_fake_terminal_handoff(x_display, options):
+    handoff = run_handoff(*options)
+    assert handoff.mapped_at is not None
+    assert handoff.mapped_at - handoff.spawned_at >= 0.1
+
+
+def test_fake_terminal_server_handoff(x_display):
+    try:
+        handoff = run_handoff('--server')
+    finally:
+        kill_window_owner(x_display)
+    assert handoff.mapped_at is not None
+
+
+def test_unrelated_window_is_not_taken_for_the_terminal(x_display):
+    from ghost_horror.ekphos_launcher import EkphosLauncher
+    
+    screen = x_display.screen()
+    other = screen.root.create_window(0, 0, 10, 10, 0, screen.root_depth)
+    other.set_wm_class("other", "Other")
+    launcher = EkphosLauncher()
+    launcher.terminal_cmd = [sys.executable, "-m", "ghost_horror.fake_terminal", "--map-delay", "500", "--"]
+    handoff = Handoff(launcher, timeout_ms=3000, wm_class='fake-terminal')
+    try:
+        assert handoff.start()
+        other.map()
+        x_display.flush()
+        start = time.perf_counter()
+        while not handoff.poll():
+            time.sleep(0.005)
+        assert time.perf_counter() - start >= 0.4  # Held out for the terminal's own window
+    finally:
+        launcher.terminate()
+        launcher.close()
+        other.destroy()
+        x_display.flush()
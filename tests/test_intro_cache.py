@@ -0,0 +1,69 @@
+"""Tests for the pre-rendered intro cache"""
+
+import hashlib
+
+import pygame
+
+from ghost_horror import intro_cache
+from ghost_horror.clock import VirtualClock
+from ghost_horror.main import run_intro_sequence
+
+
+def test_record_while_suspended_leaves_the_window_alone(display, tmp_path, monkeypatch):
+    """Recording with the window hidden must not ask SDL for the window surface"""
+    display.suspend()
+    
+    def no_window_surface():
+        raise AssertionError("pygame.display.get_surface() called while the window is hidden")
+    
+    monkeypatch.setattr(pygame.display, 'get_surface', no_window_surface)
+    assert intro_cache.record_intro(display, run_intro_sequence, str(tmp_path / "intro.ghic"))
+    monkeypatch.undo()
+    
+    display.resume()
+    display.clear()
+    display.update()
+    assert display.screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+
+def frame_digest(surface: pygame.Surface) -> str:
+    """Hash of a frame's pixels"""
+    return hashlib.sha1(pygame.image.tobytes(surface, 'RGB')).hexdigest()
+
+
+def test_cache_plays_back_the_recorded_frames(display, tmp_path):
+    """Every frame decoded by IntroPlayer is byte-identical to the one recorded"""
+    path = str(tmp_path / "intro.ghic")
+    recorded = []
+    
+    def run_intro(display):
+        capture = display.present  # record_intro's frame writer
+        
+        def present():
+            recorded.append(frame_digest(display.screen))
+            capture()
+        
+        display.present = present
+        run_intro_sequence(display)
+    
+    assert intro_cache.record_intro(display, run_intro, path)
+    assert recorded
+    
+    played = []
+    
+    def present():
+        played.append(frame_digest(display.screen))
+        display.clock.tick()
+    
+    display.clock = VirtualClock(intro_cache.FPS)
+    display.present = present
+    display.clear()
+    player = intro_cache.IntroPlayer(path)
+    try:
+        assert len(player.frames) == len(recorded)
+        assert player.play(display)
+    finally:
+        player.close()
+        del display.present
+    
+    assert played == recorded
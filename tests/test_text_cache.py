@@ -0,0 +1,21 @@
+"""
+Text Cache Tests
+Faded text never changes the surface other callers share
+"""
+
+import pygame
+
+from ghost_horror.text_cache import TextCache
+
+
+def test_faded_render_leaves_the_shared_surface_opaque(display):
+    cache = TextCache()
+    font = pygame.font.Font(None, 24)
+    shared = cache.render(font, "light", (255, 255, 255))
+    
+    faded = cache.render(font, "light", (255, 255, 255), alpha=64)
+    assert faded is not shared
+    assert faded.get_alpha() == 64
+    assert shared.get_alpha() in (None, 255)
+    assert cache.render(font, "light", (255, 255, 255)) is shared
+    assert cache.stats()['entries'] == 1